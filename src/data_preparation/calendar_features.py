@@ -0,0 +1,235 @@
+"""
+This module contains util functions for building calendar features (integer codes,
+one-hot indicators and Fourier terms), computed once per unique date and broadcast to all the series
+"""
+# Import Standard Libraries
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+from src.data_preparation.data_preparation_utils import attach_features
+
+# Setup logger
+logger = get_logger(os.path.basename(__file__).split('.')[0],
+                    Path(__file__).parents[1] /
+                    'logging_module' /
+                    'log_configuration.yaml')
+
+# Define the calendar features with their integer codes extractor and categories
+CALENDAR_FEATURES = {
+    'day_of_week': (lambda dates: dates.dayofweek, range(7)),
+    'day_of_month': (lambda dates: dates.day, range(1, 32)),
+    'day_of_year': (lambda dates: dates.dayofyear, range(1, 367)),
+    'week': (lambda dates: dates.isocalendar().week.to_numpy(), range(1, 54)),
+    'month': (lambda dates: dates.month, range(1, 13)),
+    'quarter': (lambda dates: dates.quarter, range(1, 5)),
+    'year': (lambda dates: dates.year, None),
+    'is_month_start': (lambda dates: dates.is_month_start, range(2)),
+    'is_month_end': (lambda dates: dates.is_month_end, range(2))
+}
+
+# Define the calendar periods of the Fourier terms with their Pandas period alias
+# (the same convention of statsmodels CalendarFourier)
+CALENDAR_PERIODS = {
+    'W': 'W',
+    'ME': 'M',
+    'QE': 'Q',
+    'YE': 'Y'
+}
+
+
+def compute_calendar_codes(dates: pd.DatetimeIndex,
+                           features: List[str]) -> np.ndarray:
+    """
+    Compute the integer codes of the calendar features
+
+    Args:
+        dates: Pandas DatetimeIndex of unique dates
+        features: List of calendar features (accepted values: CALENDAR_FEATURES keys)
+
+    Returns:
+        codes: NumPy array of shape (dates, features) of integer codes
+    """
+    # Initialise the codes
+    codes = np.empty((len(dates), len(features)), dtype=np.int32)
+
+    for i, feature in enumerate(features):
+
+        # Check the feature
+        if feature not in CALENDAR_FEATURES:
+
+            raise ValueError(f'compute_calendar_codes - Unrecognised calendar feature {feature}')
+
+        codes[:, i] = np.asarray(CALENDAR_FEATURES[feature][0](dates), dtype=np.int32)
+
+    return codes
+
+
+def compute_one_hot_indicators(dates: pd.DatetimeIndex,
+                               feature: str) -> Tuple[np.ndarray, List[str]]:
+    """
+    Compute the one-hot indicators of a calendar feature over all its categories,
+    so that train and forecast dates always share the same columns
+
+    Args:
+        dates: Pandas DatetimeIndex of unique dates
+        feature: String calendar feature (accepted values: CALENDAR_FEATURES keys with categories)
+
+    Returns:
+        indicators: NumPy array of shape (dates, categories) of float32 indicators
+        names: List of indicator names (named '<feature>_<category>')
+    """
+    # Retrieve the categories
+    categories = CALENDAR_FEATURES.get(feature, (None, None))[1]
+
+    if categories is None:
+
+        raise ValueError(f'compute_one_hot_indicators - Calendar feature {feature} cannot be one-hot encoded')
+
+    # Compare the codes with the categories
+    codes = compute_calendar_codes(dates, [feature])
+    indicators = (codes == np.asarray(categories, dtype=np.int32)).astype(np.float32)
+
+    return indicators, [f'{feature}_{category}' for category in categories]
+
+
+def compute_fourier_terms(dates: pd.DatetimeIndex,
+                          period: Union[str, float],
+                          order: int,
+                          dtype: np.dtype = np.float32) -> Tuple[np.ndarray, List[str]]:
+    """
+    Compute the Fourier sine and cosine pairs of the period up to the order
+
+    Args:
+        dates: Pandas DatetimeIndex of unique dates
+        period: String calendar period (accepted values: CALENDAR_PERIODS keys)
+                or float period in days (measured from the Unix epoch)
+        order: Integer number of sine and cosine pairs
+        dtype: NumPy float dtype of the terms
+
+    Returns:
+        terms: NumPy array of shape (dates, 2 * order) of terms ordered as sin(1), cos(1), sin(2), ...
+        names: List of term names (named 'sin(<k>,<period>)' and 'cos(<k>,<period>)')
+    """
+    # Check the order
+    if order < 1:
+
+        raise ValueError('compute_fourier_terms - Order must be a positive integer')
+
+    # Compute the elapsed fraction of the period
+    if isinstance(period, str):
+
+        if period not in CALENDAR_PERIODS:
+
+            raise ValueError(f'compute_fourier_terms - Unrecognised calendar period {period}')
+
+        periods = dates.to_period(CALENDAR_PERIODS[period])
+        period_starts = periods.start_time
+        fraction = np.asarray((dates - period_starts) / ((periods + 1).start_time - period_starts), dtype=np.float64)
+
+    else:
+
+        elapsed_days = (dates - pd.Timestamp(0)) / pd.Timedelta(days=1)
+        fraction = np.mod(np.asarray(elapsed_days, dtype=np.float64), period) / period
+
+    # Compute all the harmonics at once
+    angles = 2 * np.pi * fraction[:, np.newaxis] * np.arange(1, order + 1)
+    terms = np.empty((len(dates), 2 * order), dtype=dtype)
+    terms[:, 0::2] = np.sin(angles)
+    terms[:, 1::2] = np.cos(angles)
+
+    return terms, [f'{function}({k},{period})' for k in range(1, order + 1) for function in ['sin', 'cos']]
+
+
+def build_calendar_features(dates: pd.DatetimeIndex,
+                            codes: List[str] = (),
+                            one_hot: List[str] = (),
+                            fourier: Dict[Union[str, float], int] = None) -> pd.DataFrame:
+    """
+    Build the calendar features of the dates as a single float32 block
+
+    Args:
+        dates: Pandas DatetimeIndex of unique dates
+        codes: List of calendar features to add as integer codes
+        one_hot: List of calendar features to add as one-hot indicators
+        fourier: Dictionary of periods (calendar string or days) and Fourier orders (e.g. {'YE': 10, 7: 3})
+
+    Returns:
+        calendar_features: Pandas DataFrame of float32 calendar features indexed by the dates
+    """
+    logger.info('build_calendar_features - Start')
+
+    logger.info('build_calendar_features - Dates: %s | codes: %s | one_hot: %s | fourier: %s',
+                len(dates), list(codes), list(one_hot), fourier)
+
+    # Compute the integer codes
+    blocks = [compute_calendar_codes(dates, list(codes)).astype(np.float32)]
+    names = list(codes)
+
+    # Compute the one-hot indicators
+    for feature in one_hot:
+        indicators, indicator_names = compute_one_hot_indicators(dates, feature)
+        blocks.append(indicators)
+        names.extend(indicator_names)
+
+    # Compute the Fourier terms
+    for period, order in (fourier or {}).items():
+        terms, term_names = compute_fourier_terms(dates, period, order)
+        blocks.append(terms)
+        names.extend(term_names)
+
+    # Build a single block
+    calendar_features = pd.DataFrame(np.hstack(blocks), index=dates, columns=names, copy=False)
+
+    logger.info('build_calendar_features - End')
+
+    return calendar_features
+
+
+def add_calendar_features(data: pd.DataFrame,
+                          date_column: str,
+                          codes: List[str] = (),
+                          one_hot: List[str] = (),
+                          fourier: Dict[Union[str, float], int] = None,
+                          inplace: bool = True) -> pd.DataFrame:
+    """
+    Add the calendar features to the data in long format, computing them once per unique date
+    and broadcasting them to all the rows (e.g. all the series of the panel)
+
+    Args:
+        data: Pandas DataFrame to add the calendar features to
+        date_column: String date column name
+        codes: List of calendar features to add as integer codes
+        one_hot: List of calendar features to add as one-hot indicators
+        fourier: Dictionary of periods (calendar string or days) and Fourier orders (e.g. {'YE': 10, 7: 3})
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the float32 calendar features added (NaN for the missing dates),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_calendar_features - Start')
+
+    # Retrieve the unique dates
+    date_codes, unique_dates = pd.factorize(data[date_column])
+
+    logger.info('add_calendar_features - Rows: %s | Unique dates: %s', len(data), len(unique_dates))
+
+    # Compute the features once per unique date
+    calendar_features = build_calendar_features(pd.DatetimeIndex(unique_dates), codes, one_hot, fourier)
+
+    # Broadcast the features to all the rows (NaN for the missing dates, whose code is -1)
+    feature_values = calendar_features.to_numpy()[date_codes]
+    feature_values[date_codes < 0] = np.nan
+    feature_data = pd.DataFrame(feature_values,
+                                index=data.index,
+                                columns=calendar_features.columns,
+                                copy=False)
+
+    logger.info('add_calendar_features - End')
+
+    return attach_features(data, feature_data, inplace)
@@ -4,12 +4,14 @@ This module contains utils function for preparing the data for the EDA or model
 # Import Standard Libraries
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Tuple, Union
 import pandas as pd
 import numpy as np
 
 # Import Package Modules
 from src.logging_module.logging_module import get_logger
+from src.data_preparation.frequency_aggregation import FrequencyAggregator
+from src.exploratory_data_analysis.autocorrelation import propose_lags, select_panel_lags
 
 # Setup logger
 logger = get_logger(os.path.basename(__file__).split('.')[0],
@@ -17,6 +19,36 @@ logger = get_logger(os.path.basename(__file__).split('.')[0],
                     'logging_module' /
                     'log_configuration.yaml')
 
+# Define the accepted rolling and expanding statistics
+WINDOW_STATISTICS = ['mean', 'std', 'min', 'max', 'sum']
+
+
+def attach_features(data: pd.DataFrame,
+                    features: pd.DataFrame,
+                    inplace: bool = True) -> pd.DataFrame:
+    """
+    Apply the 'inplace' contract of the feature functions: either add the feature columns
+    to the data (replacing the existing ones) and return the same object, or return only
+    the feature columns without modifying nor copying the data. Adding many columns in place
+    fragments the data, hence prefer 'inplace' False and a single concatenation for large blocks
+
+    Args:
+        data: Pandas DataFrame to add the features to
+        features: Pandas DataFrame of feature columns with the same index of the data
+        inplace: Boolean indicating whether to add the features to the data
+
+    Returns:
+        data: Pandas DataFrame with the features added if 'inplace', otherwise the features only
+    """
+    # Return the features only
+    if not inplace:
+        return features
+
+    # Add the feature columns to the data, without copying the existing columns
+    data[features.columns] = features
+
+    return data
+
 
 def group_avg_column_by_frequency(data: pd.DataFrame,
                                   key: str,
@@ -25,6 +57,7 @@ def group_avg_column_by_frequency(data: pd.DataFrame,
                                   precision: int = 2) -> pd.DataFrame:
     """
     Group a DataFrame by the key with a frequency and compute the avg over the column
+    (through FrequencyAggregator, which computes many statistics of many columns and groups)
 
     Args:
         data: Pandas DataFrame to group by
@@ -42,14 +75,11 @@ def group_avg_column_by_frequency(data: pd.DataFrame,
     logger.info('group_avg_column_by_frequency - key: %s | frequency: %s | column: %s',
                 key, frequency, column)
 
-    # Define the grouper
-    grouper = pd.Grouper(key=key, freq=frequency)
-
-    # Group and compute average
-    grouped_data = data.groupby(grouper)[column].mean().reset_index()
+    # Group, compute and round the average
+    grouped_data = FrequencyAggregator(data, key, frequency).aggregate(column, ['mean'], precision=precision)
 
-    # Round grouped data
-    grouped_data[column] = grouped_data[column].round(precision)
+    # Restore the column name
+    grouped_data = grouped_data.rename(columns={f'{column}_mean': column})
 
     logger.info('group_avg_column_by_frequency - End')
 
@@ -57,16 +87,18 @@ def group_avg_column_by_frequency(data: pd.DataFrame,
 
 
 def add_dummy_time_step(data: pd.DataFrame,
-                        column_name: str = 'time_step') -> pd.DataFrame:
+                        column_name: str = 'time_step',
+                        inplace: bool = True) -> pd.DataFrame:
     """
     Add a dummy time-step feature called 'column_name' into the data
 
     Args:
         data: Pandas DataFrame to add the feature to
         column_name: String column name
+        inplace: Boolean indicating whether to add the feature to the data or to return it only
 
     Returns:
-        data: Pandas DataFrame with the added time-step column
+        data: Pandas DataFrame with the added time-step column (the time-step column only if not 'inplace')
     """
 
     logger.info('add_dummy_time_step - Start')
@@ -76,17 +108,16 @@ def add_dummy_time_step(data: pd.DataFrame,
     # Compute the time-step
     time_step = np.arange(len(data))
 
-    # Add the time-step to the data
-    data[column_name] = time_step
-
     logger.info('add_dummy_time_step - End')
 
-    return data
+    # Add the time-step to the data
+    return attach_features(data, pd.DataFrame({column_name: time_step}, index=data.index), inplace)
 
 
 def add_lag_feature(data: pd.DataFrame,
                     column: str,
-                    lag: int) -> pd.DataFrame:
+                    lag: int,
+                    inplace: bool = True) -> pd.DataFrame:
     """
     Add a lag feature to the data
 
@@ -94,9 +125,10 @@ def add_lag_feature(data: pd.DataFrame,
         data: Pandas DataFrame to add lag to
         column: String column name to compute lag with
         lag: Integer lag value
+        inplace: Boolean indicating whether to add the feature to the data or to return it only
 
     Returns:
-        data: Pandas DataFrame with the lag feature added
+        data: Pandas DataFrame with the lag feature added (the lag feature only if not 'inplace')
     """
     logger.info('add_lag_feature - Start')
 
@@ -106,17 +138,579 @@ def add_lag_feature(data: pd.DataFrame,
     # Compute lag feature
     lag_feature = data.loc[:, column].shift(lag)
 
+    logger.info('add_lag_feature - End')
+
     # Add lag feature to the data
-    data[column + '_lag_' + str(lag)] = lag_feature
+    return attach_features(data, lag_feature.to_frame(column + '_lag_' + str(lag)), inplace)
 
-    logger.info('add_lag_feature - End')
 
-    return data
+def add_lag_features(data: pd.DataFrame,
+                     columns: Union[str, List[str]],
+                     lags: Union[int, List[int]],
+                     inplace: bool = True) -> pd.DataFrame:
+    """
+    Add all the lag features of the columns to the data at once, building them as a single
+    NumPy block from a strided view over the NaN-padded columns
+
+    Args:
+        data: Pandas DataFrame to add lags to
+        columns: String column name or list of column names to compute lags with
+        lags: Integer lag value or list of positive integer lag values
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the lag features added (named '<column>_lag_<lag>'),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_lag_features - Start')
+
+    # Normalise columns and lags
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    lags = np.atleast_1d(np.asarray(lags, dtype=np.int64))
+
+    logger.info('add_lag_features - columns: %s | lags: %s', columns, lags.tolist())
+
+    # Check lags
+    if lags.size == 0 or lags.min() < 1:
+
+        raise ValueError('add_lag_features - Lags must be positive integers')
+
+    # Pad the columns with the maximum lag of missing values on top
+    max_lag = int(lags.max())
+    dtype = np.result_type(*data[columns].dtypes, np.float32)
+    padded_values = np.full((len(columns), len(data) + max_lag), np.nan, dtype=dtype)
+    padded_values[:, max_lag:] = data[columns].to_numpy(dtype=dtype).T
+
+    # Build the column-major lags block from the strided windows of shape (columns, max_lag + 1, rows)
+    windows = np.lib.stride_tricks.sliding_window_view(padded_values, len(data), axis=1)
+    lag_values = windows[:, max_lag - lags, :].reshape(len(columns) * lags.size, len(data)).T
+
+    logger.info('add_lag_features - Built %s lag features', lag_values.shape[1])
+
+    # Build the lag features as a single block
+    lag_data = pd.DataFrame(lag_values,
+                            index=data.index,
+                            columns=[f'{column}_lag_{lag}' for column in columns for lag in lags],
+                            copy=False)
+
+    logger.info('add_lag_features - End')
+
+    return attach_features(data, lag_data, inplace)
+
+
+def _sort_by_groups(data: pd.DataFrame,
+                    group_columns: Union[str, List[str]],
+                    sort_column: str = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort the rows so that each group is contiguous (and ordered by the sort column),
+    returning the group rank and the position within the group of each sorted row
+
+    Args:
+        data: Pandas DataFrame with the group columns
+        group_columns: String column name or list of column names identifying the series (e.g. ['store_nbr', 'family'])
+        sort_column: String column name to sort the rows of each group by (e.g. 'date'), None to keep the row order
+
+    Returns:
+        order: NumPy array of the row positions in sorted order
+        group_rank: NumPy array of the group rank of each sorted row
+        group_position: NumPy array of the position within the group of each sorted row
+    """
+    # Retrieve the group codes
+    group_codes = data.groupby(group_columns, sort=False, observed=True, dropna=False).ngroup().to_numpy()
+
+    # Sort by group and optionally by the sort column through a single integer key
+    sort_key = group_codes
+
+    if sort_column is not None:
+        sort_codes, sort_uniques = pd.factorize(data[sort_column], sort=True, use_na_sentinel=False)
+        sort_key = group_codes.astype(np.int64) * len(sort_uniques) + sort_codes
+
+    order = np.argsort(sort_key, kind='stable')
+
+    # Retrieve the group starts in sorted order
+    sorted_codes = group_codes[order]
+    is_start = np.empty(len(order), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+
+    # Compute the group rank and the position within the group
+    row_positions = np.arange(len(order))
+    group_rank = np.cumsum(is_start) - 1
+    group_position = row_positions - np.maximum.accumulate(np.where(is_start, row_positions, 0))
+
+    return order, group_rank, group_position
+
+
+def _get_sorted_values(data: pd.DataFrame,
+                       columns: List[str],
+                       order: np.ndarray) -> np.ndarray:
+    """
+    Retrieve the float values of the columns in group-sorted order, one contiguous row per column
+
+    Args:
+        data: Pandas DataFrame with the columns
+        columns: List of column names
+        order: NumPy array of the row positions in sorted order
+
+    Returns:
+        values: NumPy array of shape (columns, rows)
+    """
+    return np.take(data[columns].to_numpy(dtype=np.float64).T, order, axis=1)
+
+
+def _shift_within_groups(values: np.ndarray,
+                         group_position: np.ndarray,
+                         lag: int,
+                         out: np.ndarray = None) -> np.ndarray:
+    """
+    Shift the group-sorted values by the lag without crossing the group boundaries
+
+    Args:
+        values: NumPy array of shape (columns, rows) sorted by group
+        group_position: NumPy array of the position within the group of each row
+        lag: Integer non-negative lag value
+        out: NumPy array of shape (columns, rows) where to write the shifted values (None to allocate it)
+
+    Returns:
+        shifted_values: NumPy array of shape (columns, rows) with NaN where the lag crosses a group start
+    """
+    # Return the values if not shifted
+    if lag == 0:
+        return values
+
+    # Shift and mask the first rows of each group
+    shifted_values = np.empty(values.shape) if out is None else out
+    shifted_values[:, :lag] = np.nan
+    shifted_values[:, lag:] = values[:, :-lag]
+    shifted_values[:, group_position < lag] = np.nan
+
+    return shifted_values
+
+
+def _get_shifted_values(data: pd.DataFrame,
+                        columns: List[str],
+                        group_columns: Union[str, List[str]],
+                        sort_column: str,
+                        shift: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort the rows by group and retrieve the values of the columns shifted within each group
+
+    Args:
+        data: Pandas DataFrame in long format
+        columns: List of column names
+        group_columns: String column name or list of column names identifying the series
+        sort_column: String column name to sort the rows of each group by, None if already sorted
+        shift: Integer non-negative lag applied within each group
+
+    Returns:
+        order: NumPy array of the row positions in sorted order
+        group_rank: NumPy array of the group rank of each sorted row
+        values: NumPy array of shape (columns, rows) of the shifted values sorted by group
+    """
+    # Sort the rows by group
+    order, group_rank, group_position = _sort_by_groups(data, group_columns, sort_column)
+
+    return order, group_rank, _shift_within_groups(_get_sorted_values(data, columns, order), group_position, shift)
+
+
+def _assign_features(data: pd.DataFrame,
+                     feature_names: List[str],
+                     feature_values: np.ndarray,
+                     order: np.ndarray,
+                     inplace: bool) -> pd.DataFrame:
+    """
+    Restore the original row order of the group-sorted features in place
+    and concatenate them to the data once
+
+    Args:
+        data: Pandas DataFrame to add the features to
+        feature_names: List of feature names
+        feature_values: NumPy array of shape (features, rows) sorted by group
+        order: NumPy array of the row positions in sorted order
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the features added (the single block of features only if not 'inplace')
+    """
+    # Restore the original row order of each feature
+    inverse_order = np.empty_like(order)
+    inverse_order[order] = np.arange(len(order))
+
+    for feature_row in feature_values:
+        feature_row[:] = feature_row[inverse_order]
+
+    # Build the features as a single block
+    feature_data = pd.DataFrame(feature_values.T, index=data.index, columns=feature_names, copy=False)
+
+    return attach_features(data, feature_data, inplace)
+
+
+def _check_statistics(statistics: List[str]):
+    """
+    Check that the window statistics are accepted
+
+    Args:
+        statistics: List of string statistics
+
+    Returns:
+    """
+    for statistic in statistics:
+
+        if statistic not in WINDOW_STATISTICS:
+
+            raise ValueError(f'Unrecognised statistic {statistic} (accepted values: {WINDOW_STATISTICS})')
+
+
+def add_group_lag_features(data: pd.DataFrame,
+                           columns: Union[str, List[str]],
+                           lags: Union[int, List[int]],
+                           group_columns: Union[str, List[str]],
+                           sort_column: str = None,
+                           inplace: bool = True) -> pd.DataFrame:
+    """
+    Add the lag features of the columns computed within each group (e.g. store and family),
+    so that the lags never leak values across series, in a single sorted pass
+
+    Args:
+        data: Pandas DataFrame in long format to add lags to
+        columns: String column name or list of column names to compute lags with
+        lags: Integer lag value or list of positive integer lag values
+        group_columns: String column name or list of column names identifying the series
+        sort_column: String column name to sort the rows of each group by (e.g. 'date'), None if already sorted
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the lag features added (named '<column>_lag_<lag>'),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_group_lag_features - Start')
+
+    # Normalise columns and lags
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    lags = np.atleast_1d(np.asarray(lags, dtype=np.int64))
+
+    logger.info('add_group_lag_features - columns: %s | lags: %s | groups: %s',
+                columns, lags.tolist(), group_columns)
+
+    # Check lags
+    if lags.size == 0 or lags.min() < 1:
+
+        raise ValueError('add_group_lag_features - Lags must be positive integers')
+
+    # Sort the rows by group
+    order, _, group_position = _sort_by_groups(data, group_columns, sort_column)
+    values = _get_sorted_values(data, columns, order)
+
+    # Compute the lags of all the columns into a single block of shape (lags, columns, rows)
+    feature_values = np.empty((lags.size, len(columns), len(order)))
+
+    for i, lag in enumerate(lags):
+        _shift_within_groups(values, group_position, int(lag), out=feature_values[i])
+
+    logger.info('add_group_lag_features - End')
+
+    return _assign_features(data,
+                            [f'{column}_lag_{lag}' for lag in lags for column in columns],
+                            feature_values.reshape(-1, len(order)),
+                            order,
+                            inplace)
+
+
+def add_significant_lag_features(data: pd.DataFrame,
+                                 column: str,
+                                 group_columns: Union[str, List[str]],
+                                 sort_column: str = None,
+                                 n_lags: int = 28,
+                                 method: str = 'pacf',
+                                 alpha: float = 0.05,
+                                 max_lags: int = None,
+                                 min_share: float = 0.5,
+                                 inplace: bool = True) -> pd.DataFrame:
+    """
+    Select the lags of the column that are significant for at least a share of the series,
+    from the ACF or PACF of all the series computed at once, and add them within each group
+
+    Args:
+        data: Pandas DataFrame in long format to add lags to
+        column: String column name to select and compute lags with
+        group_columns: String column name or list of column names identifying the series
+        sort_column: String column name to sort the rows of each group by (e.g. 'date'), None if already sorted
+        n_lags: Integer maximum lag to test
+        method: String correlation method (accepted values: CORRELATION_METHODS)
+        alpha: Float significance level of the white-noise band
+        max_lags: Integer maximum number of lags per series, keeping the strongest ones (None for all)
+        min_share: Float minimum share of the series for which a lag must be significant
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the lag features added (named '<column>_lag_<lag>'),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_significant_lag_features - Start')
+
+    # Lay out the series as the columns of a wide panel, by position within the group
+    order, group_rank, group_position = _sort_by_groups(data, group_columns, sort_column)
+    panel = np.full((group_position.max() + 1, group_rank.max() + 1), np.nan)
+    panel[group_position, group_rank] = data[column].to_numpy(dtype=np.float64)[order]
+
+    # Select the lags of the panel
+    lags = select_panel_lags(propose_lags(pd.DataFrame(panel), n_lags, method, alpha, max_lags), min_share)
+
+    logger.info('add_significant_lag_features - column: %s | selected lags: %s', column, lags)
+
+    if len(lags) == 0:
+
+        raise ValueError('add_significant_lag_features - No lag is significant for the requested share of the series')
+
+    logger.info('add_significant_lag_features - End')
+
+    return add_group_lag_features(data, column, lags, group_columns, sort_column, inplace)
+
+
+def _roll_within_groups(values: np.ndarray,
+                        group_rank: np.ndarray,
+                        window: int,
+                        statistics: List[str],
+                        min_periods: int,
+                        out: np.ndarray):
+    """
+    Compute the rolling statistics of the group-sorted values, laying out the groups
+    in a single array separated by (window - 1) missing values
+
+    Args:
+        values: NumPy array of shape (columns, rows) sorted by group
+        group_rank: NumPy array of the group rank of each row
+        window: Integer window size
+        statistics: List of string statistics
+        min_periods: Integer minimum number of values in the window to compute the statistic
+        out: NumPy array of shape (statistics, columns, rows) where to write the statistics
+
+    Returns:
+    """
+    # Separate the groups with (window - 1) missing values
+    gapped_positions = np.arange(values.shape[1]) + (group_rank + 1) * (window - 1)
+    gapped_values = np.full((len(values), gapped_positions[-1] + 1 if values.shape[1] else 0), np.nan)
+    gapped_values[:, gapped_positions] = values
+
+    # Compute each statistic in one rolling pass
+    rolling = pd.DataFrame(gapped_values.T, copy=False).rolling(window, min_periods=min_periods)
+
+    for i, statistic in enumerate(statistics):
+        out[i] = getattr(rolling, statistic)().to_numpy().T[:, gapped_positions]
+
+
+def add_group_rolling_features(data: pd.DataFrame,
+                               columns: Union[str, List[str]],
+                               windows: Union[int, List[int]],
+                               group_columns: Union[str, List[str]],
+                               statistics: List[str] = ('mean', 'std', 'min', 'max'),
+                               sort_column: str = None,
+                               shift: int = 1,
+                               min_periods: int = 1,
+                               inplace: bool = True) -> pd.DataFrame:
+    """
+    Add the rolling window statistics of the columns computed within each group.
+    The groups are laid out in a single array separated by (window - 1) missing values,
+    so that one Pandas rolling pass never mixes values of different series
+
+    Args:
+        data: Pandas DataFrame in long format to add the rolling features to
+        columns: String column name or list of column names to compute the statistics with
+        windows: Integer window size or list of window sizes
+        group_columns: String column name or list of column names identifying the series
+        statistics: List of string statistics (accepted values: ['mean', 'std', 'min', 'max', 'sum'])
+        sort_column: String column name to sort the rows of each group by (e.g. 'date'), None if already sorted
+        shift: Integer lag applied within each group before the window (1 to exclude the current value)
+        min_periods: Integer minimum number of values in the window to compute the statistic
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the rolling features added (named '<column>_rolling_<statistic>_<window>'),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_group_rolling_features - Start')
+
+    # Normalise columns and windows
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    windows = [windows] if isinstance(windows, int) else list(windows)
+
+    logger.info('add_group_rolling_features - columns: %s | windows: %s | statistics: %s | groups: %s',
+                columns, windows, list(statistics), group_columns)
+
+    # Check windows and statistics
+    if not windows or min(windows) < 1:
+
+        raise ValueError('add_group_rolling_features - Windows must be positive integers')
+
+    _check_statistics(statistics)
+
+    # Sort the rows by group and shift them
+    order, group_rank, values = _get_shifted_values(data, columns, group_columns, sort_column, shift)
+
+    # Initialise the block of shape (windows, statistics, columns, rows)
+    feature_values = np.empty((len(windows), len(statistics), len(columns), len(order)))
+
+    for i, window in enumerate(windows):
+        _roll_within_groups(values, group_rank, window, statistics, min_periods, out=feature_values[i])
+
+    logger.info('add_group_rolling_features - End')
+
+    return _assign_features(data,
+                            [f'{column}_rolling_{statistic}_{window}'
+                             for window in windows for statistic in statistics for column in columns],
+                            feature_values.reshape(-1, len(order)),
+                            order,
+                            inplace)
+
+
+def _cumulate_groups(values: np.ndarray,
+                     group_rank: np.ndarray,
+                     operation: str) -> np.ndarray:
+    """
+    Apply a cumulative operation restarting at each group start
+
+    Args:
+        values: NumPy array of shape (columns, rows) sorted by group
+        group_rank: NumPy array of the group rank of each row
+        operation: String cumulative group operation (accepted values: ['cumsum', 'cummin', 'cummax'])
+
+    Returns:
+        cumulative_values: NumPy array of shape (columns, rows) of float cumulative values
+    """
+    # Apply the operation on the columns of the transposed values
+    grouped_values = pd.DataFrame(values.T, dtype=np.float64).groupby(group_rank, sort=False)
+
+    return getattr(grouped_values, operation)().to_numpy().T
+
+
+def _expanding_std(values: np.ndarray,
+                   available: np.ndarray,
+                   counts: np.ndarray,
+                   group_rank: np.ndarray) -> np.ndarray:
+    """
+    Compute the expanding standard deviation of the group-sorted values from the cumulative sums
+    of the values centered on their group mean (for numerical stability)
+
+    Args:
+        values: NumPy array of shape (columns, rows) sorted by group
+        available: NumPy boolean array of shape (columns, rows) of the non-missing values
+        counts: NumPy array of shape (columns, rows) of the expanding count of available values
+        group_rank: NumPy array of the group rank of each row
+
+    Returns:
+        expanding_std: NumPy array of shape (columns, rows) of the expanding standard deviation
+    """
+    # Center the values on their group mean
+    group_means = pd.DataFrame(values.T).groupby(group_rank, sort=False).transform('mean').to_numpy().T
+    centered_values = np.where(available, values - group_means, 0)
+
+    # Compute the cumulative sums of the centered values and squares
+    centered_sums = _cumulate_groups(centered_values, group_rank, 'cumsum')
+    centered_squares = _cumulate_groups(centered_values ** 2, group_rank, 'cumsum')
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = (centered_squares - centered_sums ** 2 / counts) / (counts - 1)
+
+    return np.sqrt(np.where(counts > 1, np.maximum(variance, 0), np.nan))
+
+
+def _expand_within_groups(values: np.ndarray,
+                          group_rank: np.ndarray,
+                          statistics: List[str]) -> np.ndarray:
+    """
+    Compute the expanding statistics of the group-sorted values
+
+    Args:
+        values: NumPy array of shape (columns, rows) sorted by group
+        group_rank: NumPy array of the group rank of each sorted row
+        statistics: List of string statistics (accepted values: WINDOW_STATISTICS)
+
+    Returns:
+        feature_values: NumPy array of shape (statistics, columns, rows)
+    """
+    available = ~np.isnan(values)
+
+    # Compute the cumulative count and sum of the available values
+    counts = _cumulate_groups(available, group_rank, 'cumsum')
+    sums = _cumulate_groups(np.where(available, values, 0), group_rank, 'cumsum')
+
+    # Initialise the block of shape (statistics, columns, rows)
+    feature_values = np.empty((len(statistics),) + values.shape)
+
+    for i, statistic in enumerate(statistics):
+
+        # Switch between statistics
+        match statistic:
+            case 'mean':
+                np.divide(sums, counts, out=feature_values[i], where=counts > 0)
+            case 'std':
+                feature_values[i] = _expanding_std(values, available, counts, group_rank)
+            case 'min':
+                feature_values[i] = _cumulate_groups(np.where(available, values, np.inf), group_rank, 'cummin')
+            case 'max':
+                feature_values[i] = _cumulate_groups(np.where(available, values, -np.inf), group_rank, 'cummax')
+            case _:
+                feature_values[i] = sums
+
+        # Mask the rows without available values
+        feature_values[i][counts == 0] = np.nan
+
+    return feature_values
+
+
+def add_group_expanding_features(data: pd.DataFrame,
+                                 columns: Union[str, List[str]],
+                                 group_columns: Union[str, List[str]],
+                                 statistics: List[str] = ('mean', 'std', 'min', 'max'),
+                                 sort_column: str = None,
+                                 shift: int = 1,
+                                 inplace: bool = True) -> pd.DataFrame:
+    """
+    Add the expanding statistics of the columns computed within each group,
+    through cumulative group operations in a single sorted pass
+
+    Args:
+        data: Pandas DataFrame in long format to add the expanding features to
+        columns: String column name or list of column names to compute the statistics with
+        group_columns: String column name or list of column names identifying the series
+        statistics: List of string statistics (accepted values: ['mean', 'std', 'min', 'max', 'sum'])
+        sort_column: String column name to sort the rows of each group by (e.g. 'date'), None if already sorted
+        shift: Integer lag applied within each group before the statistics (1 to exclude the current value)
+        inplace: Boolean indicating whether to add the features to the data or to return them only
+
+    Returns:
+        data: Pandas DataFrame with the expanding features added (named '<column>_expanding_<statistic>'),
+              the single block of features only if not 'inplace'
+    """
+    logger.info('add_group_expanding_features - Start')
+
+    # Normalise columns
+    columns = [columns] if isinstance(columns, str) else list(columns)
+
+    logger.info('add_group_expanding_features - columns: %s | statistics: %s | groups: %s',
+                columns, list(statistics), group_columns)
+
+    _check_statistics(statistics)
+
+    # Sort the rows by group and shift them
+    order, group_rank, values = _get_shifted_values(data, columns, group_columns, sort_column, shift)
+
+    # Compute the statistics into a single block of shape (statistics, columns, rows)
+    feature_values = _expand_within_groups(values, group_rank, statistics)
+
+    logger.info('add_group_expanding_features - End')
+
+    return _assign_features(data,
+                            [f'{column}_expanding_{statistic}' for statistic in statistics for column in columns],
+                            feature_values.reshape(-1, len(order)),
+                            order,
+                            inplace)
 
 
 def add_seasonality(data: pd.DataFrame,
                     column: str,
-                    seasonality: List[str]) -> pd.DataFrame:
+                    seasonality: List[str],
+                    inplace: bool = True) -> pd.DataFrame:
     """
     Add all seasonality computed on the given 'column' into the 'data'
 
@@ -125,12 +719,16 @@ def add_seasonality(data: pd.DataFrame,
         column: String column name to compute seasonality with
         seasonality: List of string seasonality to add
                      (accepted values: ['day_of_week', 'week', 'day_of_year', 'year'])
+        inplace: Boolean indicating whether to add the seasonality to the data or to return it only
 
     Returns:
-        data: Pandas DataFrame with the seasonality added
+        data: Pandas DataFrame with the seasonality added (the seasonality columns only if not 'inplace')
     """
     logger.info('add_seasonality - Start')
 
+    # Initialise the seasonality features
+    seasonality_features = {}
+
     # Fetch seasonality to add
     for element in seasonality:
 
@@ -139,17 +737,17 @@ def add_seasonality(data: pd.DataFrame,
         # Switch between seasonality to add
         match element:
             case 'day_of_week':
-                data['day_of_week'] = data[column].dt.day_name()
+                seasonality_features['day_of_week'] = data[column].dt.day_name()
             case 'week':
-                data['week'] = data[column].dt.isocalendar().week.astype('int32')
+                seasonality_features['week'] = data[column].dt.isocalendar().week.astype('int32')
             case 'day_of_year':
-                data['day_of_year'] = data[column].dt.dayofyear.astype('int32')
+                seasonality_features['day_of_year'] = data[column].dt.dayofyear.astype('int32')
             case 'year':
-                data['year'] = data[column].dt.year.astype('int32')
+                seasonality_features['year'] = data[column].dt.year.astype('int32')
             case _:
                 # Unrecognised seasonality
                 raise ValueError('Unrecognised Seasonality')
 
     logger.info('add_seasonality - End')
 
-    return data
+    return attach_features(data, pd.DataFrame(seasonality_features, index=data.index), inplace)
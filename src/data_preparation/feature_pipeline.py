@@ -0,0 +1,289 @@
+"""
+The module contains the class for running a declarative feature engineering pipeline,
+whose steps are cached on disk and keyed by the input fingerprint and the code and the parameters of the steps
+"""
+# Import Standard Libraries
+import functools
+import hashlib
+import inspect
+import json
+import pathlib
+import time
+from typing import Callable, List, Union
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+from src.general_utils.general_utils import (
+    CACHE_FORMATS,
+    build_path_from_list,
+    load_configuration,
+    resolve_cache_format,
+    thaw_configuration,
+    write_cache
+)
+from src.data_preparation.data_preparation_utils import (
+    group_avg_column_by_frequency,
+    add_dummy_time_step,
+    add_lag_feature,
+    add_lag_features,
+    add_group_lag_features,
+    add_significant_lag_features,
+    add_group_rolling_features,
+    add_group_expanding_features,
+    add_seasonality
+)
+from src.data_preparation.calendar_features import add_calendar_features
+
+# Define the functions accepted as pipeline steps
+FEATURE_STEPS = {
+    'group_avg_column_by_frequency': group_avg_column_by_frequency,
+    'add_dummy_time_step': add_dummy_time_step,
+    'add_lag_feature': add_lag_feature,
+    'add_lag_features': add_lag_features,
+    'add_group_lag_features': add_group_lag_features,
+    'add_significant_lag_features': add_significant_lag_features,
+    'add_group_rolling_features': add_group_rolling_features,
+    'add_group_expanding_features': add_group_expanding_features,
+    'add_seasonality': add_seasonality,
+    'add_calendar_features': add_calendar_features
+}
+
+
+def fingerprint_data(data: pd.DataFrame) -> str:
+    """
+    Compute the fingerprint of the data from its values, index, column names and dtypes
+
+    Args:
+        data: Pandas DataFrame to fingerprint
+
+    Returns:
+        fingerprint: String SHA-1 hex digest of the data
+    """
+    # Hash the values and the index of each row
+    data_hash = hashlib.sha1(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+
+    # Hash the column names and the dtypes
+    data_hash.update(json.dumps([[str(column), str(dtype)] for column, dtype in data.dtypes.items()]).encode('utf-8'))
+
+    return data_hash.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def fingerprint_function(function: Callable) -> str:
+    """
+    Compute the fingerprint of a function from its source code, falling back to its qualified name
+    when the source is not available. The helpers called by the function are not covered
+
+    Args:
+        function: Callable to fingerprint
+
+    Returns:
+        fingerprint: String SHA-1 hex digest of the function
+    """
+    # Retrieve the source code of the function
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        source = f'{function.__module__}.{function.__qualname__}'
+
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def modifies_input(step: dict) -> bool:
+    """
+    Check whether a step adds its features into its input frame, i.e. whether its function
+    takes an 'inplace' parameter that the step leaves (or sets) to True
+
+    Args:
+        step: Dictionary with 'function' and optional 'parameters' of the step
+
+    Returns:
+        modifies: Boolean flag of the step modifying its input
+    """
+    # Retrieve the 'inplace' parameter of the function
+    inplace_parameter = inspect.signature(FEATURE_STEPS[step['function']]).parameters.get('inplace')
+
+    return inplace_parameter is not None and step.get('parameters', {}).get('inplace', inplace_parameter.default)
+
+
+class FeaturePipeline:
+    """
+    The class implements a declarative feature engineering pipeline. Each step calls a function of
+    FEATURE_STEPS with its parameters and its output is cached on disk under a key chained from the
+    input fingerprint and the function source, the optional version and the parameters of all the steps
+    up to it, so that changing a step only recomputes that step and the following ones.
+
+    Attributes:
+        steps: List of dictionaries with 'name', 'function', optional 'parameters' and optional 'version'
+               of each step (bump the version to invalidate the cache when a helper of the function changes)
+        cache_folder: pathlib.Path folder of the cached steps (None to disable the cache)
+        cache_format: String cache format (accepted values: CACHE_FORMATS keys)
+        cache_report: Pandas DataFrame with step, key, cache hit and seconds of the last run
+    """
+
+    def __init__(self,
+                 steps: List[dict],
+                 cache_folder: Union[pathlib.Path, None] = None,
+                 cache_format: str = 'parquet'):
+        """
+        Constructor for the FeaturePipeline class
+
+        Args:
+            steps: List of dictionaries with 'name', 'function', optional 'parameters' and optional 'version'
+                   of each step
+            cache_folder: pathlib.Path folder of the cached steps (None to disable the cache)
+            cache_format: String cache format (accepted values: CACHE_FORMATS keys)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Check the steps
+        for step in steps:
+
+            if step.get('function') not in FEATURE_STEPS:
+
+                raise ValueError(f'__init__ - Unrecognised function of step {step.get("name")}: {step.get("function")}')
+
+        # Initialise object attributes
+        self.steps = [thaw_configuration(step) for step in steps]
+        self.cache_folder = cache_folder
+        self.cache_format = resolve_cache_format(cache_format)
+        self.cache_report = None
+
+    @classmethod
+    def from_config(cls,
+                    file_name: str,
+                    pipeline_name: str) -> 'FeaturePipeline':
+        """
+        Build the pipeline from a section of a YAML or TOML file of the 'configuration' folder
+
+        Args:
+            file_name: String configuration file name (e.g. 'feature_pipeline_config.toml')
+            pipeline_name: String section of the pipeline (with 'steps', optional 'cache_folder' and 'cache_format')
+
+        Returns:
+            pipeline: FeaturePipeline object instance
+        """
+        # Load the pipeline configuration
+        pipeline_config = load_configuration(file_name, pipeline_name)
+
+        # Retrieve the cache folder
+        cache_folder = build_path_from_list(list(pipeline_config['cache_folder'])) \
+            if 'cache_folder' in pipeline_config else None
+
+        return cls(list(pipeline_config['steps']),
+                   cache_folder,
+                   pipeline_config.get('cache_format', 'parquet'))
+
+    def build_step_keys(self,
+                        data: pd.DataFrame) -> List[str]:
+        """
+        Build the cache key of each step from its function source, version and parameters,
+        chained from the input fingerprint and the previous steps
+
+        Args:
+            data: Pandas DataFrame input of the pipeline
+
+        Returns:
+            step_keys: List of string SHA-1 hex digests, one per step
+        """
+        # Chain the keys from the input fingerprint
+        step_keys = []
+        previous_key = fingerprint_data(data)
+
+        for step in self.steps:
+            previous_key = hashlib.sha1(json.dumps([previous_key,
+                                                    step['function'],
+                                                    fingerprint_function(FEATURE_STEPS[step['function']]),
+                                                    step.get('version'),
+                                                    step.get('parameters', {})],
+                                                   sort_keys=True,
+                                                   default=str).encode('utf-8')).hexdigest()
+            step_keys.append(previous_key)
+
+        return step_keys
+
+    def run(self,
+            data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the pipeline on the data, loading the longest chain of cached steps and computing
+        only the following steps. The data is copied only if the first computed step adds
+        its features in place, since every step returns the frame passed to the next one
+
+        Args:
+            data: Pandas DataFrame input of the pipeline (it is not modified)
+
+        Returns:
+            features: Pandas DataFrame output of the last step
+        """
+        self.logger.info('run - Start')
+
+        # Build the cache keys and paths
+        step_keys = self.build_step_keys(data)
+        cache_paths = [self._get_cache_path(i, step_key) for i, step_key in enumerate(step_keys)]
+
+        # Retrieve the last cached step
+        first_step = next((i + 1 for i in reversed(range(len(self.steps)))
+                           if cache_paths[i] is not None and cache_paths[i].exists()), 0)
+
+        if first_step > 0:
+
+            self.logger.info('run - Loading step %s from the cache', self.steps[first_step - 1]['name'])
+
+            features = getattr(pd, f'read_{self.cache_format}')(cache_paths[first_step - 1])
+
+        else:
+
+            # Copy the data only if the first step modifies its input
+            features = data.copy() if self.steps and modifies_input(self.steps[0]) else data
+
+        # Compute the following steps
+        cache_report = [{'step': step['name'], 'key': step_key, 'cache_hit': True, 'seconds': 0.0}
+                        for step, step_key in zip(self.steps[:first_step], step_keys)]
+
+        for step, step_key, cache_path in zip(self.steps[first_step:], step_keys[first_step:], cache_paths[first_step:]):
+
+            self.logger.info('run - Computing step %s', step['name'])
+
+            start_time = time.perf_counter()
+            features = FEATURE_STEPS[step['function']](features, **step.get('parameters', {}))
+
+            # Write the step into the cache
+            if cache_path is not None:
+                write_cache(features, cache_path, self.cache_format)
+
+            cache_report.append({'step': step['name'],
+                                 'key': step_key,
+                                 'cache_hit': False,
+                                 'seconds': time.perf_counter() - start_time})
+
+        self.cache_report = pd.DataFrame(cache_report)
+
+        self.logger.info('run - End')
+
+        return features
+
+    def _get_cache_path(self,
+                        step_position: int,
+                        step_key: str) -> Union[pathlib.Path, None]:
+        """
+        Retrieve the cache path of a step
+
+        Args:
+            step_position: Integer position of the step in the pipeline
+            step_key: String cache key of the step
+
+        Returns:
+            cache_path: pathlib.Path of the cached step, None if the cache is disabled
+        """
+        if self.cache_folder is None:
+            return None
+
+        return self.cache_folder / (f'{step_position:02d}_{self.steps[step_position]["name"]}_{step_key[:16]}'
+                                    f'{CACHE_FORMATS[self.cache_format]}')
@@ -0,0 +1,362 @@
+"""
+The module contains the class for aggregating many columns with many statistics by a date frequency
+and optional group columns, encoding and sorting the groups once and reducing each column over sorted segments
+"""
+# Import Standard Libraries
+import pathlib
+from typing import Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+
+# Define the accepted aggregation statistics
+AGGREGATION_STATISTICS = ['sum', 'mean', 'median', 'min', 'max', 'std', 'count']
+
+
+def _sort_within_segments(values: np.ndarray,
+                          lengths: np.ndarray) -> np.ndarray:
+    """
+    Sort the values within each contiguous segment (with the missing values last),
+    sorting by value and then stably by segment, which is faster than np.lexsort
+
+    Args:
+        values: NumPy array of values laid out by segment
+        lengths: NumPy array of the number of values of each segment
+
+    Returns:
+        sorted_values: NumPy array of values sorted within each segment
+    """
+    # Sort by value
+    value_order = np.argsort(values)
+
+    # Sort stably by segment
+    segment_ids = np.repeat(np.arange(len(lengths)), lengths)[value_order]
+
+    return values[value_order[np.argsort(segment_ids, kind='stable')]]
+
+
+class FrequencyAggregator:  # pylint: disable=too-many-instance-attributes
+    """
+    The class implements an aggregation engine over a date frequency (e.g. 'W', 'ME') and optional group columns
+    (e.g. 'store_nbr', 'family'). The groups are encoded and sorted once when the object is built,
+    then each call of 'aggregate' reduces the columns with np.ufunc.reduceat over the sorted segments,
+    so that the same data is aggregated many times without grouping it again.
+    When the rows are already sorted by date and groups, the rows are reduced without being reordered.
+
+    Attributes:
+        data: Pandas DataFrame to aggregate (it is referenced, not copied)
+        key: String date column name
+        frequency: String frequency of the date bins (None to group by the exact key values)
+        group_columns: List of column names to group by together with the date bins
+        order: NumPy array of the row positions sorted by group (None if the rows are already sorted)
+        starts: NumPy array of the first sorted row position of each group
+        lengths: NumPy array of the number of rows of each group
+        positions: NumPy array of the result row of each group
+        groups: Pandas DataFrame of the keys of the result rows
+    """
+
+    def __init__(self,
+                 data: pd.DataFrame,
+                 key: str,
+                 frequency: str = None,
+                 group_columns: Union[str, List[str]] = None):
+        """
+        Constructor for the FrequencyAggregator class
+
+        Args:
+            data: Pandas DataFrame to aggregate (it is referenced, not copied)
+            key: String date column name
+            frequency: String frequency of the date bins (None to group by the exact key values)
+            group_columns: String column name or list of column names to group by together with the date bins
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Initialise object attributes
+        self.data = data
+        self.key = key
+        self.frequency = frequency
+        self.group_columns = [group_columns] if isinstance(group_columns, str) else list(group_columns or [])
+
+        # Encode the date bins and the groups of each row (-1 for missing values)
+        key_codes, key_labels = self._encode_key()
+        group_codes, group_labels = zip(*[pd.factorize(data[column], sort=True) for column in self.group_columns]) \
+            if self.group_columns else ((), ())
+        codes = np.vstack([key_codes, *group_codes])
+        shape = (len(key_labels),) + tuple(len(labels) for labels in group_labels)
+
+        # Sort the rows by group, skipping the rows with missing keys
+        self.order, sorted_codes = self._sort_codes(codes, shape)
+
+        # Retrieve the segment of each group
+        self.starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]) \
+            if sorted_codes.size > 0 else np.empty(0, dtype=np.int64)
+        self.lengths = np.diff(np.r_[self.starts, len(sorted_codes)])
+        segment_codes = sorted_codes[self.starts]
+
+        # Build the result keys (all the date bins without group columns, as pd.Grouper)
+        if self.group_columns:
+            self.positions = np.arange(len(self.starts))
+            segment_keys = np.unravel_index(segment_codes, shape)
+            self.groups = pd.DataFrame({name: labels.take(codes)
+                                        for name, labels, codes in zip([key] + self.group_columns,
+                                                                       (key_labels,) + group_labels,
+                                                                       segment_keys)})
+        else:
+            self.positions = segment_codes
+            self.groups = pd.DataFrame({key: key_labels})
+
+        self.logger.info('__init__ - Rows: %s | Groups: %s | Sorted: %s',
+                         len(data), len(self.groups), self.order is None)
+
+    def aggregate(self,
+                  columns: Union[str, List[str]],
+                  statistics: List[str] = ('mean',),
+                  quantiles: List[float] = (),
+                  precision: int = None) -> pd.DataFrame:
+        """
+        Aggregate the columns with the statistics and the quantiles in a single pass per column.
+        The missing values are skipped as in Pandas, the quantiles are linearly interpolated
+
+        Args:
+            columns: String column name or list of column names to aggregate
+            statistics: List of string statistics (accepted values: AGGREGATION_STATISTICS)
+            quantiles: List of float quantiles in [0, 1]
+            precision: Integer precision to round the statistics (None to not round)
+
+        Returns:
+            aggregated_data: Pandas DataFrame with the group keys and a column per statistic
+                             (named '<column>_<statistic>' and '<column>_quantile_<quantile>')
+        """
+        self.logger.info('aggregate - Start')
+
+        # Normalise columns
+        columns = [columns] if isinstance(columns, str) else list(columns)
+
+        self.logger.info('aggregate - columns: %s | statistics: %s | quantiles: %s',
+                         columns, list(statistics), list(quantiles))
+
+        # Check statistics and quantiles
+        if any(statistic not in AGGREGATION_STATISTICS for statistic in statistics):
+
+            raise ValueError(f'aggregate - Statistics must be in {AGGREGATION_STATISTICS}')
+
+        if any(not 0 <= quantile <= 1 for quantile in quantiles):
+
+            raise ValueError('aggregate - Quantiles must be in [0, 1]')
+
+        # Reduce each column
+        aggregations = {}
+
+        for column in columns:
+            aggregations.update(self._reduce_column(column, statistics, quantiles))
+
+        # Build the result block
+        aggregated_data = pd.DataFrame(aggregations, index=self.groups.index)
+
+        if precision is not None:
+            aggregated_data = aggregated_data.round(precision)
+
+        self.logger.info('aggregate - End')
+
+        return pd.concat([self.groups, aggregated_data], axis=1)
+
+    def _encode_key(self) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Encode the date bin of each row, binning the unique dates only
+
+        Returns:
+            key_codes: NumPy array of the date bin code of each row (-1 for missing dates)
+            key_labels: Pandas Index of the date bin labels
+        """
+        # Retrieve the sorted unique dates
+        date_codes, unique_dates = pd.factorize(self.data[self.key], sort=True)
+
+        if self.frequency is None:
+            return date_codes, pd.Index(unique_dates, name=self.key)
+
+        # Bin the unique dates with the same bins of pd.Grouper (including the empty bins)
+        bins = pd.Series(np.arange(len(unique_dates)), index=pd.DatetimeIndex(unique_dates)) \
+            .groupby(pd.Grouper(freq=self.frequency))
+        bin_codes = bins.ngroup().to_numpy()
+
+        return np.where(date_codes >= 0, bin_codes[date_codes], -1), bins.size().index.rename(self.key)
+
+    def _sort_codes(self,
+                    codes: np.ndarray,
+                    shape: Tuple[int, ...]) -> Tuple[Union[np.ndarray, None], np.ndarray]:
+        """
+        Sort the rows by their flat group code, skipping the rows with missing keys
+
+        Args:
+            codes: NumPy array of shape (keys, rows) of key codes
+            shape: Tuple of the number of labels of each key
+
+        Returns:
+            order: NumPy array of the sorted row positions (None if the rows are already sorted)
+            sorted_codes: NumPy array of the sorted flat group codes
+        """
+        # Flatten the codes of the rows without missing keys
+        available = (codes >= 0).all(axis=0)
+        flat_codes = np.ravel_multi_index(tuple(codes[:, available]), shape) if shape[0] > 0 \
+            else np.empty(0, dtype=np.int64)
+
+        # Skip the sort of the already sorted rows
+        if available.all() and np.all(flat_codes[1:] >= flat_codes[:-1]):
+            return None, flat_codes
+
+        sorted_positions = np.argsort(flat_codes, kind='stable')
+
+        return np.flatnonzero(available)[sorted_positions], flat_codes[sorted_positions]
+
+    def _reduce_column(self,
+                       column: str,
+                       statistics: List[str],
+                       quantiles: List[float]) -> Dict[str, np.ndarray]:
+        """
+        Reduce a column over the sorted segments of the groups
+
+        Args:
+            column: String column name to aggregate
+            statistics: List of string statistics (accepted values: AGGREGATION_STATISTICS)
+            quantiles: List of float quantiles in [0, 1]
+
+        Returns:
+            aggregations: Dictionary of the statistic names and their values for each result row
+        """
+        # Sort the values by group
+        values = self.data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values if self.order is None else values[self.order]
+        available = ~np.isnan(values)
+
+        # Compute the count and the sum of the available values of each segment
+        counts = np.add.reduceat(available, self.starts, dtype=np.int64)
+        sums = np.add.reduceat(np.where(available, values, 0), self.starts)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+
+        # Sort the values within each segment for the median and the quantiles
+        segment_sorted_values = _sort_within_segments(values, self.lengths) \
+            if 'median' in statistics or quantiles else None
+
+        aggregations = {}
+
+        for statistic in statistics:
+
+            # Switch between statistics
+            match statistic:
+                case 'sum':
+                    segment_values = sums
+                case 'mean':
+                    segment_values = means
+                case 'median':
+                    segment_values = self._interpolate_quantile(segment_sorted_values, counts, 0.5)
+                case 'min':
+                    segment_values = np.minimum.reduceat(np.where(available, values, np.inf), self.starts)
+                case 'max':
+                    segment_values = np.maximum.reduceat(np.where(available, values, -np.inf), self.starts)
+                case 'std':
+                    squared_deviations = np.where(available, values - np.repeat(means, self.lengths), 0) ** 2
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        segment_values = np.sqrt(np.add.reduceat(squared_deviations, self.starts) / (counts - 1))
+                    segment_values[counts < 2] = np.nan
+                case _:
+                    segment_values = counts
+
+            # Mask the statistics of the segments without available values
+            if statistic in ['min', 'max']:
+                segment_values[counts == 0] = np.nan
+
+            aggregations[f'{column}_{statistic}'] = self._expand_segments(segment_values,
+                                                                          statistic in ['sum', 'count'])
+
+        for quantile in quantiles:
+            aggregations[f'{column}_quantile_{quantile:g}'] = \
+                self._expand_segments(self._interpolate_quantile(segment_sorted_values, counts, quantile), False)
+
+        return aggregations
+
+    def _interpolate_quantile(self,
+                              values: np.ndarray,
+                              counts: np.ndarray,
+                              quantile: float) -> np.ndarray:
+        """
+        Linearly interpolate the quantile of each segment of values sorted within the segments
+        (with the missing values last)
+
+        Args:
+            values: NumPy array of values sorted within each segment
+            counts: NumPy array of the number of available values of each segment
+            quantile: Float quantile in [0, 1]
+
+        Returns:
+            segment_quantiles: NumPy array of the quantile of each segment
+        """
+        # Compute the fractional position of the quantile within each segment
+        position = quantile * np.maximum(counts - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+
+        # Interpolate between the closest values
+        lower_values = values[self.starts + lower]
+        segment_quantiles = lower_values + (values[self.starts + upper] - lower_values) * (position - lower)
+
+        return np.where(counts > 0, segment_quantiles, np.nan)
+
+    def _expand_segments(self,
+                         segment_values: np.ndarray,
+                         additive: bool) -> np.ndarray:
+        """
+        Place the statistics of the segments into the result rows (the empty date bins have no segment)
+
+        Args:
+            segment_values: NumPy array of the statistic of each segment
+            additive: Boolean indicating whether the statistic of an empty date bin is 0 (sum and count) or missing
+
+        Returns:
+            values: NumPy array of the statistic of each result row
+        """
+        if len(segment_values) == len(self.groups):
+            return segment_values
+
+        values = np.full(len(self.groups), 0, dtype=segment_values.dtype) if additive \
+            else np.full(len(self.groups), np.nan)
+        values[self.positions] = segment_values
+
+        return values
+
+
+def aggregate_by_frequency(data: pd.DataFrame,
+                           key: str,
+                           columns: Union[str, List[str]],
+                           frequency: str = None,
+                           group_columns: Union[str, List[str]] = None,
+                           statistics: List[str] = ('mean',),
+                           quantiles: List[float] = (),
+                           precision: int = None) -> pd.DataFrame:
+    """
+    Aggregate the columns by the date frequency and the group columns in a single call
+    (build a FrequencyAggregator to aggregate the same data many times)
+
+    Args:
+        data: Pandas DataFrame to aggregate
+        key: String date column name
+        columns: String column name or list of column names to aggregate
+        frequency: String frequency of the date bins (None to group by the exact key values)
+        group_columns: String column name or list of column names to group by together with the date bins
+        statistics: List of string statistics (accepted values: AGGREGATION_STATISTICS)
+        quantiles: List of float quantiles in [0, 1]
+        precision: Integer precision to round the statistics (None to not round)
+
+    Returns:
+        aggregated_data: Pandas DataFrame with the group keys and a column per statistic
+    """
+    return FrequencyAggregator(data, key, frequency, group_columns).aggregate(columns, statistics, quantiles, precision)
@@ -0,0 +1,225 @@
+"""
+The module contains the class for building deterministic trend features
+(constant, polynomial time-step and Fourier terms) for any window of time steps
+"""
+# Import Standard Libraries
+import pathlib
+from typing import Dict, List, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+from src.data_preparation.calendar_features import compute_fourier_terms
+
+# Define the names of the polynomial trend terms (the same of statsmodels DeterministicProcess)
+TREND_NAMES = {1: 'trend', 2: 'trend_squared', 3: 'trend_cubed'}
+
+
+class TrendFeatureBuilder:
+    """
+    The class implements a builder of deterministic trend features, which extends
+    the time-step feature with a constant, a polynomial order and Fourier terms.
+    The features of any window (start, steps) are computed on demand, so the in-sample features
+    and the forecast horizon of each backtest fold are built without materialising the full range.
+
+    Attributes:
+        index: Pandas index of the in-sample time steps (DatetimeIndex for calendar Fourier terms)
+        constant: Boolean indicating whether to add the constant term
+        order: Integer polynomial order of the time-step trend (0 for no trend)
+        fourier: Dictionary of periods and Fourier orders, where string periods are calendar
+                 periods (e.g. 'YE', 'W') and numeric periods are counted in time steps
+    """
+
+    def __init__(self,
+                 index: pd.Index,
+                 constant: bool = True,
+                 order: int = 1,
+                 fourier: Dict[Union[str, float], int] = None):
+        """
+        Constructor for the TrendFeatureBuilder class
+
+        Args:
+            index: Pandas index of the in-sample time steps (DatetimeIndex for calendar Fourier terms)
+            constant: Boolean indicating whether to add the constant term
+            order: Integer polynomial order of the time-step trend (0 for no trend)
+            fourier: Dictionary of periods and Fourier orders (e.g. {'YE': 10, 7: 3})
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Initialise object attributes
+        self.index = index
+        self.constant = constant
+        self.order = order
+        self.fourier = fourier or {}
+
+        # Check the calendar Fourier terms
+        if any(isinstance(period, str) for period in self.fourier) and self._get_frequency() is None:
+
+            raise ValueError('__init__ - Calendar Fourier terms require a DatetimeIndex or PeriodIndex with a frequency')
+
+    @property
+    def feature_names(self) -> List[str]:
+        """
+        Return the names of the trend features
+
+        Returns:
+            feature_names: List of feature names
+        """
+        # Retrieve the constant and polynomial names
+        feature_names = ['const'] if self.constant else []
+        feature_names += [TREND_NAMES.get(power, f'trend**{power}') for power in range(1, self.order + 1)]
+
+        # Retrieve the Fourier names
+        for period, fourier_order in self.fourier.items():
+            feature_names += [f'{function}({k},{period})'
+                              for k in range(1, fourier_order + 1) for function in ['sin', 'cos']]
+
+        return feature_names
+
+    def compute(self,
+                start: int,
+                steps: int) -> np.ndarray:
+        """
+        Compute the trend features of the time steps in [start, start + steps),
+        where 0 is the first in-sample time step
+
+        Args:
+            start: Integer position of the first time step (it can be beyond the in-sample index)
+            steps: Integer number of time steps
+
+        Returns:
+            trend_values: NumPy array of shape (steps, features)
+        """
+        # Compute the time steps (starting from 1 as statsmodels DeterministicProcess)
+        time_steps = np.arange(start + 1, start + steps + 1, dtype=np.float64)
+
+        # Compute the constant and the polynomial terms
+        blocks = [np.ones((steps, int(self.constant)))]
+        blocks.append(time_steps[:, np.newaxis] ** np.arange(1, self.order + 1))
+
+        # Compute the Fourier terms
+        for period, fourier_order in self.fourier.items():
+
+            if isinstance(period, str):
+                dates = self._get_dates(start, steps)
+                blocks.append(compute_fourier_terms(dates, period, fourier_order, np.float64)[0])
+            else:
+                angles = 2 * np.pi * np.mod(time_steps - 1, period)[:, np.newaxis] / period \
+                    * np.arange(1, fourier_order + 1)
+                blocks.append(np.stack([np.sin(angles), np.cos(angles)], axis=2).reshape(steps, -1))
+
+        return np.hstack(blocks, dtype=np.float64)
+
+    def in_sample(self) -> pd.DataFrame:
+        """
+        Build the trend features of the in-sample index
+
+        Returns:
+            trend_features: Pandas DataFrame of trend features indexed as the in-sample index
+        """
+        self.logger.info('in_sample - Time steps: %s', len(self.index))
+
+        return pd.DataFrame(self.compute(0, len(self.index)),
+                            index=self.index,
+                            columns=self.feature_names,
+                            copy=False)
+
+    def out_of_sample(self,
+                      steps: int,
+                      start: int = None) -> pd.DataFrame:
+        """
+        Build the trend features of the steps following the in-sample index (or the start)
+
+        Args:
+            steps: Integer number of time steps to forecast
+            start: Integer position of the first time step (None for the end of the in-sample index)
+
+        Returns:
+            trend_features: Pandas DataFrame of trend features indexed by the forecast time steps
+        """
+        # Retrieve the first forecast time step
+        start = len(self.index) if start is None else start
+
+        self.logger.info('out_of_sample - Start: %s | Steps: %s', start, steps)
+
+        return pd.DataFrame(self.compute(start, steps),
+                            index=self._get_index(start, steps),
+                            columns=self.feature_names,
+                            copy=False)
+
+    def _get_frequency(self) -> Union[pd.DateOffset, None]:
+        """
+        Retrieve the frequency of the in-sample DatetimeIndex or PeriodIndex
+
+        Returns:
+            frequency: Pandas DateOffset of the index, None if it is not a dated index with a frequency
+        """
+        # Check the dated index
+        if not isinstance(self.index, (pd.DatetimeIndex, pd.PeriodIndex)):
+            return None
+
+        # Infer the frequency if not set
+        if self.index.freq is None and len(self.index) > 2:
+            return pd.tseries.frequencies.to_offset(pd.infer_freq(self.index))
+
+        return self.index.freq
+
+    def _get_dates(self,
+                   start: int,
+                   steps: int) -> pd.DatetimeIndex:
+        """
+        Retrieve the dates of the time steps in [start, start + steps)
+
+        Args:
+            start: Integer position of the first time step
+            steps: Integer number of time steps
+
+        Returns:
+            dates: Pandas DatetimeIndex of the time steps
+        """
+        # Switch between periods and dates
+        if isinstance(self.index, pd.PeriodIndex):
+            return self._get_index(start, steps).to_timestamp()
+
+        return self._get_index(start, steps)
+
+    def _get_index(self,
+                   start: int,
+                   steps: int) -> pd.Index:
+        """
+        Retrieve the index of the time steps in [start, start + steps)
+
+        Args:
+            start: Integer position of the first time step
+            steps: Integer number of time steps
+
+        Returns:
+            index: Pandas DatetimeIndex or PeriodIndex continuing the dated in-sample index,
+                   otherwise RangeIndex of the positions
+        """
+        # Retrieve the frequency of the dated index
+        frequency = self._get_frequency()
+
+        # Anchor the first time step to the closest in-sample time step
+        anchor = min(start, len(self.index) - 1)
+
+        # Switch between periods, dates and positions
+        if isinstance(self.index, pd.PeriodIndex) and frequency is not None:
+            return pd.period_range(self.index[anchor] + (start - anchor) * frequency, periods=steps, freq=frequency)
+
+        if isinstance(self.index, pd.DatetimeIndex) and frequency is not None:
+            return pd.date_range(self.index[anchor] + (start - anchor) * frequency, periods=steps, freq=frequency)
+
+        if isinstance(self.index, pd.RangeIndex):
+            return pd.RangeIndex(self.index.start + start * self.index.step,
+                                 self.index.start + (start + steps) * self.index.step,
+                                 self.index.step)
+
+        return pd.RangeIndex(start, start + steps)
@@ -0,0 +1,190 @@
+"""
+The module contains util functions for computing the autocorrelation (ACF) and the partial autocorrelation (PACF)
+of all the series of a wide panel in one batched call and for proposing their significant lags
+"""
+# Import Standard Libraries
+import os
+from pathlib import Path
+from statistics import NormalDist
+from typing import List, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+
+# Setup logger
+logger = get_logger(os.path.basename(__file__).split('.')[0],
+                    Path(__file__).parents[1] /
+                    'logging_module' /
+                    'log_configuration.yaml')
+
+# Define the accepted correlation methods
+CORRELATION_METHODS = ['acf', 'pacf']
+
+
+def compute_acf(values: Union[np.ndarray, pd.DataFrame],
+                n_lags: int) -> np.ndarray:
+    """
+    Compute the autocorrelation of each series up to n_lags through the FFT of the zero-padded series,
+    as the biased estimator of Statsmodels 'acf'. The missing values are set to the mean of the series
+
+    Args:
+        values: NumPy array or Pandas DataFrame of shape (time steps, series)
+        n_lags: Integer maximum lag
+
+    Returns:
+        acf: NumPy array of shape (n_lags + 1, series), NaN for the constant series
+    """
+    # Centre the series, setting the missing values to 0 (the series without values are set to 0 first)
+    values = np.asarray(values, dtype=np.float64)
+    values = values.reshape(len(values), -1)
+    observed = ~np.isnan(values)
+    centred = np.where(observed, values - np.nanmean(np.where(observed.any(axis=0), values, 0.0), axis=0), 0.0)
+
+    # Compute the autocovariances as the inverse FFT of the power spectrum, padded to avoid circular overlaps
+    n_fft = 1 << (2 * len(values) - 1).bit_length()
+    spectrum = np.fft.rfft(centred, n=n_fft, axis=0)
+    autocovariances = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=n_fft, axis=0)[:n_lags + 1]
+
+    # Normalise by the variance
+    return np.divide(autocovariances, autocovariances[0],
+                     out=np.full(autocovariances.shape, np.nan),
+                     where=autocovariances[0] > 0)
+
+
+def compute_pacf(acf: np.ndarray) -> np.ndarray:
+    """
+    Compute the partial autocorrelation of each series from its autocorrelation with the
+    Durbin-Levinson recursion, updating all the series at once (as the Statsmodels 'pacf' with method 'ldb')
+
+    Args:
+        acf: NumPy array of shape (n_lags + 1, series) of autocorrelations (see compute_acf)
+
+    Returns:
+        pacf: NumPy array of shape (n_lags + 1, series)
+    """
+    # Initialise the coefficients of the autoregression and the prediction error variance
+    n_lags = len(acf) - 1
+    pacf = np.empty(acf.shape)
+    pacf[0] = 1.0
+    coefficients = np.zeros((n_lags,) + acf.shape[1:])
+    variance = np.ones(acf.shape[1:])
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+
+        for lag in range(1, n_lags + 1):
+
+            # Compute the reflection coefficient of the lag
+            reflection = (acf[lag] - np.sum(coefficients[:lag - 1] * acf[lag - 1:0:-1], axis=0)) / variance
+
+            # Update the coefficients of the autoregression of order lag
+            coefficients[:lag - 1] = coefficients[:lag - 1] - reflection * coefficients[:lag - 1][::-1]
+            coefficients[lag - 1] = reflection
+            variance = variance * (1 - reflection ** 2)
+            pacf[lag] = reflection
+
+    return pacf
+
+
+def select_significant_lags(correlations: np.ndarray,
+                            n_observations: Union[int, np.ndarray],
+                            alpha: float = 0.05,
+                            max_lags: int = None) -> List[List[int]]:
+    """
+    Select the lags of each series whose correlation lies outside the white-noise
+    confidence band +-z(1 - alpha / 2) / sqrt(n), as the band of the ACF and PACF plots
+
+    Args:
+        correlations: NumPy array of shape (n_lags + 1, series) of ACF or PACF values
+        n_observations: Integer or NumPy array of shape (series,) of available values of each series
+        alpha: Float significance level of the band
+        max_lags: Integer maximum number of lags per series, keeping the strongest ones (None for all)
+
+    Returns:
+        significant_lags: List of sorted lists of integer lags, one per series
+    """
+    # Compute the band of each series (infinite for the series without values)
+    with np.errstate(divide='ignore'):
+        band = NormalDist().inv_cdf(1 - alpha / 2) / np.sqrt(np.asarray(n_observations, dtype=np.float64))
+
+    # Compare the absolute correlations with the band
+    strengths = np.abs(np.nan_to_num(correlations[1:], nan=0.0))
+    significant = strengths > band
+
+    # Keep the strongest lags of each series
+    significant_lags = []
+
+    for series in range(correlations.shape[1]):
+
+        lags = np.flatnonzero(significant[:, series])
+        lags = lags[np.argsort(-strengths[lags, series], kind='stable')[:max_lags]]
+        significant_lags.append(sorted(int(lag) + 1 for lag in lags))
+
+    return significant_lags
+
+
+def propose_lags(data: pd.DataFrame,
+                 n_lags: int,
+                 method: str = 'pacf',
+                 alpha: float = 0.05,
+                 max_lags: int = None) -> pd.Series:
+    """
+    Propose the significant lags of each series of a wide panel (e.g. for add_lag_feature),
+    computing the ACF or the PACF of all the series in one batched call
+
+    Args:
+        data: Pandas DataFrame with one column per series and the time steps sorted
+        n_lags: Integer maximum lag
+        method: String correlation method (accepted values: CORRELATION_METHODS)
+        alpha: Float significance level of the band
+        max_lags: Integer maximum number of lags per series (None for all)
+
+    Returns:
+        proposed_lags: Pandas Series of lists of integer lags indexed by series
+    """
+    logger.info('propose_lags - Start')
+
+    # Check the method and the lags
+    if method not in CORRELATION_METHODS:
+
+        raise ValueError(f'propose_lags - Method must be in {CORRELATION_METHODS}')
+
+    if not 0 < n_lags < len(data):
+
+        raise ValueError('propose_lags - The maximum lag must be positive and shorter than the series')
+
+    logger.info('propose_lags - Series: %s | Lags: %s | Method: %s', data.shape[1], n_lags, method)
+
+    # Compute the correlations of all the series
+    correlations = compute_acf(data, n_lags)
+
+    if method == 'pacf':
+        correlations = compute_pacf(correlations)
+
+    # Select the significant lags
+    proposed_lags = pd.Series(select_significant_lags(correlations, data.notna().sum().to_numpy(), alpha, max_lags),
+                              index=data.columns,
+                              name='lags')
+
+    logger.info('propose_lags - End')
+
+    return proposed_lags
+
+
+def select_panel_lags(proposed_lags: pd.Series,
+                      min_share: float = 0.5) -> List[int]:
+    """
+    Select the lags proposed for at least a share of the series, as a single lag set for the panel
+
+    Args:
+        proposed_lags: Pandas Series of lists of integer lags indexed by series (see propose_lags)
+        min_share: Float minimum share of the series proposing a lag
+
+    Returns:
+        panel_lags: Sorted list of integer lags
+    """
+    # Count the series proposing each lag
+    lag_counts = proposed_lags.explode().dropna().value_counts()
+
+    return sorted(int(lag) for lag in lag_counts.index[lag_counts >= min_share * len(proposed_lags)])
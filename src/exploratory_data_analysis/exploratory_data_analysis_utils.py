@@ -2,21 +2,27 @@
 The module contains several util functions for performing exploratory data analysis.
 """
 # Import Standard Libraries
+from __future__ import annotations
 import os
 import math
 from pathlib import Path
-from typing import Tuple, Union
+from typing import TYPE_CHECKING, Tuple, Union
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.offsetbox import AnchoredText
-from scipy.signal import periodogram
 import pandas as pd
-import seaborn as sns
 
 # Import Package Modules
+from src.general_utils.general_utils import LazyModule
 from src.logging_module.logging_module import get_logger
 
+# Import plotting and signal libraries lazily
+if TYPE_CHECKING:
+    import matplotlib
+
+plt = LazyModule('matplotlib.pyplot')
+offsetbox = LazyModule('matplotlib.offsetbox')
+scipy_signal = LazyModule('scipy.signal')
+sns = LazyModule('seaborn')
+
 # Setup logger
 logger = get_logger(os.path.basename(__file__).split('.')[0],
                     Path(__file__).parents[1] /
@@ -298,7 +304,7 @@ def plot_single_lag(data: pd.Series,
                      ax=ax)
 
     # Plot the correlation
-    at = AnchoredText(
+    at = offsetbox.AnchoredText(
         f"{corr:.2f}",
         prop={'size': 'large'},
         frameon=True,
@@ -543,11 +549,11 @@ def plot_periodgram(data: pd.DataFrame,
 
     # Compute frequency and spectrum
     frequency_value = pd.Timedelta("365D") / pd.Timedelta("1D")
-    frequencies, spectrum = periodogram(time_series,
-                                        fs=frequency_value,
-                                        detrend='linear',
-                                        window='boxcar',
-                                        scaling='spectrum')
+    frequencies, spectrum = scipy_signal.periodogram(time_series,
+                                                     fs=frequency_value,
+                                                     detrend='linear',
+                                                     window='boxcar',
+                                                     scaling='spectrum')
 
     # Define the plot
     _, ax_periodgram = plt.subplots()
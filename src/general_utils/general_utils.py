@@ -3,7 +3,15 @@ The module contains several general util functions
 """
 # Import Standard Libraries
 import os
+import json
+import hashlib
+import operator
+import importlib.util
+import threading
+import tomllib
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any, Callable, Iterator, Union
 import pandas as pd
 import yaml
 
@@ -16,16 +24,213 @@ logger = get_logger(os.path.basename(__file__).split('.')[0],
                     'logging_module' /
                     'log_configuration.yaml')
 
+# Define the accepted filter operators
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, value: column.isin(value),
+    'not in': lambda column, value: ~column.isin(value)
+}
+
+# Define the accepted cache formats with their file extension
+CACHE_FORMATS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'pickle': '.pkl'
+}
+
+
+class LazyModule:
+    """
+    The class implements a placeholder for a heavy dependency (e.g. matplotlib, xgboost),
+    which is imported only at the first attribute access instead of at import time
+
+    Attributes:
+        module_name: String name of the module to import
+    """
+
+    def __init__(self,
+                 module_name: str):
+        """
+        Constructor for the LazyModule class
+
+        Args:
+            module_name: String name of the module to import (e.g. 'matplotlib.pyplot')
+        """
+        self.module_name = module_name
+        self._module = None
+
+    def __getattr__(self, attribute: str) -> Any:
+        """
+        Import the module at the first access and return the requested attribute
+
+        Args:
+            attribute: String attribute name
+
+        Returns:
+            value: Attribute of the imported module
+        """
+        # Import the module the first time
+        if self._module is None:
+            self._module = importlib.import_module(self.module_name)
+
+        return getattr(self._module, attribute)
+
+    def __repr__(self) -> str:
+        return f'LazyModule({self.module_name!r}, imported={self._module is not None})'
+
+
+# Initialise the cache of the parsed configurations and its lock
+CONFIGURATION_CACHE = {}
+CONFIGURATION_CACHE_LOCK = threading.Lock()
+
+
+class ImmutableConfiguration(Mapping):
+    """
+    The class implements a read-only view of a parsed configuration,
+    which can be safely shared across threads and pickled to worker processes.
+    Nested dictionaries are ImmutableConfiguration and lists are tuples.
+    """
+
+    def __init__(self,
+                 configuration: dict):
+        """
+        Constructor for the ImmutableConfiguration class
+
+        Args:
+            configuration: Dictionary configuration to freeze
+        """
+        self._configuration = {key: freeze_configuration(value) for key, value in configuration.items()}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._configuration[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._configuration)
+
+    def __len__(self) -> int:
+        return len(self._configuration)
+
+    def __repr__(self) -> str:
+        return f'ImmutableConfiguration({self._configuration!r})'
+
+
+def freeze_configuration(configuration: Any) -> Any:
+    """
+    Recursively convert dictionaries into ImmutableConfiguration and lists into tuples
+
+    Args:
+        configuration: Parsed configuration value
+
+    Returns:
+        frozen_configuration: Immutable configuration value
+    """
+    # Switch between mappings, lists and scalars
+    if isinstance(configuration, Mapping):
+        return configuration if isinstance(configuration, ImmutableConfiguration) \
+            else ImmutableConfiguration(configuration)
+
+    if isinstance(configuration, (list, tuple)):
+        return tuple(freeze_configuration(value) for value in configuration)
+
+    return configuration
+
+
+def thaw_configuration(configuration: Any) -> Any:
+    """
+    Recursively convert an immutable configuration back into mutable dictionaries and lists
+
+    Args:
+        configuration: Immutable configuration value
+
+    Returns:
+        mutable_configuration: Mutable configuration value
+    """
+    # Switch between mappings, tuples and scalars
+    if isinstance(configuration, Mapping):
+        return {key: thaw_configuration(value) for key, value in configuration.items()}
+
+    if isinstance(configuration, tuple):
+        return [thaw_configuration(value) for value in configuration]
+
+    return configuration
+
+
+def load_configuration(file_name: Union[str, Path],
+                       environment: str = None) -> ImmutableConfiguration:
+    """
+    Load a YAML or TOML configuration file from the 'configuration' folder as an immutable view,
+    parsing it only once until the file modification time or size changes
+
+    Args:
+        file_name: String configuration file name (or absolute pathlib.Path) to load
+        environment: String top-level section to return (e.g. 'eda' in 'store_sales_config.toml')
+
+    Returns:
+        configuration: ImmutableConfiguration of the file (or of its environment section)
+    """
+    # Retrieve the configuration path
+    configuration_path = Path(__file__).parents[2] / 'configuration' / file_name
+
+    try:
+
+        # Retrieve the file version
+        configuration_stat = configuration_path.stat()
+
+    except FileNotFoundError as exc:
+
+        raise FileNotFoundError(f'load_configuration - File {file_name} not found') from exc
+
+    # Retrieve the cache key and file version
+    cache_key = configuration_path.resolve().as_posix()
+    file_version = (configuration_stat.st_mtime_ns, configuration_stat.st_size)
+
+    with CONFIGURATION_CACHE_LOCK:
+
+        # Parse the file if not cached or changed
+        if cache_key not in CONFIGURATION_CACHE or CONFIGURATION_CACHE[cache_key][0] != file_version:
+
+            logger.info('load_configuration - Parsing %s', configuration_path.as_posix())
+
+            # Switch between TOML and YAML parsers
+            if configuration_path.suffix == '.toml':
+                with open(configuration_path, 'rb') as config_file:
+                    configuration = tomllib.load(config_file)
+            else:
+                with open(configuration_path, encoding='utf-8') as config_file:
+                    configuration = yaml.safe_load(config_file.read())
+
+            CONFIGURATION_CACHE[cache_key] = (file_version, freeze_configuration(configuration or {}))
+
+        configuration = CONFIGURATION_CACHE[cache_key][1]
+
+    return configuration if environment is None else configuration[environment]
+
+
+def clear_configuration_cache():
+    """
+    Clear the cache of the parsed configurations
+
+    Returns:
+    """
+    with CONFIGURATION_CACHE_LOCK:
+        CONFIGURATION_CACHE.clear()
+
 
 def read_configuration(file_name: str) -> dict:
     """
-    Read and return the specified configuration file from the 'configuration' folder
+    Read and return the specified configuration file from the 'configuration' folder,
+    served from the cache of 'load_configuration'
 
     Args:
         file_name: String configuration file name to read
 
     Returns:
-        configuration: Dictionary configuration
+        configuration: Dictionary configuration (a mutable copy owned by the caller)
     """
 
     logger.info('read_configuration - Start')
@@ -35,10 +240,7 @@ def read_configuration(file_name: str) -> dict:
         logger.info('read_configuration - Reading %s', file_name)
 
         # Read configuration file
-        with open(Path(__file__).parents[2] / 'configuration' / file_name,
-                  encoding='utf-8') as config_file:
-
-            configuration = yaml.safe_load(config_file.read())
+        configuration = thaw_configuration(load_configuration(file_name))
 
     except FileNotFoundError as exc:
 
@@ -83,14 +285,299 @@ def build_path_from_list(path_list: list) -> Path:
     return absolute_path
 
 
+def build_read_csv_arguments(data_config: dict) -> dict:
+    """
+    Build the arguments of 'pd.read_csv' from a dictionary configuration with structure
+
+        <data_config_name>:
+            data_path: list[str]
+            date_columns: list[str] (optional)
+            delimiter: str
+            usecols: list[str] (optional)
+            dtype: dict[str, str] (optional)
+            csv_engine: str (optional)
+
+    Args:
+        data_config: Dictionary of data configuration
+
+    Returns:
+        read_csv_arguments: Dictionary of 'pd.read_csv' arguments
+    """
+    # Initialise arguments
+    read_csv_arguments = {'sep': data_config['delimiter']}
+
+    # Add optional arguments
+    if 'date_columns' in data_config.keys():
+        read_csv_arguments['parse_dates'] = list(data_config['date_columns'])
+
+    if 'usecols' in data_config.keys():
+        read_csv_arguments['usecols'] = list(data_config['usecols'])
+
+    if 'dtype' in data_config.keys():
+        read_csv_arguments['dtype'] = dict(data_config['dtype'])
+
+    if 'csv_engine' in data_config.keys():
+        read_csv_arguments['engine'] = data_config['csv_engine']
+
+    return read_csv_arguments
+
+
+def resolve_cache_format(cache_format: str) -> str:
+    """
+    Check the cache format, falling back to pickle if pyarrow is not installed
+
+    Args:
+        cache_format: String cache format (accepted values: CACHE_FORMATS keys)
+
+    Returns:
+        cache_format: String cache format available in the environment
+    """
+    if cache_format not in CACHE_FORMATS:
+
+        raise ValueError(f'resolve_cache_format - Unrecognised cache format {cache_format}')
+
+    # Fall back to pickle if pyarrow is not installed
+    if cache_format != 'pickle' and importlib.util.find_spec('pyarrow') is None:
+
+        logger.warning('resolve_cache_format - pyarrow not installed, falling back to pickle cache')
+
+        cache_format = 'pickle'
+
+    return cache_format
+
+
+def write_cache(data: pd.DataFrame,
+                cache_path: Path,
+                cache_format: str):
+    """
+    Write the data into the cache atomically, so that concurrent readers never see a partial file
+
+    Args:
+        data: Pandas DataFrame to cache
+        cache_path: pathlib.Path of the cached data
+        cache_format: String cache format (accepted values: CACHE_FORMATS keys)
+
+    Returns:
+    """
+    # Write a temporary file and rename it
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    getattr(data, f'to_{cache_format}')(temporary_path)
+    os.replace(temporary_path, cache_path)
+
+
+def build_cache_path(data_path: Path,
+                     data_config: dict) -> Path:
+    """
+    Build the path of the cached parsed data, keyed on the data path, its
+    modification time and size and the read arguments of the data configuration
+
+    Args:
+        data_path: pathlib.Path of the CSV file
+        data_config: Dictionary of data configuration
+
+    Returns:
+        cache_path: pathlib.Path of the cached data
+    """
+    # Retrieve the cache format
+    cache_format = resolve_cache_format(data_config.get('cache_format', 'parquet'))
+
+    # Build the cache key
+    data_stat = data_path.stat()
+    cache_key = json.dumps({'data_path': data_path.resolve().as_posix(),
+                            'mtime_ns': data_stat.st_mtime_ns,
+                            'size': data_stat.st_size,
+                            'read_csv_arguments': build_read_csv_arguments(data_config)},
+                           sort_keys=True,
+                           default=str)
+
+    # Build the cache path
+    cache_folder = build_path_from_list(data_config.get('cache_folder', ['data', 'cache']))
+    cache_hash = hashlib.sha1(cache_key.encode('utf-8')).hexdigest()[:16]
+
+    return cache_folder / f'{data_path.stem}_{cache_hash}{CACHE_FORMATS[cache_format]}'
+
+
+def read_csv_with_cache(data_path: Path,
+                        data_config: dict) -> pd.DataFrame:
+    """
+    Read a CSV file serving the parsed data from the columnar cache when available,
+    otherwise parse it and write it into the cache
+
+    Args:
+        data_path: pathlib.Path of the CSV file
+        data_config: Dictionary of data configuration
+
+    Returns:
+        data: Pandas DataFrame read from the cache or from the CSV file
+    """
+    # Build the cache path
+    cache_path = build_cache_path(data_path, data_config)
+    cache_format = next(cache_format for cache_format, extension in CACHE_FORMATS.items()
+                        if cache_path.suffix == extension)
+
+    # Serve the data from the cache
+    if cache_path.exists():
+
+        logger.info('read_csv_with_cache - Cache hit %s', cache_path.as_posix())
+
+        return getattr(pd, f'read_{cache_format}')(cache_path)
+
+    logger.info('read_csv_with_cache - Cache miss, parsing %s', data_path.as_posix())
+
+    # Parse the CSV file
+    data = pd.read_csv(data_path, **build_read_csv_arguments(data_config))
+
+    # Write the cache
+    write_cache(data, cache_path, cache_format)
+
+    logger.info('read_csv_with_cache - Cached data in %s', cache_path.as_posix())
+
+    return data
+
+
+def filter_data(data: pd.DataFrame,
+                filters: list) -> pd.DataFrame:
+    """
+    Filter the rows of a DataFrame matching all the filter predicates
+
+    Args:
+        data: Pandas DataFrame to filter
+        filters: List of [column, operator, value] predicates
+                 (accepted operators: ['==', '!=', '<', '<=', '>', '>=', 'in', 'not in'])
+
+    Returns:
+        data: Pandas DataFrame with the matching rows
+    """
+    # Initialise the mask
+    mask = pd.Series(True, index=data.index)
+
+    for column, filter_operator, value in filters:
+
+        # Check the operator
+        if filter_operator not in FILTER_OPERATORS:
+
+            raise ValueError(f'filter_data - Unrecognised filter operator {filter_operator}')
+
+        # Combine the predicate with the mask
+        mask &= FILTER_OPERATORS[filter_operator](data[column], value)
+
+    return data[mask]
+
+
+def optimize_memory(data: pd.DataFrame,
+                    optimize_config: dict) -> pd.DataFrame:
+    """
+    Reduce the memory of a DataFrame from a dictionary configuration with structure
+
+        optimize_memory:
+            categorical_columns: list[str] (optional)
+            downcast_integers: bool (optional, e.g. int64 to int8/int16/int32)
+            downcast_floats: bool (optional, float64 to float32)
+            string_storage: str (optional, storage of the remaining object columns, e.g. 'pyarrow')
+
+    Args:
+        data: Pandas DataFrame to optimize
+        optimize_config: Dictionary of memory optimization configuration
+
+    Returns:
+        data: Pandas DataFrame with optimized dtypes
+    """
+    logger.info('optimize_memory - Start')
+
+    # Initialise the optimized columns
+    optimized_columns = {}
+
+    # Convert categorical columns
+    for column in optimize_config.get('categorical_columns', []):
+        optimized_columns[column] = data[column].astype('category')
+
+    # Downcast numeric columns
+    if optimize_config.get('downcast_integers', False):
+        for column in data.select_dtypes(include='integer').columns.difference(optimized_columns):
+            optimized_columns[column] = pd.to_numeric(data[column], downcast='integer')
+
+    if optimize_config.get('downcast_floats', False):
+        for column in data.select_dtypes(include='floating').columns.difference(optimized_columns):
+            optimized_columns[column] = pd.to_numeric(data[column], downcast='float')
+
+    # Convert the remaining object columns to strings
+    if 'string_storage' in optimize_config.keys():
+
+        string_storage = optimize_config['string_storage']
+
+        # Fall back to Python strings if pyarrow is not installed
+        if string_storage == 'pyarrow' and importlib.util.find_spec('pyarrow') is None:
+
+            logger.warning('optimize_memory - pyarrow not installed, falling back to python strings')
+
+            string_storage = 'python'
+
+        for column in data.select_dtypes(include='object').columns.difference(optimized_columns):
+            optimized_columns[column] = data[column].astype(pd.StringDtype(string_storage))
+
+    logger.info('optimize_memory - Optimized %s columns', len(optimized_columns))
+
+    logger.info('optimize_memory - End')
+
+    # Rebuild the DataFrame without copying the unchanged columns
+    return pd.DataFrame({column: optimized_columns.get(column, data[column]) for column in data.columns},
+                        index=data.index,
+                        copy=False)
+
+
+def compare_memory_usage(data: pd.DataFrame,
+                         optimized_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Report the memory usage of each column before and after the optimization
+
+    Args:
+        data: Pandas DataFrame before the optimization
+        optimized_data: Pandas DataFrame after the optimization
+
+    Returns:
+        memory_report: Pandas DataFrame with dtypes and bytes before and after, with a 'total' row
+    """
+    logger.info('compare_memory_usage - Start')
+
+    # Compute the memory usage of each column
+    memory_report = pd.DataFrame({
+        'dtype_before': data.dtypes.astype(str),
+        'dtype_after': optimized_data.dtypes.astype(str),
+        'bytes_before': data.memory_usage(index=False, deep=True),
+        'bytes_after': optimized_data.memory_usage(index=False, deep=True)
+    })
+
+    # Add the total row
+    memory_report.loc['total'] = ['', '',
+                                  memory_report['bytes_before'].sum(),
+                                  memory_report['bytes_after'].sum()]
+
+    logger.info('compare_memory_usage - Memory from %s to %s bytes',
+                memory_report.loc['total', 'bytes_before'],
+                memory_report.loc['total', 'bytes_after'])
+
+    logger.info('compare_memory_usage - End')
+
+    return memory_report
+
+
 def read_data_from_config(data_config: dict) -> pd.DataFrame:
     """
     Read data as a Panda DataFrame from a dictionary configuration with structure
 
         <data_config_name>:
             data_path: list[str]
-            date_columns: list[str]
+            date_columns: list[str] (optional)
             delimiter: str
+            usecols: list[str] (optional)
+            dtype: dict[str, str] (optional)
+            filters: list[[column, operator, value]] (optional)
+            csv_engine: str (optional, e.g. 'c' or 'pyarrow')
+            cache: bool (optional, serve the parsed data from a columnar cache)
+            cache_folder: list[str] (optional, default ['data', 'cache'])
+            cache_format: str (optional, accepted values: ['parquet', 'feather', 'pickle'])
+            optimize_memory: dict (optional, see 'optimize_memory')
 
     Args:
         data_config: Dictionary of data configuration
@@ -113,23 +600,21 @@ def read_data_from_config(data_config: dict) -> pd.DataFrame:
 
     logger.info('read_data_from_config - Retrieved data path %s', data_path.as_posix())
 
-    # Switch if date columns have to be parsed
-    if 'date_columns' in data_config.keys():
-
-        logger.info('read_data_from_config - Reading data with date columns')
-
-        # Read data with Pandas
-        data = pd.read_csv(data_path,
-                           sep=data_config['delimiter'],
-                           parse_dates=data_config['date_columns'])
+    logger.info('read_data_from_config - Reading data')
 
+    # Switch between cached and direct read
+    if data_config.get('cache', False):
+        data = read_csv_with_cache(data_path, data_config)
     else:
+        data = pd.read_csv(data_path, **build_read_csv_arguments(data_config))
 
-        logger.info('read_data_from_config - Reading data without date columns')
+    # Filter data
+    if 'filters' in data_config.keys():
+        data = filter_data(data, data_config['filters'])
 
-        # Read data with Pandas
-        data = pd.read_csv(data_path,
-                           sep=data_config['delimiter'])
+    # Optimize memory
+    if 'optimize_memory' in data_config.keys():
+        data = optimize_memory(data, data_config['optimize_memory'])
 
     logger.info('read_data_from_config - Successfully read data with %s rows and %s columns',
                 len(data), len(data.columns))
@@ -137,3 +622,109 @@ def read_data_from_config(data_config: dict) -> pd.DataFrame:
     logger.info('read_data_from_config - End')
 
     return data
+
+
+def read_data_chunks_from_config(data_config: dict) -> Iterator[pd.DataFrame]:
+    """
+    Stream data as Pandas DataFrame chunks from a dictionary configuration with structure
+
+        <data_config_name>:
+            data_path: list[str]
+            date_columns: list[str] (optional)
+            delimiter: str
+            chunksize: int
+            usecols: list[str] (optional)
+            dtype: dict[str, str] (optional)
+            filters: list[[column, operator, value]] (optional)
+            csv_engine: str (optional, 'pyarrow' does not support chunks)
+            optimize_memory: dict (optional, see 'optimize_memory')
+
+    Args:
+        data_config: Dictionary of data configuration
+
+    Returns:
+        chunks: Iterator of Pandas DataFrame chunks, filtered by the configured predicates
+    """
+
+    logger.info('read_data_chunks_from_config - Start')
+
+    # Retrieve data path
+    data_path = build_path_from_list(data_config['data_path'])
+
+    # Check if the data_path exists
+    if not data_path.exists():
+
+        raise FileNotFoundError(f'read_data_chunks_from_config - {data_path} not found')
+
+    # Check the CSV engine supports the chunks
+    if data_config.get('csv_engine') == 'pyarrow':
+
+        raise ValueError('read_data_chunks_from_config - The pyarrow CSV engine does not support chunksize, '
+                         'use the c or python engine')
+
+    logger.info('read_data_chunks_from_config - Streaming %s in chunks of %s rows',
+                data_path.as_posix(), data_config['chunksize'])
+
+    return _stream_chunks(data_path, data_config)
+
+
+def _stream_chunks(data_path: Path,
+                   data_config: dict) -> Iterator[pd.DataFrame]:
+    """
+    Stream the filtered chunks of a CSV file, logging the end of the read once the stream is exhausted
+
+    Args:
+        data_path: pathlib.Path of the CSV file
+        data_config: Dictionary of data configuration
+
+    Returns:
+        chunks: Iterator of Pandas DataFrame chunks
+    """
+    # Stream the chunks
+    with pd.read_csv(data_path,
+                     chunksize=data_config['chunksize'],
+                     **build_read_csv_arguments(data_config)) as reader:
+
+        for chunk in reader:
+
+            # Filter the chunk
+            if 'filters' in data_config.keys():
+                chunk = filter_data(chunk, data_config['filters'])
+
+            # Optimize the chunk memory
+            if 'optimize_memory' in data_config.keys():
+                chunk = optimize_memory(chunk, data_config['optimize_memory'])
+
+            yield chunk
+
+    logger.info('read_data_chunks_from_config - End')
+
+
+def reduce_data_from_config(data_config: dict,
+                            reduce_function: Callable[[Any, pd.DataFrame], Any],
+                            initial: Any = None) -> Any:
+    """
+    Reduce the data chunks streamed from a dictionary configuration on the fly,
+    without holding the whole data in memory
+
+    Args:
+        data_config: Dictionary of data configuration (see 'read_data_chunks_from_config')
+        reduce_function: Callable with signature (accumulated, chunk) returning the new accumulated value
+        initial: Initial accumulated value
+
+    Returns:
+        accumulated: Value accumulated over all the chunks
+    """
+
+    logger.info('reduce_data_from_config - Start')
+
+    # Initialise the accumulated value
+    accumulated = initial
+
+    # Reduce the chunks
+    for chunk in read_data_chunks_from_config(data_config):
+        accumulated = reduce_function(accumulated, chunk)
+
+    logger.info('reduce_data_from_config - End')
+
+    return accumulated
@@ -3,15 +3,129 @@ This module implements a Logger object to
 log information according to the configuration file
 """
 # Import Standard Libraries
+import atexit
 import logging.config
+import logging.handlers
 import pathlib
+import queue
+import threading
 import yaml
 
+# Initialise the configured files, the logger registry and the queue listeners
+CONFIGURED_FILES = set()
+LOGGER_REGISTRY = {}
+QUEUE_LISTENERS = []
+LOGGING_LOCK = threading.RLock()
+
+
+def configure_logging(configuration_file_path: pathlib.Path,
+                      use_queue: bool = False):
+    """
+    Set the configuration for the logging module only once per configuration file.
+    Optionally, route the records of the configured loggers through a queue,
+    so that the callers never block on the handlers I/O (e.g. stdout)
+
+    Args:
+        configuration_file_path: pathlib.Path location of the configuration file
+        use_queue: Bool to emit the records through QueueHandler and QueueListener
+
+    Returns:
+    """
+    if not configuration_file_path.exists():
+
+        raise FileNotFoundError(
+            f'configure_logging - File {configuration_file_path.as_posix()} not found'
+        )
+
+    with LOGGING_LOCK:
+
+        # Set the logging configuration only the first time
+        configuration_key = configuration_file_path.resolve().as_posix()
+
+        if configuration_key not in CONFIGURED_FILES:
+
+            # Read the log_configuration file
+            with open(configuration_file_path, 'r', encoding='utf-8') as file:
+                log_config = yaml.safe_load(file.read())
+
+            # Set logging configuration file
+            logging.config.dictConfig(log_config)
+
+            CONFIGURED_FILES.add(configuration_key)
+
+        # Switch to the queue mode
+        if use_queue and not QUEUE_LISTENERS:
+            _start_queue_listeners()
+
+
+def _start_queue_listeners():
+    """
+    Replace the handlers of every logger with a QueueHandler and move them into
+    a QueueListener thread, one per distinct set of handlers
+
+    Returns:
+    """
+    # Group the loggers by their handlers
+    loggers = [logging.getLogger()] + [logger for logger in logging.Logger.manager.loggerDict.values()
+                                       if isinstance(logger, logging.Logger)]
+    queue_handlers = {}
+
+    for logger in loggers:
+
+        # Skip loggers without handlers
+        if not logger.handlers:
+            continue
+
+        handlers = tuple(logger.handlers)
+
+        # Start a listener for each new set of handlers
+        if handlers not in queue_handlers:
+
+            record_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+            listener.start()
+
+            QUEUE_LISTENERS.append((listener, handlers))
+            queue_handlers[handlers] = logging.handlers.QueueHandler(record_queue)
+
+        # Replace the handlers with the queue handler
+        logger.handlers = [queue_handlers[handlers]]
+
+
+def stop_queue_logging():
+    """
+    Flush and stop the queue listeners and restore the original handlers of the loggers
+
+    Returns:
+    """
+    with LOGGING_LOCK:
+
+        # Retrieve the queue handlers of each listener
+        restored_handlers = {}
+
+        for listener, handlers in QUEUE_LISTENERS:
+
+            # Stop the listener after emitting the queued records
+            listener.stop()
+            restored_handlers[id(listener.queue)] = list(handlers)
+
+        # Restore the original handlers
+        for logger in [logging.getLogger()] + list(logging.Logger.manager.loggerDict.values()):
+
+            if isinstance(logger, logging.Logger) and logger.handlers \
+                    and isinstance(logger.handlers[0], logging.handlers.QueueHandler) \
+                    and id(logger.handlers[0].queue) in restored_handlers:
+
+                logger.handlers = restored_handlers[id(logger.handlers[0].queue)]
+
+        QUEUE_LISTENERS.clear()
+
 
 def get_logger(logger_name: str,
                configuration_file_path: pathlib.Path) -> logging.Logger:
     """
-    Set the configuration for the logging module and return the requested logger
+    Set the configuration for the logging module (only the first time)
+    and return the requested logger from the registry
 
     Args:
         logger_name: String name of the logger to retrieve from 'log_configuration.yaml' file
@@ -20,23 +134,21 @@ def get_logger(logger_name: str,
     Returns:
         logging.Logger a Logger object
     """
+    # Return the registered logger
+    registry_key = (logger_name, configuration_file_path.as_posix())
 
-    if configuration_file_path.exists():
-
-        # Read the log_configuration file
-        with open(configuration_file_path, 'r', encoding='utf-8') as file:
-            log_config = yaml.safe_load(file.read())
+    if registry_key in LOGGER_REGISTRY:
+        return LOGGER_REGISTRY[registry_key]
 
-        # Set logging configuration file
-        logging.config.dictConfig(log_config)
+    # Set logging configuration file
+    configure_logging(configuration_file_path)
 
-        # Retrieve the requested logger
-        logger = logging.getLogger(logger_name)
+    # Retrieve the requested logger
+    logger = logging.getLogger(logger_name)
+    LOGGER_REGISTRY[registry_key] = logger
 
-    else:
+    return logger
 
-        raise FileNotFoundError(
-            f'get_logger - File {configuration_file_path.as_posix()} not found'
-        )
 
-    return logger
+# Flush the queued records at exit
+atexit.register(stop_queue_logging)
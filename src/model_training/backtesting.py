@@ -0,0 +1,350 @@
+"""
+The module contains the classes for the rolling-origin backtesting of the forecasters,
+which fits and evaluates the folds in parallel processes by slicing precomputed feature matrices
+"""
+# Import Standard Libraries
+from __future__ import annotations
+import copy
+import pathlib
+import warnings
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+from src.model_training.forecast_metrics import FORECAST_METRICS, compute_metrics
+from src.model_training.parallel_training import run_parallel_fits
+
+if TYPE_CHECKING:
+    from src.model_training.model_training import BoostedHybridModel
+
+# Define the accepted windows and the default metrics
+WINDOWS = ['expanding', 'rolling']
+BACKTEST_METRICS = ['rmse', 'mae', 'rmsle', 'mape']
+
+
+def build_cutoffs(n_time_steps: int,
+                  horizon: int,
+                  n_folds: int,
+                  step: int = None,
+                  min_train_size: int = 1) -> np.ndarray:
+    """
+    Build the cutoffs of the folds backwards from the last complete horizon
+
+    Args:
+        n_time_steps: Integer number of time steps
+        horizon: Integer number of forecast time steps of each fold
+        n_folds: Integer number of folds
+        step: Integer number of time steps between two cutoffs (None for the horizon)
+        min_train_size: Integer minimum number of training time steps of the first fold
+
+    Returns:
+        cutoffs: NumPy array of the positions of the first forecast time step of each fold
+    """
+    # Compute the cutoffs from the last one
+    step = horizon if step is None else step
+    cutoffs = n_time_steps - horizon - step * np.arange(n_folds)[::-1]
+
+    # Check the first training window
+    if n_folds < 1 or cutoffs[0] < min_train_size:
+
+        raise ValueError('build_cutoffs - Not enough time steps for the requested folds')
+
+    return cutoffs
+
+
+def _slice_features(trend_values: np.ndarray,
+                    serial_values: np.ndarray,
+                    time_steps: slice,
+                    names: Dict[str, pd.Index]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Slice the trend features and the stacked serial features of a window of time steps,
+    where the serial features of the window are a contiguous block of rows (time step first)
+
+    Args:
+        trend_values: NumPy array of shape (time steps, trend features)
+        serial_values: NumPy array of shape (time steps * series, serial features)
+        time_steps: Slice of the time steps of the window
+        names: Dictionary of the 'trend' and 'serial' column names
+
+    Returns:
+        trend_features: Pandas DataFrame of the trend features of the window
+        serial_features: Pandas DataFrame of the serial features of the window
+    """
+    # Retrieve the number of stacked rows per time step
+    n_series = len(serial_values) // len(trend_values)
+
+    return (pd.DataFrame(trend_values[time_steps], columns=names['trend']),
+            pd.DataFrame(serial_values[time_steps.start * n_series:time_steps.stop * n_series],
+                         columns=names['serial']))
+
+
+def _run_fold(fold: int,
+              forecaster: BoostedHybridModel,
+              cutoffs: np.ndarray,
+              horizon: int,
+              train_size: Union[int, None],
+              metrics: List[str],
+              seasonality: int,
+              names: Dict[str, pd.Index],
+              trend_values: np.ndarray,
+              serial_values: np.ndarray,
+              y_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a copy of the forecaster on the training window of a fold and evaluate it on the horizon
+
+    Args:
+        fold: Integer index of the fold
+        forecaster: Unfitted forecaster with 'fit(trend_features, serial_features, y)'
+                    and 'predict(trend_features, serial_features)' (e.g. BoostedHybridModel)
+        cutoffs: NumPy array of the positions of the first forecast time step of each fold
+        horizon: Integer number of forecast time steps
+        train_size: Integer number of training time steps of the rolling window (None for the expanding window)
+        metrics: List of string metrics (accepted values: FORECAST_METRICS)
+        seasonality: Integer season length of the naive forecast scaling the MASE
+        names: Dictionary of the 'trend', 'serial' and 'y' column names
+        trend_values: NumPy array of shape (time steps, trend features)
+        serial_values: NumPy array of shape (time steps * series, serial features)
+        y_values: NumPy array of shape (time steps, series)
+
+    Returns:
+        predictions: NumPy array of shape (horizon, series)
+        metrics: NumPy array of shape (metrics, series)
+    """
+    # Retrieve the training and the forecast windows
+    cutoff = int(cutoffs[fold])
+    start = 0 if train_size is None else max(0, cutoff - train_size)
+
+    # Fit a copy of the forecaster on the training window
+    model = copy.deepcopy(forecaster)
+    model.fit(*_slice_features(trend_values, serial_values, slice(start, cutoff), names),
+              pd.DataFrame(y_values[start:cutoff], columns=names['y']))
+
+    # Forecast the horizon
+    predictions = np.asarray(model.predict(*_slice_features(trend_values,
+                                                            serial_values,
+                                                            slice(cutoff, cutoff + horizon),
+                                                            names)),
+                             dtype=np.float64)
+
+    # Evaluate the horizon (the MASE is scaled on the training window)
+    return predictions, compute_metrics(y_values[cutoff:cutoff + horizon],
+                                        predictions,
+                                        metrics,
+                                        y_values[start:cutoff],
+                                        seasonality)
+
+
+class BacktestResult:
+    """
+    The class stores the results of a backtest as compact arrays, with
+    methods to expand them into Pandas DataFrames
+
+    Attributes:
+        cutoffs: Pandas Index of the first forecast time step of each fold
+        series: Pandas Index of the series
+        metric_names: List of string metric names
+        metrics: NumPy array of shape (folds, metrics, series) ordered as 'metric_names'
+        predictions: NumPy array of shape (folds, horizon, series)
+        timing_report: Pandas DataFrame with fold, cutoff, fit seconds and worker process id
+    """
+
+    def __init__(self,
+                 cutoffs: pd.Index,
+                 series: pd.Index,
+                 metric_names: List[str],
+                 metrics: np.ndarray,
+                 predictions: np.ndarray,
+                 timing_report: pd.DataFrame):
+        """
+        Constructor for the BacktestResult class
+
+        Args:
+            cutoffs: Pandas Index of the first forecast time step of each fold
+            series: Pandas Index of the series
+            metric_names: List of string metric names
+            metrics: NumPy array of shape (folds, metrics, series) ordered as 'metric_names'
+            predictions: NumPy array of shape (folds, horizon, series)
+            timing_report: Pandas DataFrame with fold, cutoff, fit seconds and worker process id
+        """
+        self.cutoffs = cutoffs
+        self.series = series
+        self.metric_names = list(metric_names)
+        self.metrics = metrics
+        self.predictions = predictions
+        self.timing_report = timing_report
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Expand the metrics into a DataFrame with one row per fold and series
+
+        Returns:
+            metrics: Pandas DataFrame indexed by cutoff and series with one column per metric
+        """
+        # Build the index of the folds and the series
+        index = pd.MultiIndex.from_product([self.cutoffs, self.series.to_flat_index()], names=['cutoff', 'series'])
+
+        return pd.DataFrame(self.metrics.transpose(0, 2, 1).reshape(-1, len(self.metric_names)),
+                            index=index,
+                            columns=self.metric_names)
+
+    def summary(self,
+                by: str = 'series') -> pd.DataFrame:
+        """
+        Average the metrics over the folds or over the series, skipping the missing metrics
+
+        Args:
+            by: String dimension to keep (accepted values: ['series', 'cutoff'])
+
+        Returns:
+            summary: Pandas DataFrame of average metrics indexed by series or cutoff
+        """
+        # Switch between the dimensions
+        match by:
+            case 'series':
+                axis, index = 0, self.series
+            case 'cutoff':
+                axis, index = 2, self.cutoffs
+            case _:
+                raise ValueError('summary - Unrecognised dimension')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            averages = np.nanmean(self.metrics, axis=axis)
+
+        return pd.DataFrame(averages.T if axis == 0 else averages, index=index, columns=self.metric_names)
+
+
+class RollingOriginBacktest:  # pylint: disable=too-many-instance-attributes
+    """
+    The class implements a rolling-origin (walk-forward) backtest, which fits a copy of the forecaster
+    on the expanding or rolling training window before each cutoff and evaluates the following horizon.
+    The features are computed once for the full range and each fold slices them, while the folds
+    run in parallel worker processes sharing the arrays as memory-mapped files.
+
+    Attributes:
+        forecaster: Unfitted forecaster with 'fit(trend_features, serial_features, y)'
+                    and 'predict(trend_features, serial_features)' (e.g. BoostedHybridModel)
+        horizon: Integer number of forecast time steps of each fold
+        cutoffs: List of integer positions of the first forecast time step of each fold
+        window: String training window (accepted values: WINDOWS)
+        train_size: Integer number of training time steps of the rolling window
+        metrics: List of string metrics computed for each fold and series
+        seasonality: Integer season length of the naive forecast scaling the MASE
+        n_jobs: Integer number of worker processes running the folds
+    """
+
+    def __init__(self,
+                 forecaster: BoostedHybridModel,
+                 horizon: int,
+                 cutoffs: List[int],
+                 window: str = 'expanding',
+                 train_size: int = None,
+                 metrics: List[str] = tuple(BACKTEST_METRICS),
+                 seasonality: int = 1,
+                 n_jobs: int = None):
+        """
+        Constructor for the RollingOriginBacktest class
+
+        Args:
+            forecaster: Unfitted forecaster with 'fit(trend_features, serial_features, y)'
+                        and 'predict(trend_features, serial_features)' (e.g. BoostedHybridModel)
+            horizon: Integer number of forecast time steps of each fold
+            cutoffs: List of integer positions of the first forecast time step of each fold (see build_cutoffs)
+            window: String training window (accepted values: WINDOWS)
+            train_size: Integer number of training time steps of the rolling window
+            metrics: List of string metrics (accepted values: FORECAST_METRICS)
+            seasonality: Integer season length of the naive forecast scaling the MASE (e.g. 7 for daily data)
+            n_jobs: Integer number of worker processes (None or 1 to run sequentially, -1 for all cores)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Check the window
+        if window not in WINDOWS or (window == 'rolling') != (train_size is not None):
+
+            raise ValueError('__init__ - The rolling window requires a train_size, the expanding window does not')
+
+        # Check the metrics
+        if any(metric not in FORECAST_METRICS for metric in metrics):
+
+            raise ValueError(f'__init__ - Metrics must be in {FORECAST_METRICS}')
+
+        # Initialise object attributes
+        self.forecaster = forecaster
+        self.horizon = horizon
+        self.cutoffs = list(cutoffs)
+        self.window = window
+        self.train_size = train_size
+        self.metrics = list(metrics)
+        self.seasonality = seasonality
+        self.n_jobs = n_jobs
+
+    def run(self,
+            trend_features: pd.DataFrame,
+            serial_features: pd.DataFrame,
+            y: pd.DataFrame) -> BacktestResult:
+        """
+        Run all the folds of the backtest
+
+        Args:
+            trend_features: Pandas dataframe containing the trend features of all the time steps
+            serial_features: Pandas dataframe containing numeric serial features of all the time steps,
+                             stacked time step first with the series sorted by label (as 'y.stack()')
+            y: Pandas dataframe containing target values with one column per series
+
+        Returns:
+            result: BacktestResult with the metrics and the predictions of each fold and series
+        """
+        self.logger.info('run - Start')
+
+        # Check the cutoffs and the stacked serial features
+        if min(self.cutoffs) < 1 or max(self.cutoffs) + self.horizon > len(y):
+
+            raise ValueError('run - Each cutoff must leave at least one training and a full horizon of time steps')
+
+        if len(serial_features) != len(y) * y.shape[1]:
+
+            raise ValueError('run - Serial features must have one stacked row per time step and series')
+
+        self.logger.info('run - Folds: %s | Horizon: %s | Window: %s', len(self.cutoffs), self.horizon, self.window)
+
+        # Run the folds in parallel, sharing the data with the workers
+        results, timing_report = run_parallel_fits(
+            partial(_run_fold,
+                    forecaster=self.forecaster,
+                    cutoffs=np.asarray(self.cutoffs),
+                    horizon=self.horizon,
+                    train_size=self.train_size,
+                    metrics=self.metrics,
+                    seasonality=self.seasonality,
+                    names={'trend': trend_features.columns, 'serial': serial_features.columns, 'y': y.columns}),
+            list(range(len(self.cutoffs))),
+            {'trend_values': trend_features.to_numpy(dtype=np.float64),
+             'serial_values': serial_features.to_numpy(dtype=np.float64),
+             'y_values': y.to_numpy(dtype=np.float64)},
+            self.n_jobs
+        )
+
+        # Collect the folds into arrays
+        cutoff_labels = y.index[self.cutoffs]
+        timing_report = timing_report.rename(columns={'step': 'fold'})
+        timing_report.insert(1, 'cutoff', cutoff_labels)
+
+        result = BacktestResult(cutoff_labels,
+                                y.columns,
+                                self.metrics,
+                                np.stack([metrics for _, metrics in results]),
+                                np.stack([predictions for predictions, _ in results]),
+                                timing_report)
+
+        self.logger.info('run - End')
+
+        return result
@@ -0,0 +1,279 @@
+"""
+The module contains the class for fitting simple, Holt and additive Holt-Winters exponential smoothing
+on all the series of a wide panel at once, with the state updates vectorized across the series
+and the smoothing parameters of every series selected from a grid in a single pass over the time steps
+"""
+# Import Standard Libraries
+import pathlib
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.logging_module.logging_module import get_logger
+from src.model_training.statistical_models import build_forecast_index
+
+# Define the accepted smoothing models and the default grids of the smoothing parameters
+SMOOTHING_MODELS = ['simple', 'holt', 'holt_winters']
+SMOOTHING_GRIDS = {
+    'alpha': [0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9],
+    'beta': [0.01, 0.05, 0.1, 0.2, 0.3],
+    'gamma': [0.01, 0.05, 0.1, 0.2, 0.3]
+}
+
+
+def initialise_smoothing_states(y_values: np.ndarray,
+                                model: str,
+                                seasonal_periods: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the initial level, trend and seasonal states of each series with the simple
+    heuristic of Hyndman and Athanasopoulos (as the 'simple' initialization of Statsmodels),
+    starting from the first observed time step of each series as if its leading missing values
+    were trimmed. The states are moved back to the first time step, so that the recursion carries
+    them over the leading missing values and the first observation gets the states of the trimmed series
+
+    Args:
+        y_values: NumPy array of shape (time steps, series)
+        model: String smoothing model (accepted values: SMOOTHING_MODELS)
+        seasonal_periods: Integer number of time steps of a season (used by 'holt_winters')
+
+    Returns:
+        level: NumPy array of shape (series,)
+        trend: NumPy array of shape (series,), zeros without trend
+        seasonals: NumPy array of shape (seasonal periods, series), a row of zeros without seasonality
+    """
+    # Retrieve the first observed time step of each series and the values from it (NaN after the end)
+    first = np.argmax(~np.isnan(y_values), axis=0)
+    n_steps = 2 * seasonal_periods if model == 'holt_winters' else 2
+    values = np.take_along_axis(np.vstack([y_values, np.full((n_steps, y_values.shape[1]), np.nan)]),
+                                first + np.arange(n_steps)[:, None],
+                                axis=0)
+
+    # Initialise the states without seasonality
+    if model != 'holt_winters':
+
+        trend = values[1] - values[0] if model == 'holt' else np.zeros(y_values.shape[1])
+
+        return values[0] - first * trend, trend, np.zeros((1, y_values.shape[1]))
+
+    # Initialise the states from the first two seasons
+    first_season, second_season = values[:seasonal_periods], values[seasonal_periods:]
+    level = np.nanmean(first_season, axis=0)
+    trend = np.nanmean(second_season - first_season, axis=0) / seasonal_periods
+
+    # Rotate the seasonal states, so that the first observation takes the first seasonal state
+    seasonals = np.take_along_axis(first_season - level,
+                                   (np.arange(seasonal_periods)[:, None] - first) % seasonal_periods,
+                                   axis=0)
+
+    return level - first * trend, trend, seasonals
+
+
+def _broadcast_states(states: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                      smoothing_shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Copy the initial states of the series once per value of the smoothing parameters
+
+    Args:
+        states: Tuple of initial level, trend and seasonal states (see initialise_smoothing_states)
+        smoothing_shape: Tuple shape of the smoothing parameters, (grid, 1) or (series,)
+
+    Returns:
+        level: NumPy array broadcast to the smoothing parameters and the series
+        trend: NumPy array broadcast to the smoothing parameters and the series
+        seasonals: NumPy array of shape (seasonal periods,) + the level shape
+    """
+    # Retrieve the shape of the states
+    shape = np.broadcast_shapes(smoothing_shape, states[0].shape)
+
+    return (np.broadcast_to(states[0], shape).copy(),
+            np.broadcast_to(states[1], shape).copy(),
+            np.broadcast_to(states[2][:, None] if len(shape) > 1 else states[2], (len(states[2]),) + shape).copy())
+
+
+def run_smoothing(y_values: np.ndarray,
+                  smoothing: Dict[str, np.ndarray],
+                  states: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                  store_fitted: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Run the additive smoothing recursions in error-correction form over the time steps, updating
+    the states of all the series (and of all the smoothing parameters) at once. The missing values
+    have a zero one-step error, so that their states are carried forward by the forecast
+
+    Args:
+        y_values: NumPy array of shape (time steps, series)
+        smoothing: Dictionary of 'alpha', 'beta' and 'gamma' NumPy arrays broadcastable with the series,
+                   i.e. of shape (grid, 1) to evaluate a grid or of shape (series,) for one value per series
+        states: Tuple of initial level, trend and seasonal states (see initialise_smoothing_states)
+        store_fitted: Boolean flag to store the one-step predictions
+
+    Returns:
+        smoothing_result: Dictionary of the final 'level', 'trend' and 'seasonals', the 'sse' of the
+                          one-step errors and the 'fitted' one-step predictions of shape (time steps, series)
+    """
+    # Broadcast the states to the smoothing parameters
+    level, trend, seasonals = _broadcast_states(states, np.shape(smoothing['alpha']))
+
+    # Precompute the error gain of the trend
+    trend_gain = smoothing['alpha'] * smoothing['beta']
+    sse = np.zeros(level.shape)
+    fitted = np.empty(y_values.shape) if store_fitted else None
+
+    for t, y_step in enumerate(y_values):
+
+        # Compute the one-step prediction and error (zero for the missing values)
+        season = seasonals[t % len(seasonals)]
+        prediction = level + trend + season
+        error = y_step - prediction
+        error[..., np.isnan(y_step)] = 0.0
+        sse += error * error
+
+        if store_fitted:
+            fitted[t] = prediction
+
+        # Update the states
+        level += trend + smoothing['alpha'] * error
+        trend += trend_gain * error
+        season += smoothing['gamma'] * error
+
+    return {'level': level, 'trend': trend, 'seasonals': seasonals, 'sse': sse, 'fitted': fitted}
+
+
+class PanelExponentialSmoothing:  # pylint: disable=too-many-instance-attributes
+    """
+    The class implements simple, Holt (additive trend) and additive Holt-Winters exponential smoothing
+    for all the series of a wide panel at once. The smoothing parameters of each series are selected
+    by minimising the sum of squared one-step errors over the grid, with all the grid combinations
+    and the series updated together in a single loop over the time steps
+
+    Attributes:
+        model: String smoothing model (accepted values: SMOOTHING_MODELS)
+        seasonal_periods: Integer number of time steps of a season
+        grids: Dictionary of the grids of 'alpha', 'beta' and 'gamma' searched by the model
+        params: Pandas DataFrame indexed by series with the selected alpha, beta, gamma and the sse
+        fittedvalues: Pandas DataFrame of one-step predictions with one column per series
+        level: NumPy array of shape (series,) of the final levels
+        trend: NumPy array of shape (series,) of the final trends
+        seasonals: NumPy array of shape (seasonal periods, series) of the final seasonal states
+        index: Pandas Index of the fitted time steps
+    """
+
+    def __init__(self,
+                 model: str = 'holt_winters',
+                 seasonal_periods: int = None,
+                 grids: Dict[str, List[float]] = None):
+        """
+        Constructor for the PanelExponentialSmoothing class
+
+        Args:
+            model: String smoothing model (accepted values: SMOOTHING_MODELS)
+            seasonal_periods: Integer number of time steps of a season (required by 'holt_winters', e.g. 7)
+            grids: Dictionary of the grids of 'alpha', 'beta' and 'gamma' in [0, 1] (None for SMOOTHING_GRIDS)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Check the model and the seasonal periods
+        if model not in SMOOTHING_MODELS:
+
+            raise ValueError(f'__init__ - Model must be in {SMOOTHING_MODELS}')
+
+        if model == 'holt_winters' and (seasonal_periods is None or seasonal_periods < 2):
+
+            raise ValueError('__init__ - The Holt-Winters model requires seasonal_periods of at least 2')
+
+        # Retrieve the grids of the components of the model (the missing components are fixed to 0)
+        grids = {**SMOOTHING_GRIDS, **({} if grids is None else grids)}
+        grids = {'alpha': grids['alpha'],
+                 'beta': grids['beta'] if model != 'simple' else [0.0],
+                 'gamma': grids['gamma'] if model == 'holt_winters' else [0.0]}
+
+        # Check the grids
+        if any(len(grid) == 0 or np.any((np.asarray(grid) < 0) | (np.asarray(grid) > 1)) for grid in grids.values()):
+
+            raise ValueError('__init__ - Grids must be non-empty and within [0, 1]')
+
+        # Initialise object attributes
+        self.model = model
+        self.seasonal_periods = seasonal_periods if model == 'holt_winters' else 1
+        self.grids = grids
+        self.params = None
+        self.fittedvalues = None
+        self.level = None
+        self.trend = None
+        self.seasonals = None
+        self.index = None
+
+    def fit(self,
+            y: pd.DataFrame) -> 'PanelExponentialSmoothing':
+        """
+        Select the smoothing parameters of each series over the grid and compute the final states
+
+        Args:
+            y: Pandas dataframe containing target values with one column per series
+
+        Returns:
+            self: Fitted PanelExponentialSmoothing object instance
+        """
+        self.logger.info('fit - Start')
+
+        # Check the time steps required by the initial states
+        if len(y) < 2 * self.seasonal_periods or len(y) < 2:
+
+            raise ValueError('fit - The initial states require at least two seasons of time steps')
+
+        y_values = y.to_numpy(dtype=np.float64)
+        states = initialise_smoothing_states(y_values, self.model, self.seasonal_periods)
+
+        # Evaluate all the grid combinations at once
+        grid = [combination.reshape(-1, 1) for combination in np.meshgrid(self.grids['alpha'],
+                                                                           self.grids['beta'],
+                                                                           self.grids['gamma'],
+                                                                           indexing='ij')]
+
+        self.logger.info('fit - Series: %s | Time steps: %s | Grid combinations: %s', y.shape[1], len(y), len(grid[0]))
+
+        grid_result = run_smoothing(y_values, dict(zip(['alpha', 'beta', 'gamma'], grid)), states)
+
+        # Select the best combination of each series and rerun it to store the one-step predictions
+        best = np.argmin(np.where(np.isnan(grid_result['sse']), np.inf, grid_result['sse']), axis=0)
+        smoothing = {name: values[best, 0] for name, values in zip(['alpha', 'beta', 'gamma'], grid)}
+        result = run_smoothing(y_values, smoothing, states, store_fitted=True)
+
+        # Store the parameters and the final states
+        self.params = pd.DataFrame({**smoothing, 'sse': result['sse']}, index=y.columns)
+        self.fittedvalues = pd.DataFrame(result['fitted'], index=y.index, columns=y.columns)
+        self.level, self.trend, self.seasonals = result['level'], result['trend'], result['seasonals']
+        self.index = y.index
+
+        self.logger.info('fit - End')
+
+        return self
+
+    def forecast(self,
+                 horizon: int) -> pd.DataFrame:
+        """
+        Forecast the horizon after the last fitted time step from the final states
+
+        Args:
+            horizon: Integer number of forecast time steps
+
+        Returns:
+            forecasts: Pandas DataFrame of forecasts with one column per series
+        """
+        # Check the model is fitted
+        if self.level is None:
+
+            raise ValueError('forecast - The model must be fitted before forecasting')
+
+        # Combine the level, the trend and the seasonal state of the same phase of each step
+        steps = np.arange(1, horizon + 1)
+        forecasts = (self.level + steps[:, None] * self.trend +
+                     self.seasonals[(len(self.index) + steps - 1) % len(self.seasonals)])
+
+        return pd.DataFrame(forecasts, index=build_forecast_index(self.index, horizon), columns=self.params.index)
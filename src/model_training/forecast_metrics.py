@@ -0,0 +1,178 @@
+"""
+The module contains util functions for computing the forecast metrics of all the series of a wide panel at once,
+on 2-D NumPy arrays of shape (time steps, series) skipping the missing values
+"""
+# Import Standard Libraries
+from typing import List, Union
+import numpy as np
+import pandas as pd
+
+# Define the accepted forecast metrics
+FORECAST_METRICS = ['mae', 'rmse', 'rmsle', 'mape', 'smape', 'mase', 'bias']
+
+
+def _to_panel(values: Union[np.ndarray, pd.DataFrame, pd.Series]) -> np.ndarray:
+    """
+    Convert the values into a float64 array of shape (time steps, series)
+
+    Args:
+        values: NumPy array, Pandas DataFrame or Series of values
+
+    Returns:
+        panel: NumPy array of shape (time steps, series)
+    """
+    panel = np.asarray(values, dtype=np.float64)
+
+    return panel.reshape(len(panel), -1) if panel.ndim != 2 else panel
+
+
+def column_nanmean(values: np.ndarray) -> np.ndarray:
+    """
+    Compute the mean of each column skipping the missing values,
+    returning NaN for the columns without available values (without warnings)
+
+    Args:
+        values: NumPy array of shape (time steps, series)
+
+    Returns:
+        means: NumPy array of shape (series,)
+    """
+    # Count and sum the available values
+    available = ~np.isnan(values)
+    counts = available.sum(axis=0)
+    sums = np.where(available, values, 0.0).sum(axis=0)
+
+    return np.divide(sums, counts, out=np.full(values.shape[1], np.nan), where=counts > 0)
+
+
+def compute_seasonal_naive_scale(y_train: Union[np.ndarray, pd.DataFrame],
+                                 seasonality: int = 1) -> np.ndarray:
+    """
+    Compute the in-sample mean absolute error of the seasonal naive forecast of each series,
+    which scales the MASE
+
+    Args:
+        y_train: NumPy array or Pandas DataFrame of shape (time steps, series) of training targets
+        seasonality: Integer season length of the naive forecast (1 for the naive forecast)
+
+    Returns:
+        scale: NumPy array of shape (series,), NaN where the scale is missing or 0
+    """
+    # Compute the errors of the seasonal naive forecast
+    y_train = _to_panel(y_train)
+    scale = column_nanmean(np.abs(y_train[seasonality:] - y_train[:-seasonality]))
+
+    return np.where(scale > 0, scale, np.nan)
+
+
+def compute_metrics(y_true: Union[np.ndarray, pd.DataFrame],
+                    y_pred: Union[np.ndarray, pd.DataFrame],
+                    metrics: List[str] = ('mae', 'rmse', 'rmsle', 'smape', 'bias'),
+                    y_train: Union[np.ndarray, pd.DataFrame] = None,
+                    seasonality: int = 1) -> np.ndarray:
+    """
+    Compute the metrics of every series at once, skipping the time steps with missing targets or predictions.
+    The RMSLE clips the negative values at 0, the MAPE skips the zero targets,
+    the sMAPE counts as 0 the time steps where both target and prediction are 0 and
+    the MASE divides the MAE by the seasonal naive error of 'y_train'
+
+    Args:
+        y_true: NumPy array or Pandas DataFrame of shape (time steps, series) of targets
+        y_pred: NumPy array or Pandas DataFrame of shape (time steps, series) of predictions
+        metrics: List of string metrics (accepted values: FORECAST_METRICS)
+        y_train: NumPy array or Pandas DataFrame of shape (training time steps, series), required by the MASE
+        seasonality: Integer season length of the naive forecast scaling the MASE
+
+    Returns:
+        metric_values: NumPy array of shape (metrics, series)
+    """
+    # Check the metrics
+    if any(metric not in FORECAST_METRICS for metric in metrics):
+
+        raise ValueError(f'compute_metrics - Metrics must be in {FORECAST_METRICS}')
+
+    if 'mase' in metrics and y_train is None:
+
+        raise ValueError('compute_metrics - The MASE requires the training targets')
+
+    # Compute the errors of the time steps with both target and prediction
+    y_true, y_pred = _to_panel(y_true), _to_panel(y_pred)
+
+    if y_true.shape != y_pred.shape:
+
+        raise ValueError('compute_metrics - Targets and predictions must have the same shape')
+
+    errors = y_pred - y_true
+    absolute_errors = np.abs(errors)
+
+    # Initialise the metrics
+    metric_values = np.empty((len(metrics), y_true.shape[1]))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+
+        for i, metric in enumerate(metrics):
+
+            # Switch between metrics
+            match metric:
+                case 'mae':
+                    metric_values[i] = column_nanmean(absolute_errors)
+                case 'rmse':
+                    metric_values[i] = np.sqrt(column_nanmean(errors ** 2))
+                case 'rmsle':
+                    metric_values[i] = np.sqrt(column_nanmean(
+                        (np.log1p(np.maximum(y_pred, 0)) - np.log1p(np.maximum(y_true, 0))) ** 2
+                    ))
+                case 'mape':
+                    metric_values[i] = column_nanmean(np.where(y_true != 0, absolute_errors / np.abs(y_true), np.nan))
+                case 'smape':
+                    denominators = np.abs(y_true) + np.abs(y_pred)
+                    metric_values[i] = column_nanmean(np.where(denominators > 0,
+                                                               2 * absolute_errors / denominators,
+                                                               absolute_errors))
+                case 'mase':
+                    metric_values[i] = column_nanmean(absolute_errors) / compute_seasonal_naive_scale(y_train,
+                                                                                                      seasonality)
+                case _:
+                    metric_values[i] = column_nanmean(errors)
+
+    return metric_values
+
+
+def aggregate_metrics(metric_values: np.ndarray,
+                      metric_names: List[str],
+                      groups: Union[np.ndarray, pd.Index, pd.Series] = None,
+                      weights: np.ndarray = None) -> pd.DataFrame:
+    """
+    Aggregate the metrics of the series into their groups (e.g. the stores of the hierarchy)
+    with a weighted mean skipping the missing metrics
+
+    Args:
+        metric_values: NumPy array of shape (metrics, series)
+        metric_names: List of string metric names
+        groups: Array-like of the group of each series (None to aggregate all the series together)
+        weights: NumPy array of the non-negative weight of each series (None for equal weights)
+
+    Returns:
+        aggregated_metrics: Pandas DataFrame indexed by group with one column per metric
+    """
+    # Encode the groups
+    group_codes, group_labels = pd.factorize(np.asarray(groups), sort=True) if groups is not None \
+        else (np.zeros(metric_values.shape[1], dtype=np.int64), pd.Index(['total']))
+
+    # Weight the available metrics
+    weights = np.ones(metric_values.shape[1]) if weights is None else np.asarray(weights, dtype=np.float64)
+    available_weights = np.where(np.isnan(metric_values), 0.0, weights)
+
+    # Sum the weighted metrics and the weights of each group
+    aggregated_values = np.empty((len(metric_names), len(group_labels)))
+
+    for i in range(len(metric_names)):
+
+        numerators = np.bincount(group_codes, np.where(available_weights[i] > 0, metric_values[i], 0.0) * available_weights[i],
+                                 minlength=len(group_labels))
+        denominators = np.bincount(group_codes, available_weights[i], minlength=len(group_labels))
+        aggregated_values[i] = np.divide(numerators, denominators,
+                                         out=np.full(len(group_labels), np.nan),
+                                         where=denominators > 0)
+
+    return pd.DataFrame(aggregated_values.T, index=group_labels, columns=list(metric_names))
@@ -2,16 +2,37 @@
 The module contains classes for the Model Training pipelines and components
 """
 # Import Standard Libraries
+from __future__ import annotations
+import hashlib
+import json
 import pathlib
+from typing import TYPE_CHECKING, Union
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from xgboost import XGBRegressor
 
 # Import Package Modules
+from src.general_utils.general_utils import LazyModule
 from src.logging_module.logging_module import get_logger
+from src.model_training.model_training_utils import (
+    factorize_trend_features,
+    compute_trend_statistics,
+    index_to_json,
+    index_from_json
+)
+from src.model_training.parallel_training import run_parallel_fits
 
+# Import Scikit-Learn and XGBoost lazily
+if TYPE_CHECKING:
+    from sklearn.linear_model import LinearRegression
+    from xgboost import XGBRegressor
 
-class BoostedHybridModel:
+sklearn = LazyModule('sklearn')
+sklearn_base = LazyModule('sklearn.base')
+sklearn_linear_model = LazyModule('sklearn.linear_model')
+xgboost = LazyModule('xgboost')
+
+
+class BoostedHybridModel:  # pylint: disable=too-many-instance-attributes
     """
     The class implements a Boosted Hybrid Model for
     Time Series Forecasting, which learns trend and seasonal components
@@ -45,55 +66,904 @@ class BoostedHybridModel:
         self.non_linear_model = non_linear_model
 
         # Initialise empty attributes
-        self.linear_model_predictions = None
+        self.trend_features = None
         self.residuals = None
         self.y_column_names = None
+        self.trend_factorization = None
+        self.trend_statistics = None
 
     def fit(self,
             trend_features: pd.DataFrame,
             serial_features: pd.DataFrame,
-            y: pd.Series):
+            y: pd.DataFrame):
         """
         Fits the model to time series data
 
+        A LinearRegression trend is solved in closed form for all the series at once,
+        reusing the factorization of the trend features across fits, and the residuals
+        are computed in place in a single stacked copy of 'y'
+
         Args:
             trend_features: Pandas dataframe containing trend features
-            serial_features: Pandas dataframe containing serial features
-            y: Pandas series containing target values
+            serial_features: Pandas dataframe containing serial features, stacked time step first
+                             with the series sorted by label (as 'y.stack()')
+            y: Pandas dataframe containing target values with one column per series
 
         Returns:
             Fitted models 'self.linear_model' and 'self.non_linear_model'
         """
         self.logger.info('fit - Start')
 
-        self.logger.info('fit - Fit linear model')
+        # Save column names
+        self.y_column_names = y.columns
 
-        # Fit the linear model
-        self.linear_model.fit(trend_features, y)
+        self.logger.info('fit - Fit linear model')
 
-        self.logger.info('fit - Compute predictions')
+        # Switch between the closed form and the model fit
+        if isinstance(self.linear_model, sklearn_linear_model.LinearRegression) and not self.linear_model.positive:
+            self._fit_trend_least_squares(trend_features, y)
+        else:
+            self.linear_model.fit(trend_features, y)
+            self.trend_statistics = None
 
-        # Compute predictions of the Linear model to then calculate residuals
-        self.linear_model_predictions = pd.DataFrame(
-            self.linear_model.predict(trend_features),
-            index=trend_features.index,
-            columns=y.columns
-        )
+        # Save trend features to compute the in-sample trend on demand
+        self.trend_features = trend_features
 
         self.logger.info('fit - Calculate residuals')
 
-        # Calculate residuals
-        self.residuals = y - self.linear_model_predictions
-
-        # Stack residuals to fit a non-linear model
-        self.residuals = self.residuals.stack().squeeze()
+        # Calculate stacked residuals in place
+        self.residuals = self._compute_stacked_residuals(trend_features, y)
 
         self.logger.info('fit - Fit Non-linear model on serial features with residuals as target')
 
         # Fit the non-linear model on residuals
         self.non_linear_model.fit(serial_features, self.residuals)
 
-        # Save column names
+        self.logger.info('fit - End')
+
+    def update(self,
+               new_trend_features: pd.DataFrame,
+               new_serial_features: pd.DataFrame,
+               new_y: pd.DataFrame,
+               forgetting_factor: float = 1.0,
+               n_boosting_rounds: int = 10):
+        """
+        Updates the fitted model with new time steps without refitting from scratch
+
+        The LinearRegression trend is re-solved from the accumulated sufficient statistics
+        (X'X and X'y) of all the time steps seen so far, and the XGBoost model continues
+        boosting from its current booster on the residuals of the new time steps.
+        Each update adds 'n_boosting_rounds' trees, so the booster grows linearly with the number
+        of updates (e.g. 10 trees per daily update): refit the model periodically to bound its size
+
+        Args:
+            new_trend_features: Pandas dataframe containing trend features of the new time steps
+            new_serial_features: Pandas dataframe containing serial features of the new time steps
+            new_y: Pandas dataframe containing target values of the new time steps
+            forgetting_factor: Float weight in (0, 1] of the past statistics of the trend
+            n_boosting_rounds: Integer number of boosting rounds (trees) to add
+
+        Returns:
+            Updated models 'self.linear_model' and 'self.non_linear_model'
+        """
+        self.logger.info('update - Start')
+
+        # Check the model can be updated
+        if self.trend_statistics is None:
+
+            raise ValueError('update - The trend must be a LinearRegression fitted with fit')
+
+        if not isinstance(self.non_linear_model, xgboost.XGBModel):
+
+            raise ValueError('update - The non-linear model must be an XGBoost model')
+
+        if not new_y.columns.equals(self.y_column_names):
+
+            raise ValueError('update - Target columns differ from the fitted ones')
+
+        if n_boosting_rounds < 1:
+
+            raise ValueError('update - The number of boosting rounds must be positive')
+
+        self.logger.info('update - Update trend statistics with %s time steps', len(new_y))
+
+        # Accumulate the sufficient statistics
+        new_statistics = compute_trend_statistics(np.asarray(new_trend_features, dtype=np.float64),
+                                                  new_y.to_numpy(dtype=np.float64))
+
+        for key, value in new_statistics.items():
+            self.trend_statistics[key] = forgetting_factor * self.trend_statistics[key] + value
+
+        # Solve the trend from the statistics
+        self._solve_trend_statistics(new_trend_features)
+
+        self.logger.info('update - Calculate residuals of the new time steps')
+
+        # Calculate stacked residuals of the new time steps in place
+        self.trend_features = new_trend_features
+        self.residuals = self._compute_stacked_residuals(new_trend_features, new_y)
+
+        self.logger.info('update - Continue boosting on the new residuals')
+
+        # Continue boosting from the current booster with the added rounds only
+        n_estimators = self.non_linear_model.get_params()['n_estimators']
+        self.non_linear_model.set_params(n_estimators=n_boosting_rounds)
+
+        try:
+            self.non_linear_model.fit(new_serial_features,
+                                      self.residuals,
+                                      xgb_model=self.non_linear_model.get_booster())
+        finally:
+            self.non_linear_model.set_params(n_estimators=n_estimators)
+
+        self.logger.info('update - End')
+
+    def _solve_trend_statistics(self,
+                                trend_features: pd.DataFrame):
+        """
+        Solves the LinearRegression trend of all the series from the sufficient statistics
+
+        Args:
+            trend_features: Pandas dataframe containing trend features (for the feature names)
+
+        Returns:
+            Fitted model 'self.linear_model'
+        """
+        # Retrieve statistics
+        statistics = self.trend_statistics
+
+        # Switch between centered and raw normal equations
+        if self.linear_model.fit_intercept:
+            trend_mean = statistics['sum_x'] / statistics['n']
+            y_mean = statistics['sum_y'] / statistics['n']
+            xtx = statistics['xtx'] - statistics['n'] * np.outer(trend_mean, trend_mean)
+            xty = statistics['xty'] - statistics['n'] * np.outer(trend_mean, y_mean)
+        else:
+            xtx, xty = statistics['xtx'], statistics['xty']
+
+        # Solve the normal equations of all the series at once
+        coefficients = np.linalg.pinv(xtx, hermitian=True) @ xty
+
+        # Retrieve rank and singular values of the trend features
+        singular_values = np.sqrt(np.clip(np.linalg.eigvalsh(xtx)[::-1], 0.0, None))
+        rank = int((singular_values > singular_values.max(initial=0.0)
+                    * len(singular_values) * np.spacing(1.0) ** 0.5).sum())
+
+        # Set the fitted attributes of the linear model
+        self._set_trend_coefficients(coefficients,
+                                     (y_mean - trend_mean @ coefficients
+                                      if self.linear_model.fit_intercept else 0.0),
+                                     rank,
+                                     singular_values,
+                                     trend_features)
+
+    @property
+    def linear_model_predictions(self) -> Union[pd.DataFrame, None]:
+        """
+        In-sample predictions of the linear model, computed on demand
+        instead of keeping a copy of the panel after the fit
+
+        Returns:
+            linear_model_predictions: Pandas dataframe with the same columns as 'y' in 'fit'
+        """
+        # Check the model is fitted
+        if self.trend_features is None:
+
+            return None
+
+        return pd.DataFrame(self._predict_trend(self.trend_features),
+                            index=self.trend_features.index,
+                            columns=self.y_column_names)
+
+    def predict(self,
+                trend_features: pd.DataFrame,
+                serial_features: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predicts all the time series at once by adding the residuals predicted by
+        the non-linear model onto the trend predicted by the linear model
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            serial_features: Pandas dataframe containing serial features, stacked with the
+                             same layout used in 'fit' (one row per time step and series)
+
+        Returns:
+            predictions: Pandas dataframe of predictions with the same columns as 'y' in 'fit'
+        """
+        self.logger.info('predict - Start')
+
+        self.logger.info('predict - Compute trend predictions')
+
+        # Compute trend predictions as a single matrix product
+        trend_predictions = self._predict_trend(trend_features)
+
+        self.logger.info('predict - Compute residual predictions')
+
+        # Compute residual predictions with a single call and unstack them
+        residual_predictions = self._unstack_residuals(
+            self.non_linear_model.predict(serial_features),
+            len(trend_features)
+        )
+
+        # Add the predicted residuals back onto the predicted trend
+        predictions = pd.DataFrame(trend_predictions + residual_predictions,
+                                   index=trend_features.index,
+                                   columns=self.y_column_names)
+
+        self.logger.info('predict - End')
+
+        return predictions
+
+    def fit_predict(self,
+                    trend_features: pd.DataFrame,
+                    serial_features: pd.DataFrame,
+                    y: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits the model to time series data and predicts the same time steps
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            serial_features: Pandas dataframe containing serial features
+            y: Pandas dataframe containing target values
+
+        Returns:
+            predictions: Pandas dataframe of in-sample predictions with the same columns as 'y'
+        """
+        self.logger.info('fit_predict - Start')
+
+        # Fit the models
+        self.fit(trend_features, serial_features, y)
+
+        self.logger.info('fit_predict - Compute residual predictions')
+
+        # Compute residual predictions with a single call
+        residual_predictions = self._unstack_residuals(
+            self.non_linear_model.predict(serial_features),
+            len(trend_features)
+        )
+
+        # Reuse the fitted trend, which is the target minus the residuals computed during the fit
+        residual_predictions -= self._unstack_residuals(self.residuals, len(trend_features))
+        residual_predictions += y.to_numpy(dtype=np.float64)
+
+        # Wrap the predictions into the wide shape
+        predictions = pd.DataFrame(residual_predictions,
+                                   index=trend_features.index,
+                                   columns=self.y_column_names)
+
+        self.logger.info('fit_predict - End')
+
+        return predictions
+
+    def save(self,
+             folder: pathlib.Path):
+        """
+        Saves the fitted model into a folder with the structure
+
+            <folder>:
+                metadata.json: column names, feature names, parameters and library versions
+                linear_coefficients.npy: raw coefficients of the linear model
+                linear_intercept.npy: raw intercepts of the linear model
+                non_linear_model.ubj: XGBoost booster in its native UBJSON format
+                trend_statistics.npz: sufficient statistics of the trend (if available)
+
+        Args:
+            folder: pathlib.Path folder where to save the model
+
+        Returns:
+        """
+        self.logger.info('save - Start')
+
+        # Check the model is fitted
+        if self.y_column_names is None:
+
+            raise ValueError('save - The model must be fitted before saving')
+
+        # Create the folder
+        folder = pathlib.Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        self.logger.info('save - Saving model in %s', folder.as_posix())
+
+        # Save the linear model coefficients as raw arrays
+        np.save(folder / 'linear_coefficients.npy', np.asarray(self.linear_model.coef_))
+        np.save(folder / 'linear_intercept.npy', np.asarray(self.linear_model.intercept_))
+
+        # Save the booster in its native format
+        self.non_linear_model.save_model(folder / 'non_linear_model.ubj')
+
+        # Save the trend statistics for later updates
+        if self.trend_statistics is not None:
+            np.savez(folder / 'trend_statistics.npz', **self.trend_statistics)
+
+        # Save the metadata manifest
+        metadata = {
+            'format_version': 1,
+            'y_column_names': index_to_json(self.y_column_names),
+            'linear_model': {
+                'class': type(self.linear_model).__name__,
+                'params': self.linear_model.get_params(),
+                'feature_names': (self.linear_model.feature_names_in_.tolist()
+                                  if hasattr(self.linear_model, 'feature_names_in_') else None)
+            },
+            'non_linear_model': {
+                'class': type(self.non_linear_model).__name__
+            },
+            'versions': {
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+                'scikit-learn': sklearn.__version__,
+                'xgboost': xgboost.__version__
+            }
+        }
+
+        with open(folder / 'metadata.json', 'w', encoding='utf-8') as metadata_file:
+            json.dump(metadata, metadata_file, indent=2)
+
+        self.logger.info('save - End')
+
+    @classmethod
+    def load(cls,
+             folder: pathlib.Path,
+             mmap_mode: str = None) -> 'BoostedHybridModel':
+        """
+        Loads a model saved with 'save'
+
+        Args:
+            folder: pathlib.Path folder where the model was saved
+            mmap_mode: String memory-map mode of the coefficients (e.g. 'r'), None to read them in memory
+
+        Returns:
+            model: Fitted BoostedHybridModel
+        """
+        # Check the folder exists
+        folder = pathlib.Path(folder)
+
+        if not (folder / 'metadata.json').exists():
+
+            raise FileNotFoundError(f'load - {(folder / "metadata.json").as_posix()} not found')
+
+        # Read the metadata manifest
+        with open(folder / 'metadata.json', 'r', encoding='utf-8') as metadata_file:
+            metadata = json.load(metadata_file)
+
+        # Rebuild the linear model with the saved coefficients
+        linear_model = getattr(sklearn_linear_model,
+                               metadata['linear_model']['class'])(**metadata['linear_model']['params'])
+        linear_model.coef_ = np.load(folder / 'linear_coefficients.npy', mmap_mode=mmap_mode)
+        linear_model.intercept_ = np.load(folder / 'linear_intercept.npy')
+        linear_model.n_features_in_ = linear_model.coef_.shape[-1]
+
+        if metadata['linear_model']['feature_names'] is not None:
+            linear_model.feature_names_in_ = np.asarray(metadata['linear_model']['feature_names'],
+                                                        dtype=object)
+
+        # Load the booster
+        non_linear_model = getattr(xgboost, metadata['non_linear_model']['class'])()
+        non_linear_model.load_model(folder / 'non_linear_model.ubj')
+
+        # Instance the model
+        model = cls(linear_model, non_linear_model)
+        model.y_column_names = index_from_json(metadata['y_column_names'])
+
+        # Load the trend statistics
+        if (folder / 'trend_statistics.npz').exists():
+            with np.load(folder / 'trend_statistics.npz') as trend_statistics:
+                model.trend_statistics = {key: trend_statistics[key] for key in trend_statistics.files}
+
+        model.logger.info('load - Loaded model from %s', folder.as_posix())
+
+        return model
+
+    def _fit_trend_least_squares(self,
+                                 trend_features: pd.DataFrame,
+                                 y: pd.DataFrame):
+        """
+        Fits the LinearRegression trend of all the series with a single least-squares solution,
+        setting the same fitted attributes of 'LinearRegression.fit'
+
+        The pseudo-inverse of the (centered) trend features is cached and reused
+        while the trend features do not change, so that refits only cost a matrix product
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            y: Pandas dataframe containing target values with one column per series
+
+        Returns:
+            Fitted model 'self.linear_model'
+        """
+        # Retrieve trend features
+        trend_values = np.asarray(trend_features, dtype=np.float64)
+        fit_intercept = self.linear_model.fit_intercept
+
+        # Build the key of the factorization
+        factorization_key = (trend_values.shape,
+                             fit_intercept,
+                             hashlib.sha1(np.ascontiguousarray(trend_values).tobytes()).hexdigest())
+
+        # Compute the factorization if the trend features changed
+        if self.trend_factorization is None or self.trend_factorization[0] != factorization_key:
+
+            self.logger.info('_fit_trend_least_squares - Factorize trend features')
+
+            self.trend_factorization = (factorization_key,
+                                        *factorize_trend_features(trend_values, fit_intercept))
+
+        # Retrieve the factorization
+        _, trend_mean, pseudo_inverse, rank, singular_values = self.trend_factorization
+
+        # Solve all the series at once (the centered features are orthogonal to the constant,
+        # so the target does not need to be centered)
+        y_values = y.to_numpy(dtype=np.float64)
+        coefficients = pseudo_inverse @ y_values
+
+        # Set the fitted attributes of the linear model
+        self._set_trend_coefficients(coefficients,
+                                     (y_values.mean(axis=0) - trend_mean @ coefficients
+                                      if fit_intercept else 0.0),
+                                     rank,
+                                     singular_values,
+                                     trend_features)
+
+        # Save the sufficient statistics for later updates
+        self.trend_statistics = compute_trend_statistics(trend_values, y_values)
+
+    def _set_trend_coefficients(self,
+                                coefficients: np.ndarray,
+                                intercept: Union[float, np.ndarray],
+                                rank: int,
+                                singular_values: np.ndarray,
+                                trend_features: pd.DataFrame):
+        """
+        Sets the same fitted attributes of 'LinearRegression.fit' on the linear model
+
+        Args:
+            coefficients: NumPy array of shape (features, series)
+            intercept: Float or NumPy array of intercepts of the series
+            rank: Integer rank of the trend features
+            singular_values: NumPy array of singular values of the trend features
+            trend_features: Pandas dataframe containing trend features
+
+        Returns:
+            Fitted model 'self.linear_model'
+        """
+        # Set the fitted attributes of the linear model
+        self.linear_model.coef_ = coefficients.T
+        self.linear_model.intercept_ = intercept
+        self.linear_model.rank_ = rank
+        self.linear_model.singular_ = singular_values
+        self.linear_model.n_features_in_ = coefficients.shape[0]
+
+        # Set the feature names as done by Scikit-Learn
+        if hasattr(trend_features, 'columns') and all(isinstance(column, str)
+                                                      for column in trend_features.columns):
+            self.linear_model.feature_names_in_ = np.asarray(trend_features.columns, dtype=object)
+        elif hasattr(self.linear_model, 'feature_names_in_'):
+            del self.linear_model.feature_names_in_
+
+    def _compute_stacked_residuals(self,
+                                   trend_features: pd.DataFrame,
+                                   y: pd.DataFrame,
+                                   chunk_size: int = 1_048_576) -> np.ndarray:
+        """
+        Computes the residuals of the linear model in a single copy of 'y', already
+        in the stacked order of the serial features, subtracting the trend by chunks of time steps
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            y: Pandas dataframe containing target values with one column per series
+            chunk_size: Integer maximum number of trend values computed at once
+
+        Returns:
+            residuals: NumPy array of stacked residuals
+        """
+        # Retrieve the stacking order of the series (sorted by label, as done by 'y.stack()')
+        stacking_order = self.y_column_names.argsort()
+        is_sorted = np.array_equal(stacking_order, np.arange(len(stacking_order)))
+
+        # Copy the target in the stacking order, which becomes the residuals
+        residuals = (y.to_numpy(dtype=np.float64, copy=True) if is_sorted
+                     else y.to_numpy(dtype=np.float64)[:, stacking_order])
+
+        # Retrieve the coefficients in the stacking order
+        trend_values = np.asarray(trend_features, dtype=np.float64)
+        has_coefficients = hasattr(self.linear_model, 'coef_')
+
+        if has_coefficients:
+            coefficients = np.atleast_2d(self.linear_model.coef_).T[:, stacking_order]
+            intercept = np.broadcast_to(self.linear_model.intercept_, (len(stacking_order),))[stacking_order]
+
+        # Subtract the trend by chunks of time steps
+        chunk_steps = max(1, chunk_size // max(1, residuals.shape[1]))
+
+        for start in range(0, len(residuals), chunk_steps):
+
+            chunk = slice(start, start + chunk_steps)
+
+            if has_coefficients:
+                residuals[chunk] -= trend_values[chunk] @ coefficients
+                residuals[chunk] -= intercept
+            else:
+                residuals[chunk] -= self._predict_trend(trend_features.iloc[chunk])[:, stacking_order]
+
+        # Ravel without copies
+        return residuals.reshape(-1)
+
+    def _predict_trend(self,
+                       trend_features: pd.DataFrame) -> np.ndarray:
+        """
+        Computes the trend predictions of all the series as a single matrix product
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+
+        Returns:
+            trend_predictions: NumPy array of shape (time steps, series)
+        """
+        # Fall back to the model predict for linear models without coefficients
+        if not hasattr(self.linear_model, 'coef_'):
+
+            return np.asarray(self.linear_model.predict(trend_features),
+                              dtype=np.float64).reshape(len(trend_features), -1)
+
+        # Retrieve coefficients as (features, series)
+        coefficients = np.atleast_2d(self.linear_model.coef_).T
+
+        # Compute the trend with the intercept broadcast over the time steps
+        trend_predictions = np.asarray(trend_features, dtype=np.float64) @ coefficients
+        trend_predictions += self.linear_model.intercept_
+
+        return trend_predictions
+
+    def _unstack_residuals(self,
+                           residuals: np.ndarray,
+                           n_time_steps: int) -> np.ndarray:
+        """
+        Reshapes stacked residuals into a (time steps, series) array ordered as 'y_column_names'
+
+        Residuals are stacked time step first and, within each time step,
+        with the series sorted by label, as done by 'y.stack()'
+
+        Args:
+            residuals: NumPy array of stacked residuals
+            n_time_steps: Integer number of time steps
+
+        Returns:
+            unstacked_residuals: NumPy array of shape (time steps, series)
+        """
+        # Reshape the stacked residuals into the sorted series order
+        sorted_residuals = np.asarray(residuals, dtype=np.float64).reshape(n_time_steps, -1)
+
+        # Map the sorted series back onto the 'y_column_names' order
+        unstacked_residuals = np.empty_like(sorted_residuals)
+        unstacked_residuals[:, self.y_column_names.argsort()] = sorted_residuals
+
+        return unstacked_residuals
+
+
+class GroupedBoostedHybridModel:  # pylint: disable=too-many-instance-attributes
+    """
+    The class implements a per-group Boosted Hybrid Model, which partitions the
+    series of the panel into groups (e.g. stores or families) and fits one
+    BoostedHybridModel per group in parallel worker processes.
+    Predictions are routed to the model of the group of each series.
+
+    Attributes:
+        linear_model: Linear model cloned for the trend component of each group
+        non_linear_model: Non-linear model cloned for the seasonality & cycle components of each group
+        groups: String level name of the 'y' columns or Pandas Series mapping 'y' columns to groups
+        n_jobs: Integer number of worker processes fitting the groups
+        models: Dictionary of fitted BoostedHybridModel by group
+    """
+
+    def __init__(self,
+                 linear_model: LinearRegression,
+                 non_linear_model: XGBRegressor,
+                 groups: Union[str, pd.Series],
+                 n_jobs: int = None):
+        """
+        Constructor for the GroupedBoostedHybridModel class
+
+        Args:
+            linear_model: Linear model cloned for the trend component of each group
+            non_linear_model: Non-linear model cloned for the seasonality & cycle components of each group
+            groups: String level name of the 'y' columns or Pandas Series mapping 'y' columns to groups
+            n_jobs: Integer number of worker processes (None or 1 to fit sequentially, -1 for all cores)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Initialise object attributes
+        self.linear_model = linear_model
+        self.non_linear_model = non_linear_model
+        self.groups = groups
+        self.n_jobs = n_jobs
+
+        # Initialise empty attributes
+        self.models = {}
+        self.timing_report = None
+        self.y_column_names = None
+        self.series_groups = None
+        self.trend_feature_names = None
+        self.serial_feature_names = None
+
+    def fit(self,
+            trend_features: pd.DataFrame,
+            serial_features: pd.DataFrame,
+            y: pd.DataFrame):
+        """
+        Fits one Boosted Hybrid Model per group of series
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            serial_features: Pandas dataframe containing numeric serial features, stacked with
+                             the same layout used by BoostedHybridModel
+            y: Pandas dataframe containing target values with one column per series
+
+        Returns:
+            Fitted models 'self.models'
+        """
+        self.logger.info('fit - Start')
+
+        # Save column and feature names
         self.y_column_names = y.columns
+        self.trend_feature_names = trend_features.columns
+        self.serial_feature_names = serial_features.columns
+
+        # Retrieve the group of each series
+        self.series_groups = self._get_series_groups(y.columns)
+
+        self.logger.info('fit - Fit %s groups', self.series_groups.nunique())
+
+        # Fit the groups in parallel, sharing the data with the workers
+        group_keys = list(pd.unique(self.series_groups))
+        models, self.timing_report = run_parallel_fits(
+            self._fit_group,
+            list(range(len(group_keys))),
+            {'trend_values': trend_features.to_numpy(dtype=np.float64),
+             'serial_values': serial_features.to_numpy(dtype=np.float64),
+             'y_values': y.to_numpy(dtype=np.float64)},
+            self.n_jobs
+        )
+
+        # Index the models by group
+        self.models = dict(zip(group_keys, models))
+        self.timing_report.insert(0, 'group', group_keys)
 
         self.logger.info('fit - End')
+
+        return self
+
+    def predict(self,
+                trend_features: pd.DataFrame,
+                serial_features: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predicts all the series by routing each group to its own model
+
+        Args:
+            trend_features: Pandas dataframe containing trend features
+            serial_features: Pandas dataframe containing serial features, stacked with the
+                             same layout used in 'fit'
+
+        Returns:
+            predictions: Pandas dataframe of predictions with the same columns as 'y' in 'fit'
+        """
+        self.logger.info('predict - Start')
+
+        # Initialise predictions
+        predictions = np.empty((len(trend_features), len(self.y_column_names)))
+
+        for group, model in self.models.items():
+
+            self.logger.info('predict - Predict group %s', group)
+
+            # Retrieve the series of the group and their stacked rows
+            positions = self._get_group_positions(group)
+            rows = self._get_stacked_rows(positions, len(trend_features))
+
+            # Predict the group and route the predictions to its series
+            predictions[:, positions] = model.predict(trend_features,
+                                                      serial_features.iloc[rows]).to_numpy()
+
+        self.logger.info('predict - End')
+
+        return pd.DataFrame(predictions, index=trend_features.index, columns=self.y_column_names)
+
+    def get_model(self,
+                  series: Union[str, tuple]) -> BoostedHybridModel:
+        """
+        Retrieves the fitted model of the group of a series
+
+        Args:
+            series: String or tuple column label of the series in 'y'
+
+        Returns:
+            model: Fitted BoostedHybridModel of the group of the series
+        """
+        return self.models[self.series_groups[series]]
+
+    def save(self,
+             folder: pathlib.Path):
+        """
+        Saves the fitted models into a folder, with one sub-folder per group
+        written by 'BoostedHybridModel.save' and a 'metadata.json' manifest of the groups
+
+        Args:
+            folder: pathlib.Path folder where to save the models
+
+        Returns:
+        """
+        self.logger.info('save - Start')
+
+        # Check the model is fitted
+        if not self.models:
+
+            raise ValueError('save - The model must be fitted before saving')
+
+        # Create the folder
+        folder = pathlib.Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        # Save the model of each group
+        group_keys = list(self.models.keys())
+
+        for group_index, group in enumerate(group_keys):
+            self.models[group].save(folder / f'group_{group_index}')
+
+        # Save the metadata manifest
+        metadata = {
+            'format_version': 1,
+            'groups': pd.Index(group_keys).tolist(),
+            'series_groups': self.series_groups.tolist(),
+            'y_column_names': index_to_json(self.y_column_names),
+            'trend_feature_names': index_to_json(self.trend_feature_names),
+            'serial_feature_names': index_to_json(self.serial_feature_names)
+        }
+
+        with open(folder / 'metadata.json', 'w', encoding='utf-8') as metadata_file:
+            json.dump(metadata, metadata_file, indent=2)
+
+        self.logger.info('save - End')
+
+    @classmethod
+    def load(cls,
+             folder: pathlib.Path,
+             mmap_mode: str = None) -> 'GroupedBoostedHybridModel':
+        """
+        Loads the models saved with 'save'
+
+        Args:
+            folder: pathlib.Path folder where the models were saved
+            mmap_mode: String memory-map mode of the coefficients (e.g. 'r'), None to read them in memory
+
+        Returns:
+            model: Fitted GroupedBoostedHybridModel
+        """
+        # Check the folder exists
+        folder = pathlib.Path(folder)
+
+        if not (folder / 'metadata.json').exists():
+
+            raise FileNotFoundError(f'load - {(folder / "metadata.json").as_posix()} not found')
+
+        # Read the metadata manifest
+        with open(folder / 'metadata.json', 'r', encoding='utf-8') as metadata_file:
+            metadata = json.load(metadata_file)
+
+        # Load the model of each group
+        models = {group: BoostedHybridModel.load(folder / f'group_{group_index}', mmap_mode)
+                  for group_index, group in enumerate(metadata['groups'])}
+
+        # Instance the model with the first group as template
+        template = next(iter(models.values()))
+        y_column_names = index_from_json(metadata['y_column_names'])
+        series_groups = pd.Series(metadata['series_groups'], index=y_column_names)
+        model = cls(sklearn_base.clone(template.linear_model),
+                    sklearn_base.clone(template.non_linear_model),
+                    series_groups)
+
+        # Set the fitted attributes
+        model.models = models
+        model.y_column_names = y_column_names
+        model.series_groups = series_groups
+        model.trend_feature_names = index_from_json(metadata['trend_feature_names'])
+        model.serial_feature_names = index_from_json(metadata['serial_feature_names'])
+
+        model.logger.info('load - Loaded %s groups from %s', len(models), folder.as_posix())
+
+        return model
+
+    def _get_series_groups(self,
+                           columns: pd.Index) -> pd.Series:
+        """
+        Retrieves the group of each series
+
+        Args:
+            columns: Pandas index of the 'y' columns
+
+        Returns:
+            series_groups: Pandas Series of groups indexed by the 'y' columns
+        """
+        # Switch between column level and explicit mapping
+        if isinstance(self.groups, str):
+            series_groups = pd.Series(columns.get_level_values(self.groups), index=columns)
+        else:
+            series_groups = self.groups.reindex(columns)
+
+        # Check all the series have a group
+        if series_groups.isna().any():
+
+            raise ValueError('_get_series_groups - Some series are not mapped to a group')
+
+        return series_groups
+
+    def _get_group_positions(self,
+                             group: Union[str, int]) -> np.ndarray:
+        """
+        Retrieves the positions of the series of a group in the 'y' columns
+
+        Args:
+            group: Group key
+
+        Returns:
+            positions: NumPy array of integer positions sorted by series label
+        """
+        # Retrieve the positions of the group
+        positions = np.flatnonzero(self.series_groups.to_numpy() == group)
+
+        # Sort them by label, as done by the stacking of the serial features with 'y.stack()'
+        return positions[self.y_column_names[positions].argsort()]
+
+    def _get_stacked_rows(self,
+                          positions: np.ndarray,
+                          n_time_steps: int) -> np.ndarray:
+        """
+        Retrieves the rows of the stacked serial features belonging to the series of a group
+
+        Args:
+            positions: NumPy array of integer positions of the series in the 'y' columns
+            n_time_steps: Integer number of time steps
+
+        Returns:
+            rows: NumPy array of integer row positions, stacked time step first
+        """
+        # Retrieve the stacked position of each series (sorted by label within a time step, as 'y.stack()')
+        stacked_positions = np.empty(len(self.y_column_names), dtype=np.int64)
+        stacked_positions[self.y_column_names.argsort()] = np.arange(len(self.y_column_names))
+
+        return (np.arange(n_time_steps)[:, None] * len(self.y_column_names)
+                + stacked_positions[positions][None, :]).ravel()
+
+    def _fit_group(self,
+                   group_index: int,
+                   trend_values: np.ndarray,
+                   serial_values: np.ndarray,
+                   y_values: np.ndarray) -> BoostedHybridModel:
+        """
+        Fits the Boosted Hybrid Model of a group
+
+        Args:
+            group_index: Integer index of the group
+            trend_values: NumPy array of trend features
+            serial_values: NumPy array of stacked serial features
+            y_values: NumPy array of target values
+
+        Returns:
+            model: Fitted BoostedHybridModel of the group
+        """
+        # Retrieve the series of the group and their stacked rows
+        positions = self._get_group_positions(pd.unique(self.series_groups)[group_index])
+        rows = self._get_stacked_rows(positions, len(trend_values))
+
+        # Fit the model of the group
+        model = BoostedHybridModel(sklearn_base.clone(self.linear_model), sklearn_base.clone(self.non_linear_model))
+        model.fit(pd.DataFrame(trend_values, columns=self.trend_feature_names),
+                  pd.DataFrame(serial_values[rows], columns=self.serial_feature_names),
+                  pd.DataFrame(y_values[:, positions], columns=self.y_column_names[positions]))
+
+        return model
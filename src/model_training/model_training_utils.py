@@ -0,0 +1,94 @@
+"""
+The module contains util functions for the Model Training pipelines and components
+"""
+# Import Standard Libraries
+from typing import Dict, Tuple, Union
+import numpy as np
+import pandas as pd
+
+
+def factorize_trend_features(trend_values: np.ndarray,
+                             fit_intercept: bool) -> Tuple[np.ndarray, np.ndarray, int, np.ndarray]:
+    """
+    Factorize the trend features with a single SVD into the pseudo-inverse
+    solving the least squares of any number of targets
+
+    Args:
+        trend_values: NumPy array of shape (time steps, features)
+        fit_intercept: Boolean indicating whether to center the features to fit an intercept
+
+    Returns:
+        trend_mean: NumPy array of the feature means used for centering
+        pseudo_inverse: NumPy array of shape (features, time steps)
+        rank: Integer rank of the (centered) trend features
+        singular_values: NumPy array of singular values
+    """
+    # Center the trend features to fit the intercept
+    trend_mean = trend_values.mean(axis=0) if fit_intercept else np.zeros(trend_values.shape[1])
+
+    # Compute the SVD of the centered features
+    left_vectors, singular_values, right_vectors = np.linalg.svd(trend_values - trend_mean,
+                                                                 full_matrices=False)
+
+    # Invert the singular values above the numerical threshold (np.spacing(1.0) is the machine epsilon)
+    threshold = singular_values.max(initial=0.0) * max(trend_values.shape) * np.spacing(1.0)
+    is_above = singular_values > threshold
+    inverse_singular_values = np.divide(1.0, singular_values,
+                                        out=np.zeros_like(singular_values),
+                                        where=is_above)
+
+    return (trend_mean,
+            (right_vectors.T * inverse_singular_values) @ left_vectors.T,
+            int(is_above.sum()),
+            singular_values)
+
+
+def compute_trend_statistics(trend_values: np.ndarray,
+                             y_values: np.ndarray) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Compute the sufficient statistics of the least squares of the trend,
+    which can be accumulated over batches of time steps
+
+    Args:
+        trend_values: NumPy array of shape (time steps, features)
+        y_values: NumPy array of shape (time steps, series)
+
+    Returns:
+        trend_statistics: Dictionary with number of time steps, sums, X'X and X'y
+    """
+    return {'n': float(len(trend_values)),
+            'sum_x': trend_values.sum(axis=0),
+            'sum_y': y_values.sum(axis=0),
+            'xtx': trend_values.T @ trend_values,
+            'xty': trend_values.T @ y_values}
+
+
+def index_to_json(index: pd.Index) -> Dict[str, list]:
+    """
+    Convert a Pandas (Multi)Index of labels into a JSON serializable dictionary
+
+    Args:
+        index: Pandas Index or MultiIndex
+
+    Returns:
+        index_json: Dictionary with level names and labels
+    """
+    return {'names': list(index.names), 'labels': index.tolist()}
+
+
+def index_from_json(index_json: Dict[str, list]) -> pd.Index:
+    """
+    Convert a dictionary created by 'index_to_json' back into a Pandas (Multi)Index
+
+    Args:
+        index_json: Dictionary with level names and labels
+
+    Returns:
+        index: Pandas Index or MultiIndex
+    """
+    # Switch between MultiIndex and Index
+    if len(index_json['names']) > 1:
+        return pd.MultiIndex.from_tuples([tuple(label) for label in index_json['labels']],
+                                         names=index_json['names'])
+
+    return pd.Index(index_json['labels'], name=index_json['names'][0])
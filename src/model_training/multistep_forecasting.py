@@ -0,0 +1,587 @@
+"""
+The module contains the classes for Multi-step Forecasting with the
+recursive, direct, DirRec and multi-output strategies
+"""
+# Import Standard Libraries
+from __future__ import annotations
+import pathlib
+from typing import TYPE_CHECKING, List, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.general_utils.general_utils import LazyModule
+from src.logging_module.logging_module import get_logger
+from src.model_training.model_training import BoostedHybridModel
+from src.model_training.parallel_training import run_parallel_fits
+
+# Import Scikit-Learn lazily
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+sklearn_base = LazyModule('sklearn.base')
+
+# Define the accepted strategies
+STRATEGIES = ['recursive', 'direct', 'dirrec', 'multi_output']
+
+
+def clone_estimator(estimator: Union[BoostedHybridModel, BaseEstimator]
+                    ) -> Union[BoostedHybridModel, BaseEstimator]:
+    """
+    Clone an unfitted copy of the estimator with the same parameters
+
+    Args:
+        estimator: BoostedHybridModel or Scikit-Learn compatible regressor
+
+    Returns:
+        cloned_estimator: Unfitted copy of the estimator
+    """
+    # Switch between Boosted Hybrid Model and Scikit-Learn regressors
+    if isinstance(estimator, BoostedHybridModel):
+
+        return BoostedHybridModel(sklearn_base.clone(estimator.linear_model),
+                                  sklearn_base.clone(estimator.non_linear_model))
+
+    return sklearn_base.clone(estimator)
+
+
+def build_lag_block(values: np.ndarray,
+                    target_rows: np.ndarray,
+                    lags: np.ndarray) -> np.ndarray:
+    """
+    Build the stacked lag features of all the series for the target rows
+
+    The output is stacked time step first, with one row per target row and series,
+    and contains the value 'values[target_row - lag]' for each lag
+
+    Args:
+        values: NumPy array of shape (time steps, series)
+        target_rows: NumPy array of integer target row positions
+        lags: NumPy array of integer lags
+
+    Returns:
+        lag_block: NumPy array of shape (target rows * series, lags)
+    """
+    # Gather all the lagged rows with a single fancy indexing of shape (rows, lags, series)
+    lagged_values = values[target_rows[:, None] - lags[None, :], :]
+
+    # Stack the series under each time step
+    return lagged_values.transpose(0, 2, 1).reshape(-1, len(lags))
+
+
+class MultiStepForecaster:  # pylint: disable=too-many-instance-attributes
+    """
+    The class implements a Multi-step Forecaster over a wide panel of time series,
+    which predicts a horizon of steps with the recursive, direct, DirRec or multi-output strategy.
+    It wraps either a BoostedHybridModel or a Scikit-Learn compatible regressor fitted globally
+    on the stacked series, with lag features of the target as serial features.
+
+    Attributes:
+        estimator: BoostedHybridModel or Scikit-Learn compatible regressor
+        lags: List of integer lags of the target used as features
+        horizon: Integer number of steps to forecast
+        strategy: String multi-step strategy
+        add_series_code: Boolean indicating whether to add the series code as feature
+        n_jobs: Integer number of worker processes fitting the steps of 'direct' and 'dirrec'
+        estimators: List of fitted estimators (one per step for 'direct' and 'dirrec')
+        timing_report: Pandas DataFrame with the fit seconds of each step for 'direct' and 'dirrec'
+    """
+
+    def __init__(self,
+                 estimator: Union[BoostedHybridModel, BaseEstimator],
+                 lags: List[int],
+                 horizon: int,
+                 strategy: str = 'recursive',
+                 add_series_code: bool = True,
+                 n_jobs: int = None):
+        """
+        Constructor for the MultiStepForecaster class
+
+        Args:
+            estimator: BoostedHybridModel or Scikit-Learn compatible regressor
+            lags: List of integer lags of the target used as features
+            horizon: Integer number of steps to forecast
+            strategy: String multi-step strategy
+                      (accepted values: ['recursive', 'direct', 'dirrec', 'multi_output'])
+            add_series_code: Boolean indicating whether to add the series code as feature
+            n_jobs: Integer number of worker processes fitting the steps of 'direct' and 'dirrec'
+                    (None or 1 to fit sequentially, -1 for all cores)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Check the strategy
+        if strategy not in STRATEGIES:
+
+            raise ValueError('Unrecognised Strategy')
+
+        # Check the estimator supports the strategy
+        if strategy == 'multi_output' and isinstance(estimator, BoostedHybridModel):
+
+            raise ValueError('__init__ - BoostedHybridModel does not support the multi_output strategy')
+
+        # Check lags and horizon
+        if len(lags) == 0 or min(lags) < 1 or horizon < 1:
+
+            raise ValueError('__init__ - Lags and horizon must be positive integers')
+
+        # Initialise object attributes
+        self.estimator = estimator
+        self.lags = sorted(lags)
+        self.horizon = horizon
+        self.strategy = strategy
+        self.add_series_code = add_series_code
+        self.n_jobs = n_jobs
+
+        # Initialise empty attributes
+        self.estimators = []
+        self.timing_report = None
+        self.y_column_names = None
+
+    def fit(self,
+            y: pd.DataFrame,
+            trend_features: pd.DataFrame = None):
+        """
+        Fits the estimators of the strategy to the wide panel of time series
+
+        Args:
+            y: Pandas dataframe of target values with one column per series
+            trend_features: Pandas dataframe of features known in advance with the same index of 'y'
+                            (required by BoostedHybridModel)
+
+        Returns:
+            Fitted estimators 'self.estimators'
+        """
+        self.logger.info('fit - Start')
+
+        # Reset the fitted series
+        self.y_column_names = None
+
+        # Retrieve target values
+        values = self._check_target(y)
+
+        # Check the trend features
+        trend_values = self._check_trend_features(trend_features, len(values))
+
+        # Save column names
+        self.y_column_names = y.columns
+
+        # Initialise the estimators
+        self.estimators = []
+        self.timing_report = None
+
+        # Retrieve lags
+        lags = np.asarray(self.lags)
+
+        self.logger.info('fit - Strategy: %s | Lags: %s | Horizon: %s',
+                         self.strategy, self.lags, self.horizon)
+
+        # Switch between strategies
+        match self.strategy:
+            case 'recursive':
+                # Fit a single one-step model
+                target_rows = np.arange(lags[-1], len(values))
+                self.estimators.append(
+                    self._fit_estimator(self.estimator,
+                                        build_lag_block(values, target_rows, lags),
+                                        target_rows, values, trend_values)
+                )
+            case 'direct' | 'dirrec':
+                # Fit one model for each step of the horizon in parallel
+                self.estimators, self.timing_report = run_parallel_fits(
+                    self._fit_step,
+                    list(range(1, self.horizon + 1)),
+                    {'values': values, 'trend_values': trend_values},
+                    self.n_jobs
+                )
+            case 'multi_output':
+                # Fit a single model on all the steps of the horizon
+                target_rows = np.arange(lags[-1], len(values) - self.horizon + 1)
+                targets = values[target_rows[:, None] + np.arange(self.horizon)[None, :], :]
+                self.estimators.append(
+                    self._fit_estimator(self.estimator,
+                                        build_lag_block(values, target_rows, lags),
+                                        target_rows, values, trend_values,
+                                        targets=targets.transpose(0, 2, 1).reshape(-1, self.horizon))
+                )
+
+        self.logger.info('fit - End')
+
+        return self
+
+    def forecast(self,
+                 y: pd.DataFrame,
+                 future_trend_features: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Forecasts the horizon after the last time step of 'y'
+
+        Args:
+            y: Pandas dataframe of target values with at least max(lags) time steps
+            future_trend_features: Pandas dataframe of the trend features for the 'horizon' steps
+                                   (required if the estimators were fitted with trend features)
+
+        Returns:
+            forecasts: Pandas dataframe of shape (horizon, series) with the same columns of 'y'
+        """
+        self.logger.info('forecast - Start')
+
+        # Retrieve the history required by the lags
+        values = self._check_target(y)[-self.lags[-1]:]
+
+        # Check the future trend features
+        trend_values = self._check_trend_features(future_trend_features, self.horizon)
+
+        # Check history length
+        if len(values) < self.lags[-1]:
+
+            raise ValueError(f'forecast - At least {self.lags[-1]} time steps are required')
+
+        self.logger.info('forecast - Strategy: %s', self.strategy)
+
+        # Switch between strategies
+        match self.strategy:
+            case 'recursive':
+                forecasts = self._forecast_recursive(values, trend_values, future_trend_features)
+            case 'direct' | 'dirrec':
+                forecasts = self._forecast_direct(values, trend_values, future_trend_features)
+            case _:
+                forecasts = self._forecast_multi_output(values, trend_values)
+
+        # Define the forecast index
+        if future_trend_features is not None:
+            index = future_trend_features.index
+        else:
+            index = pd.RangeIndex(1, self.horizon + 1, name='horizon')
+
+        self.logger.info('forecast - End')
+
+        return pd.DataFrame(forecasts, index=index, columns=y.columns)
+
+    def _check_target(self,
+                      y: pd.DataFrame) -> np.ndarray:
+        """
+        Checks the target values and returns them as a NumPy array
+
+        Args:
+            y: Pandas dataframe of target values with one column per series
+
+        Returns:
+            values: NumPy array of shape (time steps, series)
+        """
+        # Retrieve values
+        values = y.to_numpy(dtype=np.float64)
+
+        # Check missing values, which would misalign the stacked features
+        if np.isnan(values).any():
+
+            raise ValueError('_check_target - Target values must not contain missing values')
+
+        # Check the series are the fitted ones
+        if self.y_column_names is not None and not y.columns.equals(self.y_column_names):
+
+            raise ValueError('_check_target - Target columns differ from the fitted ones')
+
+        return values
+
+    def _check_trend_features(self,
+                              trend_features: pd.DataFrame,
+                              n_time_steps: int) -> Union[np.ndarray, None]:
+        """
+        Checks the trend features and returns them as a NumPy array
+
+        Args:
+            trend_features: Pandas dataframe of trend features or None
+            n_time_steps: Integer expected number of time steps
+
+        Returns:
+            trend_values: NumPy array of shape (time steps, features) or None
+        """
+        # Check trend features are available for the Boosted Hybrid Model
+        if trend_features is None:
+
+            if isinstance(self.estimator, BoostedHybridModel):
+
+                raise ValueError('_check_trend_features - BoostedHybridModel requires trend features')
+
+            return None
+
+        # Check the number of time steps
+        if len(trend_features) != n_time_steps:
+
+            raise ValueError(f'_check_trend_features - Expected {n_time_steps} time steps, '
+                             f'got {len(trend_features)}')
+
+        return trend_features.to_numpy(dtype=np.float64)
+
+    def _fit_step(self,
+                  step: int,
+                  values: np.ndarray,
+                  trend_values: Union[np.ndarray, None]) -> Union[BoostedHybridModel, BaseEstimator]:
+        """
+        Fits a copy of the estimator for a step of the direct and DirRec strategies
+
+        Args:
+            step: Integer step of the horizon (starting from 1)
+            values: NumPy array of shape (time steps, series)
+            trend_values: NumPy array of shape (time steps, trend features) or None
+
+        Returns:
+            estimator: Fitted copy of the estimator
+        """
+        # Retrieve lags
+        lags = np.asarray(self.lags)
+
+        # Retrieve the target rows with all the lags available
+        target_rows = np.arange(lags[-1] + step - 1, len(values))
+
+        return self._fit_estimator(clone_estimator(self.estimator),
+                                   self._build_step_features(values, target_rows, lags, step),
+                                   target_rows, values, trend_values)
+
+    def _build_step_features(self,
+                             values: np.ndarray,
+                             target_rows: np.ndarray,
+                             lags: np.ndarray,
+                             step: int) -> np.ndarray:
+        """
+        Builds the lag features of the model of a step for the direct and DirRec strategies
+
+        Args:
+            values: NumPy array of shape (time steps, series)
+            target_rows: NumPy array of integer target row positions
+            lags: NumPy array of integer lags
+            step: Integer step of the horizon (starting from 1)
+
+        Returns:
+            step_features: NumPy array of shape (target rows * series, features)
+        """
+        # Lags are taken from the forecast origin, shared by all the steps
+        step_features = build_lag_block(values, target_rows, lags + step - 1)
+
+        # Add the previous steps of the horizon for the DirRec strategy
+        if self.strategy == 'dirrec' and step > 1:
+
+            step_features = np.hstack([step_features,
+                                       build_lag_block(values, target_rows, np.arange(1, step))])
+
+        return step_features
+
+    def _build_design(self,
+                      lag_features: np.ndarray,
+                      n_series: int,
+                      trend_values: Union[np.ndarray, None],
+                      for_hybrid: bool) -> np.ndarray:
+        """
+        Builds the stacked design matrix from the lag features, the series code and
+        the trend features (the latter only for Scikit-Learn regressors)
+
+        Args:
+            lag_features: NumPy array of shape (rows * series, lags)
+            n_series: Integer number of series
+            trend_values: NumPy array of shape (rows, trend features) or None
+            for_hybrid: Boolean indicating whether the design is for a BoostedHybridModel
+
+        Returns:
+            design: NumPy array of shape (rows * series, features)
+        """
+        # Initialise the blocks of the design
+        blocks = [lag_features]
+
+        # Add the series code
+        if self.add_series_code:
+            blocks.append(np.tile(np.arange(n_series, dtype=np.float64),
+                                  len(lag_features) // n_series)[:, None])
+
+        # Add the trend features broadcast to all the series
+        if trend_values is not None and not for_hybrid:
+            blocks.append(np.repeat(trend_values, n_series, axis=0))
+
+        return np.hstack(blocks) if len(blocks) > 1 else lag_features
+
+    def _fit_estimator(self,
+                       estimator: Union[BoostedHybridModel, BaseEstimator],
+                       lag_features: np.ndarray,
+                       target_rows: np.ndarray,
+                       values: np.ndarray,
+                       trend_values: Union[np.ndarray, None],
+                       targets: np.ndarray = None) -> Union[BoostedHybridModel, BaseEstimator]:
+        """
+        Fits an estimator on the stacked lag features of the target rows
+
+        Args:
+            estimator: BoostedHybridModel or Scikit-Learn compatible regressor
+            lag_features: NumPy array of shape (target rows * series, lags)
+            target_rows: NumPy array of integer target row positions
+            values: NumPy array of shape (time steps, series)
+            trend_values: NumPy array of shape (time steps, trend features) or None
+            targets: NumPy array of stacked targets overriding 'values[target_rows]'
+
+        Returns:
+            estimator: Fitted estimator
+        """
+        # Retrieve the trend features of the target rows
+        row_trend_values = None if trend_values is None else trend_values[target_rows]
+
+        # Switch between Boosted Hybrid Model and Scikit-Learn regressors
+        if isinstance(estimator, BoostedHybridModel):
+
+            # Series are labelled by position so that stacking keeps their order
+            estimator.fit(pd.DataFrame(row_trend_values),
+                          self._build_design(lag_features, values.shape[1], None, True),
+                          pd.DataFrame(values[target_rows]))
+
+        else:
+
+            estimator.fit(self._build_design(lag_features, values.shape[1], row_trend_values, False),
+                          values[target_rows].ravel() if targets is None else targets)
+
+        return estimator
+
+    def _predict_step(self,
+                      estimator: Union[BoostedHybridModel, BaseEstimator],
+                      lag_features: np.ndarray,
+                      n_series: int,
+                      trend_values: Union[np.ndarray, None],
+                      trend_features: Union[pd.DataFrame, None]) -> np.ndarray:
+        """
+        Predicts all the series for a single time step
+
+        Args:
+            estimator: Fitted BoostedHybridModel or Scikit-Learn compatible regressor
+            lag_features: NumPy array of shape (series, lags)
+            n_series: Integer number of series
+            trend_values: NumPy array of shape (1, trend features) or None
+            trend_features: Pandas dataframe with the single row of trend features or None
+
+        Returns:
+            predictions: NumPy array of shape (series,)
+        """
+        # Switch between Boosted Hybrid Model and Scikit-Learn regressors
+        if isinstance(estimator, BoostedHybridModel):
+
+            return estimator.predict(pd.DataFrame(trend_features.to_numpy()),
+                                     self._build_design(lag_features, n_series, None, True)
+                                     ).to_numpy()[0]
+
+        return estimator.predict(self._build_design(lag_features, n_series, trend_values, False))
+
+    def _forecast_recursive(self,
+                            values: np.ndarray,
+                            trend_values: Union[np.ndarray, None],
+                            trend_features: Union[pd.DataFrame, None]) -> np.ndarray:
+        """
+        Forecasts the horizon with a one-step model whose lag features are updated
+        with its own predictions in a preallocated buffer
+
+        Args:
+            values: NumPy array of shape (max lag, series) with the history
+            trend_values: NumPy array of shape (horizon, trend features) or None
+            trend_features: Pandas dataframe of future trend features or None
+
+        Returns:
+            forecasts: NumPy array of shape (horizon, series)
+        """
+        # Retrieve lags
+        lags = np.asarray(self.lags)
+        max_lag = lags[-1]
+
+        # Preallocate the buffer with the history followed by the forecasts
+        buffer = np.empty((max_lag + self.horizon, values.shape[1]))
+        buffer[:max_lag] = values
+
+        # Preallocate the lag features
+        lag_features = np.empty((len(lags), values.shape[1]))
+
+        for step in range(self.horizon):
+
+            # Gather the lagged rows of the buffer in place
+            np.take(buffer, max_lag + step - lags, axis=0, out=lag_features)
+
+            # Predict the step and append it to the buffer
+            buffer[max_lag + step] = self._predict_step(
+                self.estimators[0],
+                lag_features.T,
+                values.shape[1],
+                None if trend_values is None else trend_values[step:step + 1],
+                None if trend_features is None else trend_features.iloc[step:step + 1]
+            )
+
+        return buffer[max_lag:]
+
+    def _forecast_direct(self,
+                         values: np.ndarray,
+                         trend_values: Union[np.ndarray, None],
+                         trend_features: Union[pd.DataFrame, None]) -> np.ndarray:
+        """
+        Forecasts the horizon with one model per step, feeding the DirRec models
+        with the forecasts of the previous steps
+
+        Args:
+            values: NumPy array of shape (max lag, series) with the history
+            trend_values: NumPy array of shape (horizon, trend features) or None
+            trend_features: Pandas dataframe of future trend features or None
+
+        Returns:
+            forecasts: NumPy array of shape (horizon, series)
+        """
+        # Retrieve lags
+        lags = np.asarray(self.lags)
+        max_lag = lags[-1]
+
+        # Preallocate the buffer with the history followed by the forecasts
+        buffer = np.empty((max_lag + self.horizon, values.shape[1]))
+        buffer[:max_lag] = values
+
+        # Lags from the forecast origin are shared by all the steps
+        origin_lag_features = buffer[max_lag - lags].T
+
+        for step in range(self.horizon):
+
+            # Add the forecasts of the previous steps for the DirRec strategy
+            if self.strategy == 'dirrec' and step > 0:
+                lag_features = np.hstack([origin_lag_features,
+                                          buffer[max_lag + step - np.arange(1, step + 1)].T])
+            else:
+                lag_features = origin_lag_features
+
+            # Predict the step
+            buffer[max_lag + step] = self._predict_step(
+                self.estimators[step],
+                lag_features,
+                values.shape[1],
+                None if trend_values is None else trend_values[step:step + 1],
+                None if trend_features is None else trend_features.iloc[step:step + 1]
+            )
+
+        return buffer[max_lag:]
+
+    def _forecast_multi_output(self,
+                               values: np.ndarray,
+                               trend_values: Union[np.ndarray, None]) -> np.ndarray:
+        """
+        Forecasts the horizon with a single multi-output model
+
+        Args:
+            values: NumPy array of shape (max lag, series) with the history
+            trend_values: NumPy array of shape (horizon, trend features) or None
+
+        Returns:
+            forecasts: NumPy array of shape (horizon, series)
+        """
+        # Lags from the forecast origin
+        lag_features = values[len(values) - np.asarray(self.lags)].T
+
+        # Predict all the steps at once with the trend of the first step
+        predictions = self.estimators[0].predict(
+            self._build_design(lag_features,
+                               values.shape[1],
+                               None if trend_values is None else trend_values[:1],
+                               False)
+        )
+
+        return np.asarray(predictions).reshape(values.shape[1], self.horizon).T
@@ -0,0 +1,208 @@
+"""
+The module contains util functions for training several models in parallel processes,
+sharing the training data with the workers through memory-mapped arrays
+"""
+# Import Standard Libraries
+from __future__ import annotations
+import os
+import time
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.general_utils.general_utils import LazyModule
+from src.logging_module.logging_module import get_logger
+
+# Import Joblib and Scikit-Learn lazily
+if TYPE_CHECKING:
+    from sklearn.base import BaseEstimator
+
+joblib = LazyModule('joblib')
+sklearn_base = LazyModule('sklearn.base')
+
+# Setup logger
+logger = get_logger(os.path.basename(__file__).split('.')[0],
+                    Path(__file__).parents[1] /
+                    'logging_module' /
+                    'log_configuration.yaml')
+
+
+def share_arrays(arrays: Dict[str, np.ndarray],
+                 folder: Path) -> Dict[str, np.ndarray]:
+    """
+    Write the arrays into the folder and reopen them as read-only memory-mapped arrays,
+    which are sent to the worker processes by file reference instead of being pickled
+
+    Args:
+        arrays: Dictionary of NumPy arrays to share (None values are kept as they are)
+        folder: pathlib.Path folder where to write the arrays
+
+    Returns:
+        shared_arrays: Dictionary of read-only memory-mapped NumPy arrays
+    """
+    logger.info('share_arrays - Start')
+
+    # Initialise the shared arrays
+    shared_arrays = {}
+
+    for name, array in arrays.items():
+
+        # Keep missing arrays
+        if array is None:
+            shared_arrays[name] = None
+            continue
+
+        logger.info('share_arrays - Sharing %s of shape %s', name, array.shape)
+
+        # Write the array and reopen it as memory-mapped
+        np.save(folder / f'{name}.npy', np.ascontiguousarray(array))
+        shared_arrays[name] = np.load(folder / f'{name}.npy', mmap_mode='r')
+
+    logger.info('share_arrays - End')
+
+    return shared_arrays
+
+
+def _timed_fit(fit_function: Callable,
+               step: int,
+               shared_arrays: Dict[str, np.ndarray]) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call the fit function for a step and time it
+
+    Args:
+        fit_function: Callable fitting the model of a step with signature (step, **shared_arrays)
+        step: Integer step of the horizon
+        shared_arrays: Dictionary of NumPy arrays passed to the fit function
+
+    Returns:
+        model: Fitted model returned by the fit function
+        timing: Dictionary with step, fit seconds and worker process id
+    """
+    # Fit the model of the step
+    start_time = time.perf_counter()
+    model = fit_function(step, **shared_arrays)
+
+    return model, {'step': step,
+                   'fit_seconds': time.perf_counter() - start_time,
+                   'process_id': os.getpid()}
+
+
+def run_parallel_fits(fit_function: Callable,
+                      steps: List[int],
+                      arrays: Dict[str, np.ndarray],
+                      n_jobs: int = None) -> Tuple[List[Any], pd.DataFrame]:
+    """
+    Run the fit function for each step in parallel worker processes
+
+    The arrays are shared with the workers as memory-mapped files and the threads
+    of each worker (e.g. XGBoost, BLAS) are capped to avoid oversubscription
+
+    Args:
+        fit_function: Picklable callable fitting the model of a step with signature (step, **arrays)
+        steps: List of integer steps of the horizon
+        arrays: Dictionary of NumPy arrays passed to the fit function
+        n_jobs: Integer number of worker processes (None or 1 to fit sequentially, -1 for all cores)
+
+    Returns:
+        models: List of fitted models ordered as 'steps'
+        timing_report: Pandas DataFrame with step, fit seconds and worker process id
+    """
+    logger.info('run_parallel_fits - Start')
+
+    # Retrieve the number of workers
+    n_workers = 1 if n_jobs is None else min(len(steps), joblib.cpu_count() if n_jobs < 0 else n_jobs)
+
+    logger.info('run_parallel_fits - Steps: %s | Workers: %s', len(steps), n_workers)
+
+    # Switch between sequential and parallel fits
+    if n_workers <= 1:
+
+        results = [_timed_fit(fit_function, step, arrays) for step in steps]
+
+    else:
+
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as folder:
+
+            # Share the arrays with the workers
+            shared_arrays = share_arrays(arrays, Path(folder))
+
+            # Fit the steps with capped threads per worker
+            with joblib.parallel_config(backend='loky',
+                                        inner_max_num_threads=max(1, joblib.cpu_count() // n_workers)):
+                results = joblib.Parallel(n_jobs=n_workers)(
+                    joblib.delayed(_timed_fit)(fit_function, step, shared_arrays) for step in steps
+                )
+
+    # Split models and timings
+    models = [model for model, _ in results]
+    timing_report = pd.DataFrame([timing for _, timing in results])
+
+    logger.info('run_parallel_fits - Total fit seconds: %.2f', timing_report['fit_seconds'].sum())
+
+    logger.info('run_parallel_fits - End')
+
+    return models, timing_report
+
+
+def _fit_horizon_model(step: int,
+                       estimator: BaseEstimator,
+                       features: np.ndarray,
+                       targets: np.ndarray) -> BaseEstimator:
+    """
+    Fit a copy of the estimator on the targets of a step, skipping missing targets
+
+    Args:
+        step: Integer step of the horizon (starting from 1)
+        estimator: Scikit-Learn compatible regressor
+        features: NumPy array of shape (samples, features)
+        targets: NumPy array of shape (samples, horizon)
+
+    Returns:
+        model: Fitted copy of the estimator
+    """
+    # Retrieve the available targets of the step
+    step_targets = targets[:, step - 1]
+    available = ~np.isnan(step_targets)
+
+    return sklearn_base.clone(estimator).fit(features[available], step_targets[available])
+
+
+def fit_horizon_models(estimator: BaseEstimator,
+                       features: np.ndarray,
+                       targets: np.ndarray,
+                       n_jobs: int = None) -> Tuple[List[BaseEstimator], pd.DataFrame]:
+    """
+    Fit one copy of the estimator per step of the horizon in parallel (direct strategy),
+    sharing the feature matrix with the workers
+
+    Args:
+        estimator: Scikit-Learn compatible regressor
+        features: NumPy array of shape (samples, features)
+        targets: NumPy array of shape (samples, horizon), with NaN where the target is unavailable
+        n_jobs: Integer number of worker processes (None or 1 to fit sequentially, -1 for all cores)
+
+    Returns:
+        models: List of fitted estimators, one per step
+        timing_report: Pandas DataFrame with step, fit seconds and worker process id
+    """
+    logger.info('fit_horizon_models - Start')
+
+    # Check targets
+    if targets.ndim != 2 or len(targets) != len(features):
+
+        raise ValueError('fit_horizon_models - Targets must have shape (samples, horizon)')
+
+    # Fit the models of all the steps
+    models, timing_report = run_parallel_fits(partial(_fit_horizon_model, estimator=estimator),
+                                              list(range(1, targets.shape[1] + 1)),
+                                              {'features': np.asarray(features, dtype=np.float64),
+                                               'targets': np.asarray(targets, dtype=np.float64)},
+                                              n_jobs)
+
+    logger.info('fit_horizon_models - End')
+
+    return models, timing_report
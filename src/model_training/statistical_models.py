@@ -0,0 +1,383 @@
+"""
+The module contains the classes for fitting a statistical model (auto-ARIMA, SARIMAX, Exponential Smoothing)
+on each series of a wide panel in parallel processes, with a timeout per series
+"""
+# Import Standard Libraries
+import contextlib
+import pathlib
+import signal
+import threading
+import warnings
+from functools import partial
+from typing import Any, Dict, Iterator, List, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Import Package Modules
+from src.general_utils.general_utils import LazyModule
+from src.logging_module.logging_module import get_logger
+from src.model_training.parallel_training import run_parallel_fits
+
+# Import Pmdarima and Statsmodels lazily
+pmdarima = LazyModule('pmdarima')
+statsmodels_api = LazyModule('statsmodels.tsa.api')
+
+# Define the accepted statistical models and the status of the fitted series
+STATISTICAL_MODELS = ['auto_arima', 'sarimax', 'exponential_smoothing']
+SERIES_STATUSES = ['fitted', 'timeout', 'failed']
+
+
+def _raise_timeout(_signal_number: int,
+                   _frame: Any):
+    """
+    Raise a TimeoutError when the alarm signal of time_limit is received
+
+    Args:
+        _signal_number: Integer number of the received signal
+        _frame: Current stack frame
+
+    Returns:
+    """
+    raise TimeoutError('time_limit - Time limit reached')
+
+
+@contextlib.contextmanager
+def time_limit(seconds: Union[float, None]) -> Iterator[None]:
+    """
+    Raise a TimeoutError in the wrapped block once the seconds are elapsed.
+    The limit relies on the alarm signal, so it is applied only in the main thread of a process
+    on Unix systems (as the worker processes of run_parallel_fits) and ignored otherwise
+
+    Args:
+        seconds: Float number of seconds (None for no limit)
+
+    Returns:
+    """
+    # Skip the limit where the alarm signal is unavailable
+    if seconds is None or not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    # Set the alarm
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+
+    try:
+        yield
+    finally:
+        # Clear the alarm
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def build_forecast_index(index: pd.Index,
+                         horizon: int) -> pd.Index:
+    """
+    Build the index of the forecast time steps following the last time step of the panel
+
+    Args:
+        index: Pandas Index of the panel (a DatetimeIndex or PeriodIndex with frequency is extended)
+        horizon: Integer number of forecast time steps
+
+    Returns:
+        forecast_index: Pandas Index of the forecast time steps (a RangeIndex following the positions otherwise)
+    """
+    # Extend the time steps with a frequency
+    if getattr(index, 'freq', None) is not None:
+        return pd.Index([index[-1] + step * index.freq for step in range(1, horizon + 1)], name=index.name)
+
+    return pd.RangeIndex(len(index), len(index) + horizon)
+
+
+def _flatten_params(params: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flatten the numeric parameters, expanding the array parameters (e.g. 'initial_seasons')
+    into one entry per element and skipping the missing and the boolean ones
+
+    Args:
+        params: Dictionary of parameters of a fitted model
+
+    Returns:
+        flat_params: Dictionary of float parameters
+    """
+    # Initialise the flat parameters
+    flat_params = {}
+
+    for name, value in params.items():
+
+        # Skip the non-numeric parameters
+        if value is None or isinstance(value, (bool, np.bool_, str)):
+            continue
+
+        values = np.atleast_1d(np.asarray(value, dtype=np.float64))
+        flat_params.update({name: values[0]} if values.size == 1
+                           else {f'{name}_{i}': element for i, element in enumerate(values)})
+
+    return flat_params
+
+
+def _fit_statistical_model(y_series: np.ndarray,
+                           model: str,
+                           parameters: Dict[str, Any],
+                           horizon: int) -> Tuple[Dict[str, float], np.ndarray]:
+    """
+    Fit the statistical model on a series and forecast the horizon
+
+    Args:
+        y_series: NumPy array of the series values
+        model: String statistical model (accepted values: STATISTICAL_MODELS)
+        parameters: Dictionary of parameters of the model (e.g. {'order': (1, 0, 1)} for the SARIMAX)
+        horizon: Integer number of forecast time steps
+
+    Returns:
+        params: Dictionary of float fitted parameters
+        forecast: NumPy array of shape (horizon,)
+    """
+    # Switch between models
+    match model:
+        case 'auto_arima':
+            fitted_model = pmdarima.auto_arima(y_series, **parameters)
+            params = dict(zip('pdqPDQm', fitted_model.order + fitted_model.seasonal_order))
+            params.update(zip(fitted_model.arima_res_.model.param_names, fitted_model.params()))
+            forecast = fitted_model.predict(n_periods=horizon)
+        case 'sarimax':
+            fitted_model = statsmodels_api.SARIMAX(y_series, **parameters).fit(disp=False)
+            params = dict(zip(fitted_model.model.param_names, fitted_model.params))
+            forecast = fitted_model.forecast(horizon)
+        case _:
+            fitted_model = statsmodels_api.ExponentialSmoothing(y_series, **parameters).fit()
+            params = fitted_model.params
+            forecast = fitted_model.forecast(horizon)
+
+    return _flatten_params(params), np.asarray(forecast, dtype=np.float64)
+
+
+def _fit_series(series: int,
+                model: str,
+                parameters: Dict[str, Any],
+                horizon: int,
+                timeout: Union[float, None],
+                y: np.ndarray) -> Dict[str, Any]:
+    """
+    Fit the statistical model on a series of the panel within the timeout,
+    returning missing parameters and forecasts if the fit times out or fails
+
+    Args:
+        series: Integer position of the series in the panel
+        model: String statistical model (accepted values: STATISTICAL_MODELS)
+        parameters: Dictionary of parameters of the model
+        horizon: Integer number of forecast time steps
+        timeout: Float number of seconds allowed to the fit (None for no limit)
+        y: NumPy array of shape (time steps, series)
+
+    Returns:
+        series_result: Dictionary with status, error, params and forecast of the series
+    """
+    # Import the model library before silencing the warnings, since Statsmodels sets its warning filters at import
+    getattr(pmdarima if model == 'auto_arima' else statsmodels_api, '__name__')
+
+    # Initialise the result of the series
+    series_result = {'status': 'fitted', 'error': '', 'params': {}, 'forecast': np.full(horizon, np.nan)}
+
+    try:
+
+        # Trim the leading missing values (e.g. stores opened after the first time step)
+        y_series = np.asarray(y[:, series], dtype=np.float64)
+        available = np.flatnonzero(~np.isnan(y_series))
+
+        if len(available) == 0:
+
+            raise ValueError('_fit_series - The series has no available values')
+
+        with time_limit(timeout), warnings.catch_warnings():
+
+            # Silence the convergence warnings of the single series
+            warnings.simplefilter('ignore', UserWarning)
+            warnings.simplefilter('ignore', RuntimeWarning)
+
+            series_result['params'], series_result['forecast'] = _fit_statistical_model(y_series[available[0]:],
+                                                                                        model,
+                                                                                        parameters,
+                                                                                        horizon)
+
+    except TimeoutError as error:
+
+        series_result.update({'status': 'timeout', 'error': str(error)})
+
+    except Exception as error:  # pylint: disable=broad-exception-caught
+
+        series_result.update({'status': 'failed', 'error': f'{type(error).__name__}: {error}'})
+
+    return series_result
+
+
+class StatisticalModelResult:
+    """
+    The class stores the fitted parameters and the forecasts of the series as compact arrays,
+    with a method to expand them into Pandas DataFrames
+
+    Attributes:
+        series: Pandas Index of the series
+        forecast_index: Pandas Index of the forecast time steps
+        param_names: List of string parameter names (union over the series)
+        params: NumPy array of shape (series, params) ordered as 'param_names', NaN where unavailable
+        forecasts: NumPy array of shape (horizon, series), NaN for the series not fitted
+        status: NumPy array of string status of each series (accepted values: SERIES_STATUSES)
+        timing_report: Pandas DataFrame with series, status, error, fit seconds and worker process id
+    """
+
+    def __init__(self,
+                 series: pd.Index,
+                 forecast_index: pd.Index,
+                 param_names: List[str],
+                 params: np.ndarray,
+                 forecasts: np.ndarray,
+                 status: np.ndarray,
+                 timing_report: pd.DataFrame):
+        """
+        Constructor for the StatisticalModelResult class
+
+        Args:
+            series: Pandas Index of the series
+            forecast_index: Pandas Index of the forecast time steps
+            param_names: List of string parameter names (union over the series)
+            params: NumPy array of shape (series, params) ordered as 'param_names', NaN where unavailable
+            forecasts: NumPy array of shape (horizon, series), NaN for the series not fitted
+            status: NumPy array of string status of each series (accepted values: SERIES_STATUSES)
+            timing_report: Pandas DataFrame with series, status, error, fit seconds and worker process id
+        """
+        self.series = series
+        self.forecast_index = forecast_index
+        self.param_names = list(param_names)
+        self.params = params
+        self.forecasts = forecasts
+        self.status = status
+        self.timing_report = timing_report
+
+    def to_frame(self,
+                 values: str = 'forecasts') -> pd.DataFrame:
+        """
+        Expand the forecasts or the parameters into a DataFrame
+
+        Args:
+            values: String values to expand (accepted values: ['forecasts', 'params'])
+
+        Returns:
+            frame: Pandas DataFrame of forecasts (one column per series) or of parameters (one row per series)
+        """
+        # Switch between the values
+        match values:
+            case 'forecasts':
+                return pd.DataFrame(self.forecasts, index=self.forecast_index, columns=self.series)
+            case 'params':
+                return pd.DataFrame(self.params, index=self.series, columns=self.param_names)
+            case _:
+                raise ValueError('to_frame - Unrecognised values')
+
+
+class StatisticalModelRunner:
+    """
+    The class fits a statistical model on each series of a wide panel (e.g. the ~1,800 store and family
+    series) in parallel worker processes, capping the BLAS threads of each worker to its share of the cores
+    to avoid oversubscription, with a timeout per series, and collects the fitted parameters and the forecasts
+    into arrays
+
+    Attributes:
+        model: String statistical model (accepted values: STATISTICAL_MODELS)
+        parameters: Dictionary of parameters shared by the models of all the series
+        horizon: Integer number of forecast time steps
+        timeout: Float number of seconds allowed to the fit of each series
+        n_jobs: Integer number of worker processes
+    """
+
+    def __init__(self,
+                 model: str,
+                 parameters: Dict[str, Any] = None,
+                 horizon: int = 1,
+                 timeout: float = None,
+                 n_jobs: int = None):
+        """
+        Constructor for the StatisticalModelRunner class
+
+        Args:
+            model: String statistical model (accepted values: STATISTICAL_MODELS)
+            parameters: Dictionary of parameters shared by the models of all the series
+                        (e.g. {'seasonal': True, 'm': 7} for the auto-ARIMA)
+            horizon: Integer number of forecast time steps
+            timeout: Float number of seconds allowed to the fit of each series (None for no limit)
+            n_jobs: Integer number of worker processes (None or 1 to fit sequentially, -1 for all cores)
+        """
+        # Setup logger
+        self.logger = get_logger(__class__.__name__,
+                                 pathlib.Path(__file__).parents[1] /
+                                 'logging_module' /
+                                 'log_configuration.yaml')
+
+        self.logger.info('__init__ - Initialise object attributes')
+
+        # Check the model and the horizon
+        if model not in STATISTICAL_MODELS:
+
+            raise ValueError(f'__init__ - Model must be in {STATISTICAL_MODELS}')
+
+        if horizon < 1:
+
+            raise ValueError('__init__ - The horizon must be at least 1')
+
+        # Initialise object attributes
+        self.model = model
+        self.parameters = {} if parameters is None else dict(parameters)
+        self.horizon = horizon
+        self.timeout = timeout
+        self.n_jobs = n_jobs
+
+    def run(self,
+            y: pd.DataFrame) -> StatisticalModelResult:
+        """
+        Fit the model on each series and forecast the horizon after the last time step
+
+        Args:
+            y: Pandas dataframe containing target values with one column per series
+
+        Returns:
+            result: StatisticalModelResult with the parameters and the forecasts of each series
+        """
+        self.logger.info('run - Start')
+
+        self.logger.info('run - Model: %s | Series: %s | Horizon: %s', self.model, y.shape[1], self.horizon)
+
+        # Fit the series in parallel, sharing the panel with the workers
+        results, timing_report = run_parallel_fits(partial(_fit_series,
+                                                           model=self.model,
+                                                           parameters=self.parameters,
+                                                           horizon=self.horizon,
+                                                           timeout=self.timeout),
+                                                   list(range(y.shape[1])),
+                                                   {'y': y.to_numpy(dtype=np.float64)},
+                                                   self.n_jobs)
+
+        # Collect the parameters into an array over the union of their names
+        param_names = list(dict.fromkeys(name for series_result in results for name in series_result['params']))
+        params = np.array([[series_result['params'].get(name, np.nan) for name in param_names]
+                           for series_result in results]).reshape(len(results), len(param_names))
+
+        # Collect the status of the series
+        status = np.array([series_result['status'] for series_result in results])
+        timing_report = timing_report.rename(columns={'step': 'position'})
+        timing_report.insert(1, 'series', y.columns.to_flat_index())
+        timing_report.insert(2, 'status', status)
+        timing_report.insert(3, 'error', [series_result['error'] for series_result in results])
+
+        self.logger.info('run - Status: %s', dict(zip(*np.unique(status, return_counts=True))))
+
+        result = StatisticalModelResult(y.columns,
+                                        build_forecast_index(y.index, self.horizon),
+                                        param_names,
+                                        params,
+                                        np.column_stack([series_result['forecast'] for series_result in results]),
+                                        status,
+                                        timing_report)
+
+        self.logger.info('run - End')
+
+        return result
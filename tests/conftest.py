@@ -4,6 +4,8 @@ for running PyTest tests
 """
 # Import Standard Libraries
 import pathlib
+from typing import Tuple
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.linear_model import LinearRegression
@@ -15,6 +17,7 @@ from src.general_utils.general_utils import (
     read_data_from_config
 )
 from src.model_training.model_training import BoostedHybridModel
+from src.data_preparation.feature_pipeline import FeaturePipeline
 
 # Read configuration file
 configuration = read_configuration(pathlib.Path(__file__).parents[1]
@@ -62,6 +65,123 @@ def fixture_exception_data_config(
     return test_exception_data_config
 
 
+@pytest.fixture
+def fixture_chunked_data_config(
+        test_chunked_data_config: dict = configuration['test_chunked_data_config']
+) -> dict:
+    """
+    Fixture for a Dictionary test chunked data config with structure:
+        <data_config_name>:
+            data_path: list[str]
+            date_columns: list[str]
+            delimiter: str
+            chunksize: int
+            usecols: list[str]
+            dtype: dict[str, str]
+            filters: list[[column, operator, value]]
+
+    Args:
+        test_chunked_data_config: Dictionary of data configuration
+
+    Returns:
+        test_chunked_data_config: Dictionary of data configuration
+    """
+
+    return test_chunked_data_config
+
+
+@pytest.fixture
+def fixture_exception_chunked_data_config(
+        test_exception_chunked_data_config: dict = configuration['test_exception_chunked_data_config']
+) -> dict:
+    """
+    Fixture for a Dictionary test exception chunked data config with structure:
+        <data_config_name>:
+            data_path: list[str]
+            delimiter: str
+            chunksize: int
+
+    Args:
+        test_exception_chunked_data_config: Dictionary of data configuration
+
+    Returns:
+        test_exception_chunked_data_config: Dictionary of data configuration
+    """
+
+    return test_exception_chunked_data_config
+
+
+@pytest.fixture
+def fixture_cached_data_config(
+        tmp_path: pathlib.Path,
+        test_cached_data_config: dict = configuration['test_cached_data_config']
+) -> dict:
+    """
+    Fixture for a Dictionary test cached data config, caching into a temporary folder, with structure:
+        <data_config_name>:
+            data_path: list[str]
+            date_columns: list[str]
+            delimiter: str
+            cache: bool
+            cache_folder: list[str]
+            cache_format: str
+
+    Args:
+        tmp_path: pathlib.Path temporary folder
+        test_cached_data_config: Dictionary of data configuration
+
+    Returns:
+        test_cached_data_config: Dictionary of data configuration
+    """
+
+    return {**test_cached_data_config, 'cache_folder': [tmp_path.as_posix()]}
+
+
+@pytest.fixture
+def fixture_feature_pipeline(
+        tmp_path: pathlib.Path,
+        pipeline_config: dict = configuration['test_feature_pipeline_config']
+) -> FeaturePipeline:
+    """
+    Fixture for an object of class src.data_preparation.feature_pipeline.FeaturePipeline,
+    caching into a temporary folder
+
+    Args:
+        tmp_path: pathlib.Path temporary folder
+        pipeline_config: Dictionary of pipeline configuration
+
+    Returns:
+        pipeline: FeaturePipeline object instance
+    """
+    # Instance the object
+    pipeline = FeaturePipeline(pipeline_config['steps'],
+                               tmp_path,
+                               pipeline_config['cache_format'])
+
+    return pipeline
+
+
+@pytest.fixture
+def fixture_optimized_data_config(
+        test_optimized_data_config: dict = configuration['test_optimized_data_config']
+) -> dict:
+    """
+    Fixture for a Dictionary test optimized data config with structure:
+        <data_config_name>:
+            data_path: list[str]
+            delimiter: str
+            optimize_memory: dict
+
+    Args:
+        test_optimized_data_config: Dictionary of data configuration
+
+    Returns:
+        test_optimized_data_config: Dictionary of data configuration
+    """
+
+    return test_optimized_data_config
+
+
 @pytest.fixture
 def fixture_test_boosted_hybrid_model_data(
         data_config: dict = configuration['test_boosted_hybrid_model_data_config']
@@ -106,6 +226,72 @@ def fixture_test_boosted_hybrid_model() -> BoostedHybridModel:
     return model
 
 
+@pytest.fixture
+def fixture_test_boosted_hybrid_model_features(
+        request: pytest.FixtureRequest
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Fixture for trend features, serial features and target of a Boosted Hybrid Model
+
+    Args:
+        request: pytest.FixtureRequest required to get the Boosted Hybrid Model data fixture
+
+    Returns:
+        trend_features: Pandas DataFrame with constant, linear and quadratic trend
+        serial_features: Pandas DataFrame with stacked encoded industry and month
+        y: Pandas DataFrame target values
+    """
+    # Define target
+    y = request.getfixturevalue('fixture_test_boosted_hybrid_model_data')
+
+    # Define trend features
+    time_step = np.arange(1, len(y) + 1, dtype=np.float64)
+    trend_features = pd.DataFrame({'const': 1.0,
+                                   'trend': time_step,
+                                   'trend_squared': time_step ** 2},
+                                  index=y.index)
+
+    # Define serial features by stacking the series
+    serial_features = y.stack(future_stack=True).drop(columns='Sales').reset_index('Industries')
+    serial_features['Industries'], _ = serial_features['Industries'].factorize()
+    serial_features['Month'] = serial_features.index.month
+
+    return trend_features, serial_features, y
+
+
+@pytest.fixture
+def fixture_test_boosted_hybrid_model_unsorted_features(
+        request: pytest.FixtureRequest
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Fixture for trend features, serial features and target of a Boosted Hybrid Model
+    whose series are not sorted by label
+
+    Args:
+        request: pytest.FixtureRequest required to get the Boosted Hybrid Model features fixture
+
+    Returns:
+        trend_features: Pandas DataFrame with constant, linear and quadratic trend
+        serial_features: Pandas DataFrame with stacked encoded industry, month and first lag of the target,
+                         stacked with the default 'y.stack()' (series sorted by label)
+        y: Pandas DataFrame target values with the series in reverse label order
+    """
+    trend_features, _, y = request.getfixturevalue('fixture_test_boosted_hybrid_model_features')
+
+    # Reverse the series and shift one of them, so that the series are distinguishable
+    y = y.iloc[:, ::-1].copy()
+    y.iloc[:, 0] += 1_000
+
+    # Define serial features by stacking the series as users do (sorted by label)
+    stacked_y = y.stack()
+    serial_features = stacked_y.drop(columns='Sales').reset_index('Industries')
+    serial_features['Industries'], _ = serial_features['Industries'].factorize()
+    serial_features['Month'] = serial_features.index.month
+    serial_features['Lag1'] = stacked_y.groupby(level='Industries')['Sales'].shift(1).to_numpy()
+
+    return trend_features, serial_features, y
+
+
 @pytest.fixture
 def fixture_data_preparation_dataset(
         data_config: dict = configuration['test_data_preparation_dataset']
@@ -3,16 +3,34 @@ This test module includes all the tests for the
 module src.data_preparation
 """
 # Import Standard Modules
+import warnings
 from typing import List, Tuple
+import numpy as np
+import pandas as pd
 import pytest
+from statsmodels.tsa.deterministic import CalendarFourier, DeterministicProcess, Fourier
 
 # Import Package Modules
 from src.data_preparation.data_preparation_utils import (
     group_avg_column_by_frequency,
     add_dummy_time_step,
     add_lag_feature,
+    add_lag_features,
+    add_group_lag_features,
+    add_significant_lag_features,
+    add_group_rolling_features,
+    add_group_expanding_features,
     add_seasonality
 )
+from src.data_preparation.frequency_aggregation import AGGREGATION_STATISTICS, FrequencyAggregator
+from src.data_preparation.trend_features import TrendFeatureBuilder
+from src.data_preparation.feature_pipeline import FEATURE_STEPS, FeaturePipeline, modifies_input
+from src.exploratory_data_analysis.autocorrelation import propose_lags, select_panel_lags
+from src.data_preparation.calendar_features import (
+    compute_fourier_terms,
+    build_calendar_features,
+    add_calendar_features
+)
 
 
 @pytest.mark.parametrize('dataset_name, key, column, frequency, index, expected_output', [
@@ -48,6 +66,92 @@ def test_group_avg_column_by_frequency(dataset_name: str,
     assert grouped_data.loc[index, column] == expected_output
 
 
+@pytest.mark.parametrize('dataset_name, key, column, frequency, group_columns, shuffle, expected_sorted', [
+    ('fixture_data_preparation_dataset', 'date', 'transactions', 'W', None, False, True),
+    ('fixture_data_preparation_dataset', 'date', 'transactions', 'ME', 'store_nbr', False, False),
+    ('fixture_data_preparation_dataset', 'date', 'transactions', None, ['store_nbr'], False, True),
+    ('fixture_data_preparation_dataset', 'date', 'transactions', 'W', 'store_nbr', True, False),
+])
+def test_frequency_aggregator(dataset_name: str,
+                              key: str,
+                              column: str,
+                              frequency: str,
+                              group_columns: List[str],
+                              shuffle: bool,
+                              expected_sorted: bool,
+                              request: pytest.FixtureRequest) -> bool:
+    """
+    Test the class src.data_preparation.frequency_aggregation.FrequencyAggregator
+    against the Pandas groupby aggregations
+
+    Args:
+        dataset_name: String name of the dataset
+        key: String date column name
+        column: String column name to aggregate
+        frequency: String frequency of the date bins
+        group_columns: String column name or list of column names to group by
+        shuffle: Boolean indicating whether to shuffle the rows
+        expected_sorted: Boolean indicating whether the rows are expected to be reduced without sorting them
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+    dataset.loc[5, column] = np.nan
+    dataset = dataset.sample(frac=1, random_state=0) if shuffle else dataset
+
+    # Apply function to test
+    aggregator = FrequencyAggregator(dataset, key, frequency, group_columns)
+    aggregated_data = aggregator.aggregate(column, AGGREGATION_STATISTICS, quantiles=[0.1, 0.9])
+
+    # Compute the Pandas aggregations
+    grouper = [pd.Grouper(key=key, freq=frequency) if frequency else key]
+    grouper += [group_columns] if isinstance(group_columns, str) else list(group_columns or [])
+    grouped_column = dataset.groupby(grouper)[column]
+    expected_data = grouped_column.agg(AGGREGATION_STATISTICS)
+    expected_data['quantile_0.1'] = grouped_column.quantile(0.1)
+    expected_data['quantile_0.9'] = grouped_column.quantile(0.9)
+    expected_data = expected_data.reset_index()
+
+    assert (aggregator.order is None) == expected_sorted
+    pd.testing.assert_frame_equal(aggregated_data[grouper[1:]], expected_data[grouper[1:]], check_dtype=False)
+    np.testing.assert_array_equal(aggregated_data[key], expected_data[key])
+
+    for statistic in AGGREGATION_STATISTICS + ['quantile_0.1', 'quantile_0.9']:
+        np.testing.assert_allclose(aggregated_data[f'{column}_{statistic}'].to_numpy(dtype=np.float64),
+                                   expected_data[statistic].to_numpy(dtype=np.float64),
+                                   rtol=1e-9)
+
+
+@pytest.mark.parametrize('dataset_name, statistics, quantiles, expected_error', [
+    ('fixture_data_preparation_dataset', ['mode'], [], ValueError),
+    ('fixture_data_preparation_dataset', ['mean'], [1.5], ValueError),
+])
+def test_frequency_aggregator_exceptions(dataset_name: str,
+                                         statistics: List[str],
+                                         quantiles: List[float],
+                                         expected_error: ValueError,
+                                         request: pytest.FixtureRequest) -> bool:
+    """
+    Test exceptions the function src.data_preparation.frequency_aggregation.FrequencyAggregator.aggregate
+
+    Args:
+        dataset_name: String name of the dataset
+        statistics: List of wrong statistics
+        quantiles: List of wrong quantiles
+        expected_error: ValueError expected error
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    with pytest.raises(expected_error):
+        FrequencyAggregator(dataset, 'date', 'W').aggregate('transactions', statistics, quantiles)
+
+
 @pytest.mark.parametrize('dataset_name, column, expected_output', [
     ('fixture_data_preparation_dataset', 'time_step', 3)
 ])
@@ -106,6 +210,240 @@ def test_add_lag_feature(dataset_name: str,
     assert dataset.loc[index, column + '_lag_' + str(lag)] == expected_output
 
 
+@pytest.mark.parametrize('dataset_name, columns, lags', [
+    ('fixture_data_preparation_dataset', ['transactions', 'store_nbr'], [1, 2, 7]),
+    ('fixture_data_preparation_dataset', 'transactions', list(range(1, 36))),
+])
+def test_add_lag_features(dataset_name: str,
+                          columns: List[str],
+                          lags: List[int],
+                          request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.data_preparation_utils.add_lag_features
+    against the function src.data_preparation.data_preparation_utils.add_lag_feature,
+    checking that no fragmentation warning is raised
+
+    Args:
+        dataset_name: String name of the dataset
+        columns: List of column names of lag features
+        lags: List of integer lag values
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    # Apply function to test
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', pd.errors.PerformanceWarning)
+        lagged_dataset = add_lag_features(data=dataset.copy(), columns=columns, lags=lags)
+
+    # Compare with the single lag features
+    for column in [columns] if isinstance(columns, str) else columns:
+        for lag in lags:
+            expected_lag = add_lag_feature(data=dataset[[column]].copy(), column=column, lag=lag)
+            pd.testing.assert_series_equal(lagged_dataset[f'{column}_lag_{lag}'],
+                                           expected_lag[f'{column}_lag_{lag}'],
+                                           check_dtype=False)
+
+
+@pytest.mark.parametrize('dataset_name, column, lags, expected_error', [
+    ('fixture_data_preparation_dataset', 'transactions', [0, 1], ValueError),
+    ('fixture_data_preparation_dataset', 'transactions', [], ValueError),
+])
+def test_add_lag_features_exceptions(dataset_name: str,
+                                     column: str,
+                                     lags: List[int],
+                                     expected_error: ValueError,
+                                     request: pytest.FixtureRequest) -> bool:
+    """
+    Test exceptions the function src.data_preparation.data_preparation_utils.add_lag_features
+
+    Args:
+        dataset_name: String name of the dataset
+        column: String column name of lag features
+        lags: List of integer lag values
+        expected_error: ValueError expected error
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    with pytest.raises(expected_error):
+        add_lag_features(data=dataset, columns=column, lags=lags)
+
+
+@pytest.mark.parametrize('dataset_name, column, group_column, sort_column, lags', [
+    ('fixture_data_preparation_dataset', 'transactions', 'store_nbr', 'date', [1, 7]),
+])
+def test_add_group_lag_features(dataset_name: str,
+                                column: str,
+                                group_column: str,
+                                sort_column: str,
+                                lags: List[int],
+                                request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.data_preparation_utils.add_group_lag_features
+    against the Pandas group-by shift on shuffled rows
+
+    Args:
+        dataset_name: String name of the dataset
+        column: String column name of the lag features
+        group_column: String column name identifying the series
+        sort_column: String column name to sort the rows of each group by
+        lags: List of integer lag values
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve and shuffle dataset fixture
+    dataset = request.getfixturevalue(dataset_name).sample(frac=1, random_state=0)
+
+    # Apply function to test
+    lagged_dataset = add_group_lag_features(dataset, column, lags, group_column, sort_column)
+
+    # Compute the expected lags
+    sorted_dataset = dataset.sort_values(sort_column, kind='stable')
+
+    for lag in lags:
+        pd.testing.assert_series_equal(lagged_dataset[f'{column}_lag_{lag}'],
+                                       sorted_dataset.groupby(group_column)[column].shift(lag).reindex(dataset.index),
+                                       check_names=False)
+
+
+@pytest.mark.parametrize('dataset_name, column, group_column, sort_column, method, min_share', [
+    ('fixture_data_preparation_dataset', 'transactions', 'store_nbr', 'date', 'pacf', 0.5),
+    ('fixture_data_preparation_dataset', 'transactions', 'store_nbr', 'date', 'acf', 0.9)
+])
+def test_add_significant_lag_features(dataset_name: str,
+                                      column: str,
+                                      group_column: str,
+                                      sort_column: str,
+                                      method: str,
+                                      min_share: float,
+                                      request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.data_preparation_utils.add_significant_lag_features
+    by comparing its lags with the lags proposed for the pivoted series
+
+    Args:
+        dataset_name: String name of the dataset
+        column: String column name to compute lags with
+        group_column: String column name identifying the series
+        sort_column: String column name to sort the rows of each group by
+        method: String correlation method
+        min_share: Float minimum share of the series for which a lag must be significant
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    # Propose the lags of the pivoted series, aligned by position within the group
+    panel = dataset.sort_values([group_column, sort_column])
+    panel = panel.assign(position=panel.groupby(group_column).cumcount()).pivot(index='position',
+                                                                              columns=group_column,
+                                                                              values=column)
+    lags = select_panel_lags(propose_lags(panel, 28, method), min_share)
+
+    # Apply function to test
+    features = add_significant_lag_features(dataset, column, group_column, sort_column,
+                                            method=method, min_share=min_share, inplace=False)
+
+    assert len(lags) > 0
+    pd.testing.assert_frame_equal(features,
+                                  add_group_lag_features(dataset, column, lags, group_column, sort_column, inplace=False))
+
+
+@pytest.mark.parametrize('dataset_name, column, group_column, sort_column, windows', [
+    ('fixture_data_preparation_dataset', 'transactions', 'store_nbr', 'date', [3, 14]),
+])
+def test_add_group_window_features(dataset_name: str,
+                                   column: str,
+                                   group_column: str,
+                                   sort_column: str,
+                                   windows: List[int],
+                                   request: pytest.FixtureRequest) -> bool:
+    """
+    Test the functions src.data_preparation.data_preparation_utils.add_group_rolling_features and
+    src.data_preparation.data_preparation_utils.add_group_expanding_features
+    against the Pandas group-by shift, rolling and expanding on shuffled rows
+
+    Args:
+        dataset_name: String name of the dataset
+        column: String column name of the features
+        group_column: String column name identifying the series
+        sort_column: String column name to sort the rows of each group by
+        windows: List of integer window sizes
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve and shuffle dataset fixture
+    dataset = request.getfixturevalue(dataset_name).sample(frac=1, random_state=0)
+
+    # Apply functions to test
+    rolling_dataset = add_group_rolling_features(dataset, column, windows, group_column, sort_column=sort_column)
+    expanding_dataset = add_group_expanding_features(dataset, column, group_column, sort_column=sort_column)
+
+    # Compute the expected features
+    sorted_dataset = dataset.sort_values(sort_column, kind='stable')
+    shifted_column = sorted_dataset.groupby(group_column)[column].shift(1).groupby(sorted_dataset[group_column])
+
+    for statistic in ['mean', 'std', 'min', 'max']:
+
+        for window in windows:
+            expected_rolling = getattr(shifted_column.rolling(window, min_periods=1), statistic)()
+            pd.testing.assert_series_equal(rolling_dataset[f'{column}_rolling_{statistic}_{window}'],
+                                           expected_rolling.droplevel(0).reindex(dataset.index),
+                                           check_names=False)
+
+        expected_expanding = getattr(shifted_column.expanding(), statistic)()
+        pd.testing.assert_series_equal(expanding_dataset[f'{column}_expanding_{statistic}'],
+                                       expected_expanding.droplevel(0).reindex(dataset.index),
+                                       check_names=False)
+
+
+@pytest.mark.parametrize('dataset_name, function_name, arguments, expected_error', [
+    ('fixture_data_preparation_dataset', 'add_group_lag_features', {'lags': [0]}, ValueError),
+    ('fixture_data_preparation_dataset', 'add_group_rolling_features', {'windows': [0]}, ValueError),
+    ('fixture_data_preparation_dataset', 'add_group_rolling_features',
+     {'windows': [7], 'statistics': ['median']}, ValueError),
+    ('fixture_data_preparation_dataset', 'add_group_expanding_features', {'statistics': ['median']}, ValueError),
+])
+def test_add_group_window_features_exceptions(dataset_name: str,
+                                              function_name: str,
+                                              arguments: dict,
+                                              expected_error: ValueError,
+                                              request: pytest.FixtureRequest) -> bool:
+    """
+    Test exceptions the group window functions of src.data_preparation.data_preparation_utils
+
+    Args:
+        dataset_name: String name of the dataset
+        function_name: String name of the function to test
+        arguments: Dictionary of wrong arguments
+        expected_error: ValueError expected error
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    # Retrieve the function to test
+    function = {'add_group_lag_features': add_group_lag_features,
+                'add_group_rolling_features': add_group_rolling_features,
+                'add_group_expanding_features': add_group_expanding_features}[function_name]
+
+    with pytest.raises(expected_error):
+        function(data=dataset, columns='transactions', group_columns='store_nbr', **arguments)
+
+
 @pytest.mark.parametrize('dataset_name, column, seasonality, index, expected_output', [
     ('fixture_data_preparation_dataset', 'date', ['day_of_week'], 3, 'Wednesday'),
     ('fixture_data_preparation_dataset', 'date', ['week'], 5, 1),
@@ -165,3 +503,399 @@ def test_add_seasonality_exception(dataset_name: str,
 
     with pytest.raises(expected_error):
         add_seasonality(data=dataset, column=column, seasonality=seasonality)
+
+
+@pytest.mark.parametrize('dataset_name, function_name, arguments, expected_columns', [
+    ('fixture_data_preparation_dataset', 'add_dummy_time_step', {}, ['time_step']),
+    ('fixture_data_preparation_dataset', 'add_lag_feature', {'column': 'transactions', 'lag': 1},
+     ['transactions_lag_1']),
+    ('fixture_data_preparation_dataset', 'add_lag_features', {'columns': 'transactions', 'lags': [1, 7]},
+     ['transactions_lag_1', 'transactions_lag_7']),
+    ('fixture_data_preparation_dataset', 'add_group_lag_features',
+     {'columns': 'transactions', 'lags': [1], 'group_columns': 'store_nbr', 'sort_column': 'date'},
+     ['transactions_lag_1']),
+    ('fixture_data_preparation_dataset', 'add_significant_lag_features',
+     {'column': 'transactions', 'group_columns': 'store_nbr', 'sort_column': 'date', 'n_lags': 7, 'max_lags': 1},
+     ['transactions_lag_1']),
+    ('fixture_data_preparation_dataset', 'add_group_rolling_features',
+     {'columns': 'transactions', 'windows': [7], 'group_columns': 'store_nbr', 'statistics': ['mean']},
+     ['transactions_rolling_mean_7']),
+    ('fixture_data_preparation_dataset', 'add_group_expanding_features',
+     {'columns': 'transactions', 'group_columns': 'store_nbr', 'statistics': ['max']},
+     ['transactions_expanding_max']),
+    ('fixture_data_preparation_dataset', 'add_seasonality', {'column': 'date', 'seasonality': ['week', 'year']},
+     ['week', 'year']),
+    ('fixture_data_preparation_dataset', 'add_calendar_features', {'date_column': 'date', 'codes': ['month']},
+     ['month']),
+])
+def test_feature_functions_inplace(dataset_name: str,
+                                   function_name: str,
+                                   arguments: dict,
+                                   expected_columns: List[str],
+                                   request: pytest.FixtureRequest) -> bool:
+    """
+    Test the 'inplace' contract of the feature functions of src.data_preparation
+    through the function src.data_preparation.data_preparation_utils.attach_features
+
+    Args:
+        dataset_name: String name of the dataset
+        function_name: String name of the function to test
+        arguments: Dictionary of arguments of the function
+        expected_columns: List of expected feature column names
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+    original_dataset = dataset.copy()
+
+    # Apply function to test without modifying the data
+    features = FEATURE_STEPS[function_name](dataset, **arguments, inplace=False)
+
+    assert features.columns.tolist() == expected_columns
+    assert features.index.equals(dataset.index)
+    pd.testing.assert_frame_equal(dataset, original_dataset)
+
+    # Apply function to test in place
+    inplace_dataset = FEATURE_STEPS[function_name](dataset, **arguments, inplace=True)
+
+    assert inplace_dataset is dataset
+    assert dataset.columns.tolist() == original_dataset.columns.tolist() + expected_columns
+    pd.testing.assert_frame_equal(dataset[original_dataset.columns], original_dataset)
+    pd.testing.assert_frame_equal(dataset[expected_columns], features)
+
+
+@pytest.mark.parametrize('period, order', [
+    ('W', 3),
+    ('ME', 2),
+    ('QE', 2),
+    ('YE', 10),
+])
+def test_compute_fourier_terms(period: str,
+                               order: int) -> bool:
+    """
+    Test the function src.data_preparation.calendar_features.compute_fourier_terms
+    against the statsmodels CalendarFourier terms
+
+    Args:
+        period: String calendar period
+        order: Integer number of sine and cosine pairs
+
+    Returns:
+    """
+    # Define the dates over a leap year
+    dates = pd.date_range('2019-12-15', '2021-02-15', freq='D')
+
+    # Apply function to test
+    terms, _ = compute_fourier_terms(dates, period, order)
+
+    np.testing.assert_allclose(terms, CalendarFourier(freq=period, order=order).in_sample(dates), atol=1e-6)
+
+
+@pytest.mark.parametrize('dataset_name, date_column, codes, one_hot, fourier, expected_columns', [
+    ('fixture_data_preparation_dataset', 'date', ['day_of_week', 'week'], ['month'], {'YE': 2, 7: 1}, 20),
+])
+def test_add_calendar_features(dataset_name: str,
+                               date_column: str,
+                               codes: List[str],
+                               one_hot: List[str],
+                               fourier: dict,
+                               expected_columns: int,
+                               request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.calendar_features.add_calendar_features
+    by comparing the broadcast features with the features of each row date
+
+    Args:
+        dataset_name: String name of the dataset
+        date_column: String date column name
+        codes: List of calendar features to add as integer codes
+        one_hot: List of calendar features to add as one-hot indicators
+        fourier: Dictionary of periods and Fourier orders
+        expected_columns: Integer expected number of calendar features
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+
+    # Apply function to test
+    calendar_dataset = add_calendar_features(dataset, date_column, codes, one_hot, fourier, inplace=False)
+    calendar_columns = calendar_dataset.columns
+
+    # Compute the features of each row
+    expected_features = build_calendar_features(pd.DatetimeIndex(dataset[date_column]), codes, one_hot, fourier)
+
+    assert len(calendar_columns) == expected_columns
+    assert calendar_columns.intersection(dataset.columns).empty
+    assert (calendar_dataset[calendar_columns].dtypes == np.float32).all()
+    assert (calendar_dataset['day_of_week'] == dataset[date_column].dt.dayofweek).all()
+    assert (calendar_dataset.filter(like='month_').sum(axis=1) == 1).all()
+    np.testing.assert_array_equal(calendar_dataset[expected_features.columns], expected_features)
+
+
+@pytest.mark.parametrize('dataset_name, date_column, missing_rows', [
+    ('fixture_data_preparation_dataset', 'date', [0, 5]),
+])
+def test_add_calendar_features_missing_dates(dataset_name: str,
+                                             date_column: str,
+                                             missing_rows: List[int],
+                                             request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.calendar_features.add_calendar_features
+    by checking the rows with a missing date get missing features
+
+    Args:
+        dataset_name: String name of the dataset
+        date_column: String date column name
+        missing_rows: List of integer positions of the rows with a missing date
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture and remove some dates
+    dataset = request.getfixturevalue(dataset_name).copy()
+    dataset.iloc[missing_rows, dataset.columns.get_loc(date_column)] = pd.NaT
+
+    # Apply function to test
+    calendar_dataset = add_calendar_features(dataset, date_column, ['month'], ['day_of_week'], {7: 1}, inplace=False)
+    missing = dataset[date_column].isna().to_numpy()
+
+    assert calendar_dataset[missing].isna().all().all()
+    assert calendar_dataset[~missing].notna().all().all()
+    np.testing.assert_array_equal(calendar_dataset.loc[~missing, 'month'], dataset.loc[~missing, date_column].dt.month)
+
+
+@pytest.mark.parametrize('codes, one_hot, fourier, expected_error', [
+    (['wrong_feature'], [], None, ValueError),
+    ([], ['year'], None, ValueError),
+    ([], [], {'wrong_period': 2}, ValueError),
+    ([], [], {'YE': 0}, ValueError),
+])
+def test_build_calendar_features_exceptions(codes: List[str],
+                                            one_hot: List[str],
+                                            fourier: dict,
+                                            expected_error: ValueError) -> bool:
+    """
+    Test exceptions the function src.data_preparation.calendar_features.build_calendar_features
+
+    Args:
+        codes: List of calendar features to add as integer codes
+        one_hot: List of calendar features to add as one-hot indicators
+        fourier: Dictionary of periods and Fourier orders
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        build_calendar_features(pd.date_range('2024-01-01', periods=7, freq='D'), codes, one_hot, fourier)
+
+
+@pytest.mark.parametrize('index, order, fourier, steps', [
+    (pd.date_range('2017-01-01', periods=100, freq='D'), 3, {'YE': 2, 7: 2}, 20),
+    (pd.period_range('2017-01', periods=40, freq='M'), 1, {'YE': 3}, 12),
+    (pd.RangeIndex(0, 50), 2, {12: 1}, 5),
+])
+def test_trend_feature_builder(index: pd.Index,
+                               order: int,
+                               fourier: dict,
+                               steps: int) -> bool:
+    """
+    Test the functions in_sample and out_of_sample of
+    src.data_preparation.trend_features.TrendFeatureBuilder
+    against the statsmodels DeterministicProcess
+
+    Args:
+        index: Pandas in-sample index
+        order: Integer polynomial order of the trend
+        fourier: Dictionary of periods and Fourier orders
+        steps: Integer number of out-of-sample time steps
+
+    Returns:
+    """
+    # Define the builder and the expected deterministic process
+    builder = TrendFeatureBuilder(index, constant=True, order=order, fourier=fourier)
+    deterministic_process = DeterministicProcess(index,
+                                                 constant=True,
+                                                 order=order,
+                                                 additional_terms=[CalendarFourier(period, fourier_order)
+                                                                   if isinstance(period, str)
+                                                                   else Fourier(period, fourier_order)
+                                                                   for period, fourier_order in fourier.items()])
+
+    # Compare in-sample and out-of-sample features
+    for trend_features, expected_features in [(builder.in_sample(), deterministic_process.in_sample()),
+                                              (builder.out_of_sample(steps),
+                                               deterministic_process.out_of_sample(steps))]:
+        assert trend_features.index.equals(expected_features.index)
+        np.testing.assert_allclose(trend_features, expected_features, atol=1e-10)
+
+    # Compare a window beyond the in-sample index
+    np.testing.assert_allclose(builder.compute(len(index) + 2, steps - 2),
+                               deterministic_process.out_of_sample(steps).iloc[2:],
+                               atol=1e-10)
+
+
+def test_trend_feature_builder_exceptions() -> bool:
+    """
+    Test exceptions the class src.data_preparation.trend_features.TrendFeatureBuilder
+
+    Returns:
+    """
+    with pytest.raises(ValueError):
+        TrendFeatureBuilder(pd.RangeIndex(0, 10), fourier={'YE': 2})
+
+
+@pytest.mark.parametrize('dataset_name, changed_step, changed_parameters, expected_cache_hits', [
+    ('fixture_data_preparation_dataset', 2, {'lags': [1, 14]}, [True, True, False]),
+    ('fixture_data_preparation_dataset', 1, {'codes': ['month']}, [True, False, False]),
+])
+def test_feature_pipeline_run(fixture_feature_pipeline: FeaturePipeline,
+                              dataset_name: str,
+                              changed_step: int,
+                              changed_parameters: dict,
+                              expected_cache_hits: List[bool],
+                              request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.feature_pipeline.FeaturePipeline.run
+    by running the pipeline again, serving all the steps from the cache, and after changing
+    the parameters of a step, recomputing only that step and the following ones
+
+    Args:
+        fixture_feature_pipeline: FeaturePipeline object instance
+        dataset_name: String name of the dataset
+        changed_step: Integer position of the changed step
+        changed_parameters: Dictionary of the changed parameters
+        expected_cache_hits: List of expected cache hits after the change
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+    original_columns = list(dataset.columns)
+
+    # Run the pipeline twice
+    features = fixture_feature_pipeline.run(dataset)
+
+    assert not fixture_feature_pipeline.cache_report['cache_hit'].any()
+    assert list(dataset.columns) == original_columns
+
+    pd.testing.assert_frame_equal(fixture_feature_pipeline.run(dataset), features)
+
+    assert fixture_feature_pipeline.cache_report['cache_hit'].all()
+
+    # Change a step and run the pipeline again
+    fixture_feature_pipeline.steps[changed_step]['parameters'].update(changed_parameters)
+    fixture_feature_pipeline.run(dataset)
+
+    assert fixture_feature_pipeline.cache_report['cache_hit'].tolist() == expected_cache_hits
+
+    # Change the input and run the pipeline again
+    fixture_feature_pipeline.run(dataset.iloc[1:])
+
+    assert not fixture_feature_pipeline.cache_report['cache_hit'].any()
+
+
+@pytest.mark.parametrize('dataset_name, changed_step, expected_changed_keys', [
+    ('fixture_data_preparation_dataset', 1, [False, True, True]),
+    ('fixture_data_preparation_dataset', 2, [False, False, True]),
+])
+def test_feature_pipeline_build_step_keys(fixture_feature_pipeline: FeaturePipeline,
+                                          dataset_name: str,
+                                          changed_step: int,
+                                          expected_changed_keys: List[bool],
+                                          monkeypatch: pytest.MonkeyPatch,
+                                          request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.data_preparation.feature_pipeline.FeaturePipeline.build_step_keys
+    by checking the keys of a step and of the following ones change with the version and the code of the step
+
+    Args:
+        fixture_feature_pipeline: FeaturePipeline object instance
+        dataset_name: String name of the dataset
+        changed_step: Integer position of the changed step
+        expected_changed_keys: List of expected changes of the step keys
+        monkeypatch: pytest.MonkeyPatch to replace the function of the step
+        request: pytest.FixtureRequest required to get the dataset fixtures
+
+    Returns:
+    """
+    # Retrieve dataset fixture
+    dataset = request.getfixturevalue(dataset_name)
+    step_keys = fixture_feature_pipeline.build_step_keys(dataset)
+
+    # Change the version of the step
+    fixture_feature_pipeline.steps[changed_step]['version'] = 2
+    version_keys = fixture_feature_pipeline.build_step_keys(dataset)
+
+    assert [key != version_key for key, version_key in zip(step_keys, version_keys)] == expected_changed_keys
+
+    # Change the code of the step
+    function_name = fixture_feature_pipeline.steps[changed_step]['function']
+    monkeypatch.setitem(FEATURE_STEPS, function_name, lambda data, **parameters: data)
+    code_keys = fixture_feature_pipeline.build_step_keys(dataset)
+
+    assert [key != code_key for key, code_key in zip(version_keys, code_keys)] == expected_changed_keys
+
+
+@pytest.mark.parametrize('step, expected_modifies', [
+    ({'function': 'add_dummy_time_step'}, True),
+    ({'function': 'add_lag_feature', 'parameters': {'column': 'sales', 'lag': 1, 'inplace': False}}, False),
+    ({'function': 'group_avg_column_by_frequency', 'parameters': {}}, False),
+])
+def test_modifies_input(step: dict,
+                        expected_modifies: bool) -> bool:
+    """
+    Test the function src.data_preparation.feature_pipeline.modifies_input
+
+    Args:
+        step: Dictionary of the step
+        expected_modifies: Boolean expected flag of the step modifying its input
+
+    Returns:
+    """
+    assert modifies_input(step) == expected_modifies
+
+
+@pytest.mark.parametrize('file_name, pipeline_name, expected_steps', [
+    ('feature_pipeline_config.toml', 'store_sales', ['calendar', 'sales_lags', 'sales_rolling']),
+])
+def test_feature_pipeline_from_config(file_name: str,
+                                      pipeline_name: str,
+                                      expected_steps: List[str]) -> bool:
+    """
+    Test the function src.data_preparation.feature_pipeline.FeaturePipeline.from_config
+
+    Args:
+        file_name: String configuration file name
+        pipeline_name: String section of the pipeline
+        expected_steps: List of expected step names
+
+    Returns:
+    """
+    # Build the pipeline
+    pipeline = FeaturePipeline.from_config(file_name, pipeline_name)
+
+    assert [step['name'] for step in pipeline.steps] == expected_steps
+    assert pipeline.cache_folder.parts[-2:] == ('features', pipeline_name)
+
+
+@pytest.mark.parametrize('steps, expected_error', [
+    ([{'name': 'wrong_step', 'function': 'wrong_function'}], ValueError),
+])
+def test_feature_pipeline_exceptions(steps: List[dict],
+                                     expected_error: ValueError) -> bool:
+    """
+    Test exceptions the class src.data_preparation.feature_pipeline.FeaturePipeline
+
+    Args:
+        steps: List of wrong steps
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        FeaturePipeline(steps)
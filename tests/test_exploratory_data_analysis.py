@@ -0,0 +1,96 @@
+"""
+This test module includes all the tests for the
+module src.exploratory_data_analysis
+"""
+# Import Standard Modules
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.stattools import acf, pacf
+
+# Import Package Modules
+from src.exploratory_data_analysis.autocorrelation import (
+    compute_acf,
+    compute_pacf,
+    propose_lags,
+    select_panel_lags
+)
+
+
+@pytest.mark.parametrize('n_time_steps, n_lags', [
+    (50, 10),
+    (300, 40)
+])
+def test_compute_acf_pacf(n_time_steps: int,
+                          n_lags: int) -> bool:
+    """
+    Test the functions src.exploratory_data_analysis.autocorrelation.compute_acf
+    and src.exploratory_data_analysis.autocorrelation.compute_pacf
+    by comparing the correlations of each series with the Statsmodels ones
+
+    Args:
+        n_time_steps: Integer number of time steps
+        n_lags: Integer maximum lag
+
+    Returns:
+    """
+    # Build a panel of random walks
+    values = np.random.default_rng(0).normal(0, 1, (n_time_steps, 4)).cumsum(axis=0)
+
+    # Compute the correlations of all the series at once
+    acf_values = compute_acf(values, n_lags)
+    pacf_values = compute_pacf(acf_values)
+
+    for series in range(values.shape[1]):
+
+        assert np.allclose(acf_values[:, series], acf(values[:, series], nlags=n_lags, fft=True))
+        assert np.allclose(pacf_values[:, series], pacf(values[:, series], nlags=n_lags, method='ldb'))
+
+
+def test_propose_lags() -> bool:
+    """
+    Test the functions src.exploratory_data_analysis.autocorrelation.propose_lags
+    and src.exploratory_data_analysis.autocorrelation.select_panel_lags
+    by checking the PACF proposes the orders of autoregressive series
+
+    Returns:
+    """
+    # Build autoregressive series of order 2 and a constant series
+    noise = np.random.default_rng(0).normal(0, 1, (500, 3))
+    values = np.zeros((500, 3))
+
+    for t in range(2, 500):
+        values[t] = 0.6 * values[t - 1] - 0.3 * values[t - 2] + noise[t]
+
+    data = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    data['d'] = 1.0
+
+    # Propose the lags
+    proposed_lags = propose_lags(data, n_lags=20, max_lags=2)
+
+    assert proposed_lags.loc[['a', 'b', 'c']].tolist() == [[1, 2]] * 3
+    assert proposed_lags['d'] == []
+    assert select_panel_lags(proposed_lags, min_share=0.5) == [1, 2]
+    assert select_panel_lags(proposed_lags, min_share=1.0) == []
+
+
+@pytest.mark.parametrize('n_lags, method, expected_error', [
+    (0, 'pacf', ValueError),
+    (100, 'pacf', ValueError),
+    (10, 'wrong_method', ValueError)
+])
+def test_propose_lags_exceptions(n_lags: int,
+                                 method: str,
+                                 expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the function src.exploratory_data_analysis.autocorrelation.propose_lags
+
+    Args:
+        n_lags: Integer maximum lag
+        method: String correlation method
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        propose_lags(pd.DataFrame(np.ones((50, 2))), n_lags, method)
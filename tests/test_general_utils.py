@@ -3,14 +3,28 @@ This test module includes all the tests for the
 module src.general_utils.general_utils
 """
 # Import Standard Modules
+import os
+import sys
+import pickle
 import pathlib
+import subprocess
+import pandas as pd
 import pytest
 
 # Import Package Modules
 from src.general_utils.general_utils import (
     read_configuration,
+    load_configuration,
+    clear_configuration_cache,
+    LazyModule,
     build_path_from_list,
-    read_data_from_config
+    read_data_from_config,
+    build_cache_path,
+    filter_data,
+    optimize_memory,
+    compare_memory_usage,
+    read_data_chunks_from_config,
+    reduce_data_from_config
 )
 
 
@@ -141,3 +155,350 @@ def test_read_data_from_config_exceptions(fixture_exception_data_config: dict,
 
     with pytest.raises(expected_error):
         read_data_from_config(fixture_exception_data_config)
+
+
+@pytest.mark.parametrize('expected_rows, expected_dtype', [
+    (4749, 'int16')
+])
+def test_read_data_chunks_from_config(fixture_chunked_data_config: dict,
+                                      expected_rows: int,
+                                      expected_dtype: str) -> bool:
+    """
+    Test the function src.general_utils.general_utils.read_data_chunks_from_config
+    by comparing the streamed chunks with the filtered full read
+
+    Args:
+        fixture_chunked_data_config: Dictionary of data configuration
+        expected_rows: Integer expected number of filtered rows
+        expected_dtype: String expected dtype of the 'store_nbr' column
+
+    Returns:
+    """
+
+    # Stream the chunks
+    chunks = list(read_data_chunks_from_config(fixture_chunked_data_config))
+
+    # Read the whole data
+    data = read_data_from_config(fixture_chunked_data_config)
+
+    assert len(chunks) > 1
+    assert pd.concat(chunks).equals(data)
+    assert len(data) == expected_rows
+    assert data['store_nbr'].dtype == expected_dtype
+
+
+@pytest.mark.parametrize('data_config_name, config_update, expected_error', [
+    ('fixture_exception_chunked_data_config', {}, FileNotFoundError),
+    ('fixture_chunked_data_config', {'csv_engine': 'pyarrow'}, ValueError)
+])
+def test_read_data_chunks_from_config_exceptions(data_config_name: str,
+                                                 config_update: dict,
+                                                 expected_error: Exception,
+                                                 request: pytest.FixtureRequest) -> bool:
+    """
+    Test the exceptions to the function
+    src.general_utils.general_utils.read_data_chunks_from_config
+
+    Args:
+        data_config_name: String name of the data configuration fixture
+        config_update: Dictionary of configuration values overriding the fixture
+        expected_error: Exception instance
+        request: pytest.FixtureRequest required to get the data configuration fixtures
+
+    Returns:
+    """
+    # Retrieve the data configuration
+    data_config = {**request.getfixturevalue(data_config_name), **config_update}
+
+    with pytest.raises(expected_error):
+        read_data_chunks_from_config(data_config)
+
+
+def test_reduce_data_from_config(fixture_chunked_data_config: dict) -> bool:
+    """
+    Test the function src.general_utils.general_utils.reduce_data_from_config
+    by summing the transactions of the streamed chunks
+
+    Args:
+        fixture_chunked_data_config: Dictionary of data configuration
+
+    Returns:
+    """
+
+    # Sum the transactions on the fly
+    total_transactions = reduce_data_from_config(
+        fixture_chunked_data_config,
+        lambda accumulated, chunk: accumulated + chunk['transactions'].astype('float64').sum(),
+        initial=0.0
+    )
+
+    assert total_transactions == pytest.approx(
+        read_data_from_config(fixture_chunked_data_config)['transactions'].astype('float64').sum()
+    )
+
+
+@pytest.mark.parametrize('filters, expected_error', [
+    ([['store_nbr', 'like', 1]], ValueError)
+])
+def test_filter_data_exceptions(fixture_data_config: dict,
+                                filters: list,
+                                expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the function src.general_utils.general_utils.filter_data
+
+    Args:
+        fixture_data_config: Dictionary of data configuration
+        filters: List of wrong filter predicates
+        expected_error: Exception instance
+
+    Returns:
+    """
+
+    with pytest.raises(expected_error):
+        filter_data(read_data_from_config(fixture_data_config), filters)
+
+
+@pytest.mark.parametrize('cache_format', ['parquet', 'feather', 'pickle'])
+def test_read_data_from_config_cache(fixture_cached_data_config: dict,
+                                     cache_format: str,
+                                     monkeypatch: pytest.MonkeyPatch) -> bool:
+    """
+    Test the function src.general_utils.general_utils.read_data_from_config
+    by serving the second read from the columnar cache without parsing the CSV file
+
+    Args:
+        fixture_cached_data_config: Dictionary of data configuration
+        cache_format: String cache format
+        monkeypatch: pytest.MonkeyPatch to prevent parsing the CSV file
+
+    Returns:
+    """
+    # Skip columnar formats without pyarrow
+    if cache_format != 'pickle':
+        pytest.importorskip('pyarrow')
+
+    data_config = {**fixture_cached_data_config, 'cache_format': cache_format}
+
+    # Read and cache data
+    data = read_data_from_config(data_config)
+    cache_path = build_cache_path(build_path_from_list(data_config['data_path']), data_config)
+
+    # Prevent parsing the CSV file again
+    monkeypatch.setattr(pd, 'read_csv', None)
+
+    assert cache_path.exists()
+    assert read_data_from_config(data_config).equals(data)
+
+
+def test_build_cache_path(fixture_cached_data_config: dict) -> bool:
+    """
+    Test the function src.general_utils.general_utils.build_cache_path
+    by checking the cache key changes with the read arguments
+
+    Args:
+        fixture_cached_data_config: Dictionary of data configuration
+
+    Returns:
+    """
+    # Retrieve data path
+    data_path = build_path_from_list(fixture_cached_data_config['data_path'])
+
+    # Build the cache paths with and without date columns
+    cache_path = build_cache_path(data_path, fixture_cached_data_config)
+    cache_path_without_dates = build_cache_path(data_path, {
+        key: value for key, value in fixture_cached_data_config.items() if key != 'date_columns'
+    })
+
+    assert cache_path == build_cache_path(data_path, fixture_cached_data_config)
+    assert cache_path != cache_path_without_dates
+
+
+@pytest.mark.parametrize('column, expected_dtype', [
+    ('store_nbr', 'int8'),
+    ('city', 'category'),
+    ('cluster', 'int8')
+])
+def test_read_data_from_config_optimize_memory(fixture_optimized_data_config: dict,
+                                               column: str,
+                                               expected_dtype: str) -> bool:
+    """
+    Test the function src.general_utils.general_utils.read_data_from_config
+    by checking the optimized dtypes
+
+    Args:
+        fixture_optimized_data_config: Dictionary of data configuration
+        column: String column name
+        expected_dtype: String expected dtype
+
+    Returns:
+    """
+
+    # Read optimized data
+    data = read_data_from_config(fixture_optimized_data_config)
+
+    assert data[column].dtype == expected_dtype
+
+
+@pytest.mark.parametrize('optimize_config', [
+    {'downcast_integers': True, 'string_storage': 'python'}
+])
+def test_compare_memory_usage(fixture_optimized_data_config: dict,
+                              optimize_config: dict) -> bool:
+    """
+    Test the functions src.general_utils.general_utils.optimize_memory and compare_memory_usage
+    by checking the optimized data uses less memory with the same values
+
+    Args:
+        fixture_optimized_data_config: Dictionary of data configuration
+        optimize_config: Dictionary of memory optimization configuration
+
+    Returns:
+    """
+
+    # Read data without optimization
+    data = read_data_from_config({key: value for key, value in fixture_optimized_data_config.items()
+                                  if key != 'optimize_memory'})
+
+    # Optimize data and compare memory
+    optimized_data = optimize_memory(data, optimize_config)
+    memory_report = compare_memory_usage(data, optimized_data)
+
+    assert memory_report.loc['store_nbr', 'dtype_after'] == 'int8'
+    assert memory_report.loc['city', 'dtype_after'] == 'string'
+    assert memory_report.loc['total', 'bytes_after'] < memory_report.loc['total', 'bytes_before']
+    assert data['store_nbr'].dtype == 'int64'
+    assert (optimized_data['store_nbr'] == data['store_nbr']).all()
+
+
+@pytest.mark.parametrize('file_name, environment, keys, expected_value', [
+    ('test_config.yaml', None, ['test_value'], 1),
+    ('store_sales_config.toml', 'eda', ['data_paths', 'stores_data'], 'data/store_sales/stores.csv'),
+    ('store_sales_config.toml', 'eda', ['plot_settings', 'theme_parameters', 'figure_figsize'], (16, 6)),
+])
+def test_load_configuration(file_name: str,
+                            environment: str,
+                            keys: list,
+                            expected_value: object) -> bool:
+    """
+    Test the function src.general_utils.general_utils.load_configuration
+    by reading YAML and TOML entries, checking that repeated calls are served
+    from the cache and that the configuration is read-only and picklable
+
+    Args:
+        file_name: String configuration file name
+        environment: String top-level section of the configuration
+        keys: List of nested configuration keys
+        expected_value: Expected configuration value
+
+    Returns:
+    """
+    # Load the configuration twice
+    configuration = load_configuration(file_name, environment)
+
+    # Retrieve the nested value
+    value = configuration
+    for key in keys:
+        value = value[key]
+
+    assert value == expected_value
+    assert load_configuration(file_name, environment) is configuration
+    assert pickle.loads(pickle.dumps(configuration)) == configuration
+
+    with pytest.raises(TypeError):
+        configuration[keys[0]] = None
+
+
+def test_load_configuration_invalidation(tmp_path: pathlib.Path) -> bool:
+    """
+    Test the function src.general_utils.general_utils.load_configuration
+    by rewriting a configuration file and checking that it is parsed again,
+    while src.general_utils.general_utils.read_configuration returns mutable copies
+
+    Args:
+        tmp_path: pathlib.Path temporary folder
+
+    Returns:
+    """
+    # Write the configuration
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('value: 1\n', encoding='utf-8')
+
+    assert load_configuration(config_file)['value'] == 1
+
+    # Rewrite the configuration with a newer modification time
+    config_file.write_text('value: 2\n', encoding='utf-8')
+    os.utime(config_file, ns=(config_file.stat().st_atime_ns, config_file.stat().st_mtime_ns + 10 ** 9))
+
+    assert load_configuration(config_file)['value'] == 2
+
+    # Mutate a copy returned by read_configuration
+    configuration = read_configuration(config_file)
+    configuration['value'] = 3
+
+    assert load_configuration(config_file)['value'] == 2
+
+    # Clear the cache
+    cached_configuration = load_configuration(config_file)
+    clear_configuration_cache()
+
+    assert load_configuration(config_file) is not cached_configuration
+
+
+@pytest.mark.parametrize('module_name, attribute', [
+    ('json', 'dumps'),
+])
+def test_lazy_module(module_name: str,
+                     attribute: str) -> bool:
+    """
+    Test the class src.general_utils.general_utils.LazyModule
+    by checking that the module is imported only at the first attribute access
+
+    Args:
+        module_name: String name of the module
+        attribute: String attribute of the module
+
+    Returns:
+    """
+    # Initialise the lazy module
+    lazy_module = LazyModule(module_name)
+
+    assert 'imported=False' in repr(lazy_module)
+    assert getattr(lazy_module, attribute) is getattr(sys.modules[module_name], attribute)
+    assert 'imported=True' in repr(lazy_module)
+
+
+@pytest.mark.parametrize('module_name, budget_seconds', [
+    ('src.data_preparation.data_preparation_utils', 0.5),
+    ('src.exploratory_data_analysis.exploratory_data_analysis_utils', 0.5),
+    ('src.model_training.model_training', 0.5),
+    ('src.model_training.multistep_forecasting', 0.5),
+])
+def test_import_time(module_name: str,
+                     budget_seconds: float) -> bool:
+    """
+    Test the import time of the package modules with 'python -X importtime',
+    checking that the heavy dependencies are not imported and that the import time
+    on top of Pandas stays within the budget
+
+    Args:
+        module_name: String name of the package module to import
+        budget_seconds: Float maximum import seconds on top of Pandas
+
+    Returns:
+    """
+    # Import the module in a fresh interpreter
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+                            cwd=pathlib.Path(__file__).parents[1],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+
+    # Retrieve the cumulative import microseconds of each module
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and not line.endswith('package'):
+            _, cumulative, name = line.split('|')
+            import_times[name.strip()] = int(cumulative)
+
+    assert not {'matplotlib', 'seaborn', 'scipy', 'sklearn', 'xgboost'} & set(import_times)
+    assert (import_times[module_name] - import_times['pandas']) / 1e6 < budget_seconds
@@ -3,11 +3,20 @@ This test module includes all the tests for the
 module src.logging_module.logging_module
 """
 # Import Standard Modules
+import logging.config
+import logging.handlers
 import pathlib
 import pytest
 
 # Import Package Modules
-from src.logging_module.logging_module import get_logger
+from src.logging_module.logging_module import (
+    get_logger,
+    configure_logging,
+    stop_queue_logging
+)
+
+# Define the logging configuration path
+LOG_CONFIGURATION_PATH = pathlib.Path(__file__).parents[1] / 'src' / 'logging_module' / 'log_configuration.yaml'
 
 
 @pytest.mark.parametrize('input_logger, input_config_path, expected_name', [
@@ -56,3 +65,69 @@ def test_get_logger_exceptions(input_logger: str,
 
     with pytest.raises(expected_exception):
         get_logger(input_logger, input_config_path)
+
+
+@pytest.mark.parametrize('input_loggers', [
+    (['general_utils', 'BoostedHybridModel', 'general_utils']),
+])
+def test_get_logger_configures_once(input_loggers: list,
+                                    monkeypatch: pytest.MonkeyPatch) -> bool:
+    """
+    Test the function src.logging_module.logging_module.get_logger
+    by checking that the configuration is applied only once and the loggers are cached
+
+    Args:
+        input_loggers: List of logger names
+        monkeypatch: pytest.MonkeyPatch fixture
+
+    Returns:
+    """
+    # Configure the logging
+    configure_logging(LOG_CONFIGURATION_PATH)
+
+    # Count the following configurations
+    configurations = []
+    monkeypatch.setattr(logging.config, 'dictConfig', configurations.append)
+
+    loggers = [get_logger(logger_name, LOG_CONFIGURATION_PATH) for logger_name in input_loggers]
+
+    assert not configurations
+    assert loggers[0] is loggers[-1]
+    assert loggers[0].handlers
+
+
+@pytest.mark.parametrize('input_logger, input_message', [
+    ('general_utils', 'test_configure_logging_queue - Message'),
+])
+def test_configure_logging_queue(input_logger: str,
+                                 input_message: str,
+                                 monkeypatch: pytest.MonkeyPatch) -> bool:
+    """
+    Test the function src.logging_module.logging_module.configure_logging
+    in queue mode, checking that the records reach the original handlers
+
+    Args:
+        input_logger: str logger name
+        input_message: str message to log
+        monkeypatch: pytest.MonkeyPatch fixture
+
+    Returns:
+    """
+    # Record the messages of the original handler
+    logger = get_logger(input_logger, LOG_CONFIGURATION_PATH)
+    original_handlers = list(logger.handlers)
+    messages = []
+    monkeypatch.setattr(original_handlers[0], 'emit', lambda record: messages.append(record.getMessage()))
+
+    # Switch to the queue mode
+    configure_logging(LOG_CONFIGURATION_PATH, use_queue=True)
+
+    assert [type(handler) for handler in logger.handlers] == [logging.handlers.QueueHandler]
+
+    logger.info(input_message)
+
+    # Stop the queue mode
+    stop_queue_logging()
+
+    assert logger.handlers == original_handlers
+    assert messages == [input_message]
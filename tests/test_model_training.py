@@ -0,0 +1,876 @@
+"""
+This test module includes all the tests for the
+module src.model_training.model_training
+"""
+# Import Standard Modules
+import pathlib
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import (
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    mean_squared_error,
+    mean_squared_log_error
+)
+from statsmodels.tsa.api import SARIMAX, ExponentialSmoothing
+from xgboost import XGBRegressor
+
+# Import Package Modules
+from src.data_preparation.trend_features import TrendFeatureBuilder
+from src.model_training.backtesting import BACKTEST_METRICS, RollingOriginBacktest, build_cutoffs
+from src.model_training.exponential_smoothing import PanelExponentialSmoothing, initialise_smoothing_states
+from src.model_training.forecast_metrics import aggregate_metrics, compute_metrics
+from src.model_training.model_training import BoostedHybridModel, GroupedBoostedHybridModel
+from src.model_training.multistep_forecasting import MultiStepForecaster
+from src.model_training.parallel_training import fit_horizon_models
+from src.model_training.statistical_models import StatisticalModelRunner
+
+
+def test_fit(fixture_test_boosted_hybrid_model: BoostedHybridModel,
+             fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                               pd.DataFrame,
+                                                               pd.DataFrame]) -> bool:
+    """
+    Test the function src.model_training.model_training.BoostedHybridModel.fit
+    by comparing the closed-form trend with a LinearRegression fit and checking the
+    factorization is reused when only the target changes
+
+    Args:
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Fit the model and a reference linear model
+    fixture_test_boosted_hybrid_model.fit(trend_features, serial_features, y)
+    linear_model = LinearRegression().fit(trend_features, y)
+
+    # Compute the expected stacked residuals
+    expected_residuals = (y - linear_model.predict(trend_features)).to_numpy().ravel()
+
+    assert np.allclose(fixture_test_boosted_hybrid_model.linear_model.predict(trend_features),
+                       linear_model.predict(trend_features))
+    assert np.allclose(fixture_test_boosted_hybrid_model.residuals, expected_residuals)
+
+    # Refit on a different target
+    factorization = fixture_test_boosted_hybrid_model.trend_factorization
+    fixture_test_boosted_hybrid_model.fit(trend_features, serial_features, y * 2.0)
+
+    assert fixture_test_boosted_hybrid_model.trend_factorization is factorization
+    assert np.allclose(fixture_test_boosted_hybrid_model.residuals, expected_residuals * 2.0)
+
+
+def test_fit_unsorted_columns(fixture_test_boosted_hybrid_model: BoostedHybridModel,
+                              fixture_test_boosted_hybrid_model_unsorted_features: Tuple[pd.DataFrame,
+                                                                                        pd.DataFrame,
+                                                                                        pd.DataFrame]) -> bool:
+    """
+    Test the function src.model_training.model_training.BoostedHybridModel.fit
+    by checking the stacked residuals follow the stacking of 'y' when its series are not sorted by label
+
+    Args:
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_unsorted_features: Tuple of trend features, serial features and
+                                                             target with unsorted series
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_unsorted_features
+
+    # Fit the model and compute the expected residuals by stacking them as the serial features
+    fixture_test_boosted_hybrid_model.fit(trend_features, serial_features, y)
+    linear_model = LinearRegression().fit(trend_features, y)
+    expected_residuals = (y - linear_model.predict(trend_features)).stack()
+
+    assert not y.columns.is_monotonic_increasing
+    assert np.allclose(fixture_test_boosted_hybrid_model.residuals, expected_residuals.to_numpy().ravel())
+
+
+@pytest.mark.parametrize('update_arguments, expected_trees', [
+    ({'n_boosting_rounds': 3}, 8),
+    ({}, 15)
+])
+def test_update(update_arguments: dict,
+                expected_trees: int,
+                fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                                  pd.DataFrame,
+                                                                  pd.DataFrame]) -> bool:
+    """
+    Test the function src.model_training.model_training.BoostedHybridModel.update
+    by comparing the updated trend with a fit on all the time steps and
+    checking the boosting continues from the fitted booster with the added rounds only
+
+    Args:
+        update_arguments: Dictionary of arguments of the update
+        expected_trees: Integer expected number of trees after the update
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Fit the model on the first time steps and update it with the last ones
+    n_series = y.shape[1]
+    model = BoostedHybridModel(LinearRegression(), XGBRegressor(n_estimators=5))
+    model.fit(trend_features.iloc[:40], serial_features.iloc[:40 * n_series], y.iloc[:40])
+    model.update(trend_features.iloc[40:], serial_features.iloc[40 * n_series:], y.iloc[40:], **update_arguments)
+
+    # Fit a reference linear model on all the time steps
+    linear_model = LinearRegression().fit(trend_features, y)
+
+    assert np.allclose(model.linear_model.predict(trend_features),
+                       linear_model.predict(trend_features))
+    assert len(model.non_linear_model.get_booster().get_dump()) == expected_trees
+    assert model.non_linear_model.get_params()['n_estimators'] == 5
+
+
+@pytest.mark.parametrize('features_name', [
+    'fixture_test_boosted_hybrid_model_features',
+    'fixture_test_boosted_hybrid_model_unsorted_features'
+])
+def test_predict(features_name: str,
+                 fixture_test_boosted_hybrid_model: BoostedHybridModel,
+                 request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.model_training.model_training.BoostedHybridModel.predict
+    by comparing it with the predictions of the two models, also with series not sorted by label
+    and serial features stacked with the default 'y.stack()'
+
+    Args:
+        features_name: String name of the fixture of trend features, serial features and target
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        request: pytest.FixtureRequest required to get the features fixtures
+
+    Returns:
+    """
+    trend_features, serial_features, y = request.getfixturevalue(features_name)
+
+    # Fit the model and compute predictions
+    fixture_test_boosted_hybrid_model.fit(trend_features, serial_features, y)
+    predictions = fixture_test_boosted_hybrid_model.predict(trend_features, serial_features)
+
+    # Compute the expected predictions, mapping the stacked residual predictions onto the series with 'y.stack()'
+    residual_predictions = y.stack().assign(
+        Sales=fixture_test_boosted_hybrid_model.non_linear_model.predict(serial_features)
+    ).unstack()[y.columns]
+    expected_predictions = (fixture_test_boosted_hybrid_model.linear_model.predict(trend_features)
+                            + residual_predictions.to_numpy())
+
+    assert predictions.shape == y.shape
+    assert predictions.columns.equals(y.columns)
+    assert np.allclose(predictions, expected_predictions, rtol=1e-5)
+
+
+@pytest.mark.parametrize('features_name', [
+    'fixture_test_boosted_hybrid_model_features',
+    'fixture_test_boosted_hybrid_model_unsorted_features'
+])
+def test_fit_predict(features_name: str,
+                     fixture_test_boosted_hybrid_model: BoostedHybridModel,
+                     request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.model_training.model_training.BoostedHybridModel.fit_predict
+    by comparing it with 'predict' on the same features, also with series not sorted by label
+
+    Args:
+        features_name: String name of the fixture of trend features, serial features and target
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        request: pytest.FixtureRequest required to get the features fixtures
+
+    Returns:
+    """
+    trend_features, serial_features, y = request.getfixturevalue(features_name)
+
+    # Fit and predict the model
+    predictions = fixture_test_boosted_hybrid_model.fit_predict(trend_features, serial_features, y)
+
+    assert np.allclose(predictions,
+                       fixture_test_boosted_hybrid_model.predict(trend_features, serial_features),
+                       rtol=1e-5)
+
+
+def test_trend_feature_builder_boosted_hybrid_model(
+        fixture_test_boosted_hybrid_model: BoostedHybridModel,
+        fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                          pd.DataFrame,
+                                                          pd.DataFrame]) -> bool:
+    """
+    Test the class src.data_preparation.trend_features.TrendFeatureBuilder
+    as 'trend_features' of src.model_training.model_training.BoostedHybridModel
+
+    Args:
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Build the in-sample and the out-of-sample trend features
+    builder = TrendFeatureBuilder(y.index, constant=True, order=2)
+    future_trend_features = builder.out_of_sample(3)
+
+    pd.testing.assert_frame_equal(builder.in_sample(), trend_features)
+
+    # Fit the model and forecast the future trend
+    fixture_test_boosted_hybrid_model.fit(builder.in_sample(), serial_features, y)
+    future_trend = fixture_test_boosted_hybrid_model.linear_model.predict(future_trend_features)
+
+    expected_trend = LinearRegression().fit(trend_features, y).predict(future_trend_features)
+
+    assert future_trend_features.index[0] == y.index[-1] + 1
+    assert np.allclose(future_trend, expected_trend)
+
+
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+def test_save_load(mmap_mode: str,
+                   tmp_path: pathlib.Path,
+                   fixture_test_boosted_hybrid_model: BoostedHybridModel,
+                   fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                                     pd.DataFrame,
+                                                                     pd.DataFrame]) -> bool:
+    """
+    Test the functions src.model_training.model_training.BoostedHybridModel.save and load
+    by comparing the predictions of the saved and loaded models
+
+    Args:
+        mmap_mode: String memory-map mode of the coefficients
+        tmp_path: pathlib.Path temporary folder
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Fit and save the model
+    fixture_test_boosted_hybrid_model.fit(trend_features, serial_features, y)
+    fixture_test_boosted_hybrid_model.save(tmp_path / 'model')
+
+    # Load the model
+    model = BoostedHybridModel.load(tmp_path / 'model', mmap_mode=mmap_mode)
+
+    assert model.y_column_names.equals(y.columns)
+    assert model.trend_statistics is not None
+    assert np.allclose(model.predict(trend_features, serial_features),
+                       fixture_test_boosted_hybrid_model.predict(trend_features, serial_features))
+
+
+@pytest.mark.parametrize('folder, expected_error', [
+    (pathlib.Path(__file__).parents[1] / 'wrong_model', FileNotFoundError)
+])
+def test_load_exceptions(folder: pathlib.Path,
+                         expected_error: FileNotFoundError) -> bool:
+    """
+    Test the exceptions to the function src.model_training.model_training.BoostedHybridModel.load
+
+    Args:
+        folder: pathlib.Path wrong model folder
+        expected_error: Exception instance
+
+    Returns:
+    """
+
+    with pytest.raises(expected_error):
+        BoostedHybridModel.load(folder)
+
+
+@pytest.mark.parametrize('n_jobs, features_name', [
+    (None, 'fixture_test_boosted_hybrid_model_features'),
+    (2, 'fixture_test_boosted_hybrid_model_features'),
+    (None, 'fixture_test_boosted_hybrid_model_unsorted_features')
+])
+def test_grouped_boosted_hybrid_model_predict(n_jobs: int,
+                                              features_name: str,
+                                              request: pytest.FixtureRequest) -> bool:
+    """
+    Test the function src.model_training.model_training.GroupedBoostedHybridModel.predict
+    by comparing the predictions of a group with a BoostedHybridModel fitted on its series only,
+    also with group labels not sorted in the MultiIndex columns and serial features stacked with 'y.stack()'
+
+    Args:
+        n_jobs: Integer number of worker processes
+        features_name: String name of the fixture of trend features, serial features and target
+        request: pytest.FixtureRequest required to get the features fixtures
+
+    Returns:
+    """
+    trend_features, serial_features, y = request.getfixturevalue(features_name)
+
+    # Fit one model per industry and predict
+    model = GroupedBoostedHybridModel(LinearRegression(), XGBRegressor(), groups='Industries', n_jobs=n_jobs)
+    predictions = model.fit(trend_features, serial_features, y).predict(trend_features, serial_features)
+
+    # Fit a model on the industry of the second column only, selecting its stacked rows by label
+    series = y.columns[1]
+    series_rows = y.stack().index.get_level_values('Industries') == series[1]
+    single_model = BoostedHybridModel(LinearRegression(), XGBRegressor())
+    single_model.fit(trend_features, serial_features[series_rows], y[[series]])
+
+    assert predictions.columns.equals(y.columns)
+    assert len(model.models) == 2
+    assert model.get_model(series).y_column_names.equals(pd.Index([series]))
+    assert np.allclose(predictions[series],
+                       single_model.predict(trend_features, serial_features[series_rows])[series],
+                       rtol=1e-5)
+
+
+def test_grouped_boosted_hybrid_model_save_load(
+        tmp_path: pathlib.Path,
+        fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                          pd.DataFrame,
+                                                          pd.DataFrame]) -> bool:
+    """
+    Test the functions src.model_training.model_training.GroupedBoostedHybridModel.save and load
+    by comparing the predictions of the saved and loaded models
+
+    Args:
+        tmp_path: pathlib.Path temporary folder
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Fit and save the model
+    model = GroupedBoostedHybridModel(LinearRegression(), XGBRegressor(), groups='Industries')
+    model.fit(trend_features, serial_features, y).save(tmp_path / 'grouped_model')
+
+    # Load the model
+    loaded_model = GroupedBoostedHybridModel.load(tmp_path / 'grouped_model', mmap_mode='r')
+
+    assert list(loaded_model.models.keys()) == list(model.models.keys())
+    assert np.allclose(loaded_model.predict(trend_features, serial_features),
+                       model.predict(trend_features, serial_features))
+
+
+@pytest.mark.parametrize('strategy', ['recursive', 'direct', 'dirrec', 'multi_output'])
+def test_multi_step_forecaster_forecast(strategy: str) -> bool:
+    """
+    Test the function src.model_training.multistep_forecasting.MultiStepForecaster.forecast
+    by extrapolating linear series, which are exactly predicted by a linear model on two lags
+
+    Args:
+        strategy: String multi-step strategy
+
+    Returns:
+    """
+    # Define linear series with different slopes
+    time_step = np.arange(40, dtype=np.float64)
+    y = pd.DataFrame({'first': 3.0 + 2.0 * time_step,
+                      'second': 10.0 - 0.5 * time_step})
+
+    # Fit the forecaster and forecast
+    forecaster = MultiStepForecaster(LinearRegression(), lags=[1, 2], horizon=5,
+                                     strategy=strategy, add_series_code=False)
+    forecasts = forecaster.fit(y).forecast(y)
+
+    # Compute the expected forecasts
+    future_time_step = np.arange(40, 45, dtype=np.float64)
+    expected_forecasts = np.column_stack([3.0 + 2.0 * future_time_step,
+                                          10.0 - 0.5 * future_time_step])
+
+    assert forecasts.shape == (5, 2)
+    assert np.allclose(forecasts.to_numpy(), expected_forecasts)
+
+
+@pytest.mark.parametrize('strategy', ['recursive', 'direct', 'dirrec'])
+def test_multi_step_forecaster_boosted_hybrid_model(
+        strategy: str,
+        fixture_test_boosted_hybrid_model: BoostedHybridModel,
+        fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                          pd.DataFrame,
+                                                          pd.DataFrame]) -> bool:
+    """
+    Test the function src.model_training.multistep_forecasting.MultiStepForecaster.forecast
+    wrapping a BoostedHybridModel
+
+    Args:
+        strategy: String multi-step strategy
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, _, y = fixture_test_boosted_hybrid_model_features
+
+    # Split history and horizon
+    horizon = 4
+    y_train, trend_train, trend_future = y.iloc[:-horizon], trend_features.iloc[:-horizon], trend_features.iloc[-horizon:]
+
+    # Fit the forecaster and forecast
+    forecaster = MultiStepForecaster(fixture_test_boosted_hybrid_model, lags=[1, 2, 3],
+                                     horizon=horizon, strategy=strategy)
+    forecasts = forecaster.fit(y_train, trend_train).forecast(y_train, trend_future)
+
+    assert forecasts.shape == (horizon, y.shape[1])
+    assert forecasts.index.equals(trend_future.index)
+    assert np.isfinite(forecasts.to_numpy()).all()
+
+
+@pytest.mark.parametrize('estimator, strategy, expected_error', [
+    (LinearRegression(), 'wrong_strategy', ValueError),
+    (BoostedHybridModel(LinearRegression(), XGBRegressor()), 'multi_output', ValueError)
+])
+def test_multi_step_forecaster_exceptions(estimator: LinearRegression,
+                                          strategy: str,
+                                          expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the class src.model_training.multistep_forecasting.MultiStepForecaster
+
+    Args:
+        estimator: Estimator to wrap
+        strategy: String multi-step strategy
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+
+    with pytest.raises(expected_error):
+        MultiStepForecaster(estimator, lags=[1], horizon=2, strategy=strategy)
+
+
+@pytest.mark.parametrize('n_jobs', [None, 2])
+def test_fit_horizon_models(n_jobs: int) -> bool:
+    """
+    Test the function src.model_training.parallel_training.fit_horizon_models
+    by fitting one linear model per step on exactly linear targets
+
+    Args:
+        n_jobs: Integer number of worker processes
+
+    Returns:
+    """
+    # Define features and one target per step, with missing values at the end
+    features = np.arange(60, dtype=np.float64).reshape(30, 2)
+    targets = np.column_stack([features @ [1.0, step] for step in range(1, 4)])
+    targets[-2:, 2] = np.nan
+
+    # Fit the models
+    models, timing_report = fit_horizon_models(LinearRegression(), features, targets, n_jobs=n_jobs)
+
+    assert len(models) == 3
+    assert timing_report['step'].tolist() == [1, 2, 3]
+    assert np.allclose(models[2].predict(features[:-2]), targets[:-2, 2])
+
+
+def test_multi_step_forecaster_n_jobs() -> bool:
+    """
+    Test the function src.model_training.multistep_forecasting.MultiStepForecaster.fit
+    by comparing the forecasts of the direct strategy fitted sequentially and in parallel
+
+    Returns:
+    """
+    # Define random walks
+    y = pd.DataFrame(np.random.default_rng(42).normal(size=(50, 3)).cumsum(axis=0))
+
+    # Fit the forecasters sequentially and in parallel
+    forecasts = [
+        MultiStepForecaster(XGBRegressor(n_estimators=10), lags=[1, 2], horizon=3,
+                            strategy='direct', n_jobs=n_jobs).fit(y).forecast(y)
+        for n_jobs in [None, 2]
+    ]
+
+    assert np.allclose(forecasts[0], forecasts[1])
+
+
+@pytest.mark.parametrize('window, train_size, n_jobs', [
+    ('expanding', None, None),
+    ('rolling', 20, 2)
+])
+def test_rolling_origin_backtest(window: str,
+                                 train_size: int,
+                                 n_jobs: int,
+                                 fixture_test_boosted_hybrid_model: BoostedHybridModel,
+                                 fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                                                   pd.DataFrame,
+                                                                                   pd.DataFrame]) -> bool:
+    """
+    Test the function src.model_training.backtesting.RollingOriginBacktest.run
+    by comparing the last fold with a BoostedHybridModel fitted on the same training window
+
+    Args:
+        window: String training window
+        train_size: Integer number of training time steps of the rolling window
+        n_jobs: Integer number of worker processes
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    trend_features, serial_features, y = fixture_test_boosted_hybrid_model_features
+
+    # Run the backtest
+    horizon = 6
+    cutoffs = build_cutoffs(len(y), horizon, n_folds=3)
+    result = RollingOriginBacktest(fixture_test_boosted_hybrid_model, horizon, cutoffs,
+                                   window=window, train_size=train_size, n_jobs=n_jobs).run(trend_features,
+                                                                                            serial_features,
+                                                                                            y)
+
+    # Fit the last fold directly
+    start = 0 if train_size is None else cutoffs[-1] - train_size
+    n_series = y.shape[1]
+    model = BoostedHybridModel(LinearRegression(), XGBRegressor())
+    model.fit(trend_features.iloc[start:cutoffs[-1]],
+              serial_features.iloc[start * n_series:cutoffs[-1] * n_series],
+              y.iloc[start:cutoffs[-1]])
+    predictions = model.predict(trend_features.iloc[cutoffs[-1]:],
+                                serial_features.iloc[cutoffs[-1] * n_series:])
+
+    assert cutoffs.tolist() == [len(y) - 18, len(y) - 12, len(y) - 6]
+    assert result.metrics.shape == (3, len(BACKTEST_METRICS), n_series)
+    assert result.cutoffs.equals(y.index[cutoffs])
+    assert result.timing_report['fold'].tolist() == [0, 1, 2]
+    assert np.allclose(result.predictions[-1], predictions, rtol=1e-5)
+    assert np.allclose(result.to_frame().loc[result.cutoffs[-1], 'rmse'],
+                       np.sqrt(((predictions - y.iloc[cutoffs[-1]:].to_numpy()) ** 2).mean()),
+                       rtol=1e-5)
+    assert result.summary('cutoff').shape == (3, len(BACKTEST_METRICS))
+
+
+@pytest.mark.parametrize('window, train_size, cutoffs, expected_error', [
+    ('wrong_window', None, [10], ValueError),
+    ('rolling', None, [10], ValueError),
+    ('expanding', None, [0], ValueError),
+    ('expanding', None, [100_000], ValueError)
+])
+def test_rolling_origin_backtest_exceptions(
+        window: str,
+        train_size: int,
+        cutoffs: List[int],
+        expected_error: ValueError,
+        fixture_test_boosted_hybrid_model: BoostedHybridModel,
+        fixture_test_boosted_hybrid_model_features: Tuple[pd.DataFrame,
+                                                          pd.DataFrame,
+                                                          pd.DataFrame]) -> bool:
+    """
+    Test the exceptions to the class src.model_training.backtesting.RollingOriginBacktest
+
+    Args:
+        window: String training window
+        train_size: Integer number of training time steps of the rolling window
+        cutoffs: List of wrong cutoffs
+        expected_error: ValueError expected error
+        fixture_test_boosted_hybrid_model: BoostedHybridModel object instance
+        fixture_test_boosted_hybrid_model_features: Tuple of trend features, serial features and target
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        RollingOriginBacktest(fixture_test_boosted_hybrid_model, 6, cutoffs,
+                              window=window, train_size=train_size).run(*fixture_test_boosted_hybrid_model_features)
+
+
+def test_compute_metrics() -> bool:
+    """
+    Test the function src.model_training.forecast_metrics.compute_metrics
+    by comparing the metrics of each series with the scikit-learn ones, skipping the missing values
+
+    Returns:
+    """
+    # Build a panel with missing values
+    rng = np.random.default_rng(0)
+    y_train = rng.uniform(1, 10, (30, 4))
+    y_true = rng.uniform(1, 10, (8, 4))
+    y_pred = y_true + rng.normal(0, 1, (8, 4))
+    y_true[2, 1] = np.nan
+    y_pred[5, 3] = np.nan
+
+    # Compute the metrics
+    metrics = ['mae', 'rmse', 'rmsle', 'mape', 'smape', 'mase', 'bias']
+    metric_values = compute_metrics(y_true, y_pred, metrics, y_train, seasonality=7)
+
+    for series in range(4):
+
+        available = ~np.isnan(y_true[:, series]) & ~np.isnan(y_pred[:, series])
+        series_true, series_pred = y_true[available, series], y_pred[available, series]
+        expected_values = [
+            mean_absolute_error(series_true, series_pred),
+            np.sqrt(mean_squared_error(series_true, series_pred)),
+            np.sqrt(mean_squared_log_error(series_true, series_pred)),
+            mean_absolute_percentage_error(series_true, series_pred),
+            np.mean(2 * np.abs(series_pred - series_true) / (np.abs(series_true) + np.abs(series_pred))),
+            mean_absolute_error(series_true, series_pred) / np.mean(np.abs(y_train[7:, series] - y_train[:-7, series])),
+            np.mean(series_pred - series_true)
+        ]
+
+        assert np.allclose(metric_values[:, series], expected_values)
+
+
+@pytest.mark.parametrize('y_pred_shape, metrics, y_train, expected_error', [
+    ((8, 4), ['wrong_metric'], None, ValueError),
+    ((8, 4), ['mase'], None, ValueError),
+    ((8, 3), ['mae'], None, ValueError)
+])
+def test_compute_metrics_exceptions(y_pred_shape: Tuple[int, int],
+                                    metrics: List[str],
+                                    y_train: np.ndarray,
+                                    expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the function src.model_training.forecast_metrics.compute_metrics
+
+    Args:
+        y_pred_shape: Tuple shape of the predictions
+        metrics: List of string metrics
+        y_train: NumPy array of training targets
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        compute_metrics(np.ones((8, 4)), np.ones(y_pred_shape), metrics, y_train)
+
+
+@pytest.mark.parametrize('groups, weights, expected_metrics', [
+    (None, None, pd.DataFrame({'mae': [2.0], 'rmse': [2.5]}, index=['total'])),
+    (['a', 'a', 'b'], None, pd.DataFrame({'mae': [1.5, 3.0], 'rmse': [2.0, 3.0]}, index=['a', 'b'])),
+    (['a', 'a', 'b'], [3.0, 1.0, 1.0], pd.DataFrame({'mae': [1.25, 3.0], 'rmse': [2.0, 3.0]}, index=['a', 'b']))
+])
+def test_aggregate_metrics(groups: List[str],
+                           weights: List[float],
+                           expected_metrics: pd.DataFrame) -> bool:
+    """
+    Test the function src.model_training.forecast_metrics.aggregate_metrics
+    by checking the weighted means of the groups skip the missing metrics
+
+    Args:
+        groups: List of string groups of the series
+        weights: List of float weights of the series
+        expected_metrics: Pandas DataFrame of expected aggregated metrics
+
+    Returns:
+    """
+    # Aggregate the metrics of 3 series
+    aggregated_metrics = aggregate_metrics(np.array([[1.0, 2.0, 3.0], [np.nan, 2.0, 3.0]]), ['mae', 'rmse'], groups, weights)
+
+    pd.testing.assert_frame_equal(aggregated_metrics, expected_metrics, check_index_type=False)
+
+
+@pytest.mark.parametrize('model, parameters, n_jobs', [
+    ('sarimax', {'order': (1, 0, 0)}, None),
+    ('sarimax', {'order': (1, 0, 0)}, 2),
+    ('exponential_smoothing', {'trend': 'add'}, None)
+])
+def test_statistical_model_runner(model: str,
+                                  parameters: dict,
+                                  n_jobs: int) -> bool:
+    """
+    Test the function src.model_training.statistical_models.StatisticalModelRunner.run
+    by comparing the forecasts of each series with a direct Statsmodels fit
+    and checking the series without values are reported as failed
+
+    Args:
+        model: String statistical model
+        parameters: Dictionary of parameters of the model
+        n_jobs: Integer number of worker processes
+
+    Returns:
+    """
+    # Build a daily panel with a late series and an empty one
+    rng = np.random.default_rng(0)
+    y = pd.DataFrame(10 + rng.normal(0, 1, (60, 4)).cumsum(axis=0),
+                     index=pd.date_range('2017-01-01', periods=60, freq='D'),
+                     columns=['a', 'b', 'c', 'd'])
+    y.iloc[:20, 1] = np.nan
+    y['d'] = np.nan
+
+    # Fit the series
+    result = StatisticalModelRunner(model, parameters, horizon=5, n_jobs=n_jobs).run(y)
+
+    # Fit the late series directly
+    model_class = SARIMAX if model == 'sarimax' else ExponentialSmoothing
+    fitted_model = model_class(y['b'].to_numpy()[20:], **parameters)
+    expected_forecast = (fitted_model.fit(disp=False) if model == 'sarimax' else fitted_model.fit()).forecast(5)
+
+    assert result.status.tolist() == ['fitted', 'fitted', 'fitted', 'failed']
+    assert result.to_frame().index.equals(pd.date_range('2017-03-02', periods=5, freq='D'))
+    assert np.allclose(result.forecasts[:, 1], expected_forecast)
+    assert np.isnan(result.forecasts[:, 3]).all()
+    assert result.to_frame('params').shape == (4, len(result.param_names))
+    assert result.timing_report['series'].tolist() == ['a', 'b', 'c', 'd']
+
+
+def test_statistical_model_runner_timeout() -> bool:
+    """
+    Test the function src.model_training.statistical_models.StatisticalModelRunner.run
+    by checking the series exceeding the timeout are reported without forecasts
+
+    Returns:
+    """
+    # Fit the series with a timeout shorter than any fit
+    y = pd.DataFrame(np.random.default_rng(0).normal(0, 1, (200, 2)))
+    result = StatisticalModelRunner('sarimax', {'order': (2, 1, 2), 'seasonal_order': (1, 0, 1, 7)},
+                                    horizon=3, timeout=1e-3).run(y)
+
+    assert result.status.tolist() == ['timeout', 'timeout']
+    assert np.isnan(result.forecasts).all()
+    assert result.params.shape == (2, 0)
+
+
+@pytest.mark.parametrize('model, horizon, expected_error', [
+    ('wrong_model', 5, ValueError),
+    ('sarimax', 0, ValueError)
+])
+def test_statistical_model_runner_exceptions(model: str,
+                                             horizon: int,
+                                             expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the class src.model_training.statistical_models.StatisticalModelRunner
+
+    Args:
+        model: String statistical model
+        horizon: Integer number of forecast time steps
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        StatisticalModelRunner(model, horizon=horizon)
+
+
+@pytest.mark.parametrize('model, seasonal_periods, components', [
+    ('simple', None, {}),
+    ('holt', None, {'trend': 'add'}),
+    ('holt_winters', 7, {'trend': 'add', 'seasonal': 'add', 'seasonal_periods': 7})
+])
+def test_panel_exponential_smoothing(model: str,
+                                     seasonal_periods: int,
+                                     components: dict) -> bool:
+    """
+    Test the function src.model_training.exponential_smoothing.PanelExponentialSmoothing.fit
+    by comparing the one-step predictions and the forecasts of each series with the Statsmodels
+    ExponentialSmoothing with the same initial states and smoothing parameters
+
+    Args:
+        model: String smoothing model
+        seasonal_periods: Integer number of time steps of a season
+        components: Dictionary of the Statsmodels trend and seasonal components
+
+    Returns:
+    """
+    # Build a daily panel with weekly seasonality
+    rng = np.random.default_rng(0)
+    y = pd.DataFrame(10 + 3 * np.sin(np.arange(100) * 2 * np.pi / 7)[:, None] +
+                     rng.normal(0, 1, (100, 3)).cumsum(axis=0) * 0.3,
+                     index=pd.date_range('2017-01-01', periods=100, freq='D'))
+
+    # Fit the panel
+    panel_model = PanelExponentialSmoothing(model, seasonal_periods).fit(y)
+    forecasts = panel_model.forecast(10)
+    states = initialise_smoothing_states(y.to_numpy(), model, seasonal_periods)
+
+    for series in y.columns:
+
+        # Fit the series with the selected parameters and the same initial states
+        params = panel_model.params.loc[series]
+        initial_states = {'initial_level': states[0][series],
+                          'initial_trend': states[1][series] if model != 'simple' else None,
+                          'initial_seasonal': states[2][:, series] if model == 'holt_winters' else None}
+        fitted_model = ExponentialSmoothing(y[series].to_numpy(),
+                                            initialization_method='known',
+                                            **{name: value for name, value in initial_states.items() if value is not None},
+                                            **components).fit(smoothing_level=params['alpha'],
+                                                              smoothing_trend=params['beta'] if model != 'simple' else None,
+                                                              smoothing_seasonal=params['gamma'] if model == 'holt_winters' else None,
+                                                              optimized=False)
+
+        # Forecast from the final states
+        steps = np.arange(1, 11)
+        expected_forecasts = fitted_model.level[-1] + steps * (fitted_model.trend[-1] if model != 'simple' else 0) + \
+            (fitted_model.season[-7 + (steps - 1) % 7] if model == 'holt_winters' else 0)
+
+        assert np.allclose(panel_model.fittedvalues[series], fitted_model.fittedvalues)
+        assert np.isclose(params['sse'], fitted_model.sse)
+        assert np.allclose(forecasts[series], expected_forecasts)
+
+    assert forecasts.index.equals(pd.date_range('2017-04-11', periods=10, freq='D'))
+
+
+def test_panel_exponential_smoothing_grid() -> bool:
+    """
+    Test the function src.model_training.exponential_smoothing.PanelExponentialSmoothing.fit
+    by checking each series selects the grid combination with the lowest sum of squared errors
+    and the missing values carry the states forward
+
+    Returns:
+    """
+    # Build a smooth and a noisy series with a missing value
+    rng = np.random.default_rng(0)
+    y = pd.DataFrame({'smooth': np.linspace(0, 10, 60) + rng.normal(0, 0.01, 60),
+                      'noisy': 5 + rng.normal(0, 1, 60)})
+    y.iloc[30, 1] = np.nan
+
+    # Fit the grid and each combination separately
+    grids = {'alpha': [0.1, 0.9], 'beta': [0.1, 0.5]}
+    panel_model = PanelExponentialSmoothing('holt', grids=grids).fit(y)
+    sse = {(alpha, beta): PanelExponentialSmoothing('holt', grids={'alpha': [alpha], 'beta': [beta]}).fit(y).params['sse']
+           for alpha in grids['alpha'] for beta in grids['beta']}
+    sse = pd.DataFrame(sse)
+
+    assert np.allclose(panel_model.params['sse'], sse.min(axis=1))
+    assert np.isfinite(panel_model.fittedvalues.to_numpy()).all()
+
+
+@pytest.mark.parametrize('model, seasonal_periods', [
+    ('simple', None),
+    ('holt', None),
+    ('holt_winters', 7)
+])
+def test_panel_exponential_smoothing_leading_missing(model: str,
+                                                     seasonal_periods: int) -> bool:
+    """
+    Test the function src.model_training.exponential_smoothing.PanelExponentialSmoothing.fit
+    by checking a series with leading missing values is fitted as the same series trimmed
+
+    Args:
+        model: String smoothing model
+        seasonal_periods: Integer number of time steps of a season
+
+    Returns:
+    """
+    # Build a daily panel with weekly seasonality, starting one series later
+    rng = np.random.default_rng(0)
+    y = pd.DataFrame(10 + 3 * np.sin(np.arange(80) * 2 * np.pi / 7)[:, None] +
+                     np.arange(80)[:, None] * 0.1 + rng.normal(0, 0.5, (80, 2)),
+                     index=pd.date_range('2017-01-01', periods=80, freq='D'))
+    y.iloc[:10, 1] = np.nan
+
+    # Fit the panel and the trimmed series
+    panel_model = PanelExponentialSmoothing(model, seasonal_periods).fit(y)
+    trimmed_model = PanelExponentialSmoothing(model, seasonal_periods).fit(y.iloc[10:, [1]])
+
+    assert np.isfinite(panel_model.fittedvalues.to_numpy()).all()
+    pd.testing.assert_frame_equal(panel_model.params.iloc[[1]], trimmed_model.params)
+    pd.testing.assert_frame_equal(panel_model.fittedvalues.iloc[10:, [1]], trimmed_model.fittedvalues)
+    pd.testing.assert_frame_equal(panel_model.forecast(10)[[1]], trimmed_model.forecast(10))
+
+
+@pytest.mark.parametrize('model, seasonal_periods, grids, expected_error', [
+    ('wrong_model', None, None, ValueError),
+    ('holt_winters', None, None, ValueError),
+    ('holt', None, {'alpha': [1.5]}, ValueError),
+    ('holt', None, {'beta': []}, ValueError)
+])
+def test_panel_exponential_smoothing_exceptions(model: str,
+                                                seasonal_periods: int,
+                                                grids: dict,
+                                                expected_error: ValueError) -> bool:
+    """
+    Test the exceptions to the class src.model_training.exponential_smoothing.PanelExponentialSmoothing
+
+    Args:
+        model: String smoothing model
+        seasonal_periods: Integer number of time steps of a season
+        grids: Dictionary of wrong grids
+        expected_error: ValueError expected error
+
+    Returns:
+    """
+    with pytest.raises(expected_error):
+        PanelExponentialSmoothing(model, seasonal_periods, grids)